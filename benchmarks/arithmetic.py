@@ -0,0 +1,121 @@
+import argparse
+from dataclasses import dataclass
+from decimal import Decimal
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.minor import MinorCatalogue
+from src.pricer.declarative import BuyOneGetOneFree, MultiBuy, PercentageOff
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+CENT = Decimal("0.01")
+
+
+@dataclass
+class Throughput:
+    mode: str
+    baskets: int
+    seconds: float
+    total: str
+
+    @property
+    def rate(self) -> float:
+        return self.baskets / self.seconds if self.seconds else float("inf")
+
+
+def _offers(price: Callable[[int], Any]) -> List[Offer]:
+    return [
+        BuyOneGetOneFree("product-0"),
+        PercentageOff("product-1", 10),
+        MultiBuy("product-2", 3, price(250)),
+    ]
+
+
+def _modes(minor: Dict[str, int]) -> Dict[str, Callable[[Basket], Any]]:
+    # Each mode prices the same basket and rounds its total to whole pence.
+    floats = Catalogue({name: price / 100 for name, price in minor.items()})
+    float_offers = _offers(lambda price: price / 100)
+
+    decimals = Catalogue(
+        {name: Decimal(price).scaleb(-2) for name, price in minor.items()},
+        trusted=True,
+    )
+    decimal_offers = _offers(lambda price: Decimal(price).scaleb(-2))
+
+    integers = MinorCatalogue(minor)
+    integer_offers = _offers(lambda price: price)
+
+    return {
+        "float": lambda basket: round(Pricer(basket, floats, float_offers).total, 2),
+        "decimal": lambda basket: (
+            Pricer(basket, decimals, decimal_offers).total.quantize(CENT)
+        ),
+        "minor": lambda basket: Pricer(basket, integers, integer_offers).total,
+    }
+
+
+def measure(
+    baskets: int = 1000, products: int = 20, quantity: int = 7
+) -> List[Throughput]:
+    """
+    Measure how many baskets per second each price representation can total.
+
+    Args:
+        baskets (int, optional): Number of baskets priced by each mode.
+        Defaults to 1000.
+        products (int, optional): Distinct products in each basket. Defaults to 20.
+        quantity (int, optional): Quantity of each product. Defaults to 7.
+
+    Returns:
+        List[Throughput]: One measurement per mode.
+    """
+    minor = {f"product-{i}": 100 + 40 * i for i in range(max(products, 3))}
+    contents = {name: quantity for name in list(minor)[:products]}
+    throughputs = []
+
+    for mode, price in _modes(minor).items():
+        total: Any = 0
+        start = perf_counter()
+
+        for _ in range(baskets):
+            total += price(Basket(dict(contents)))
+
+        throughputs.append(
+            Throughput(mode, baskets, perf_counter() - start, str(total))
+        )
+
+    return throughputs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Compare the pricing throughput of floats, decimals and integer minor units.
+
+    Args:
+        argv (Optional[List[str]], optional): Command line arguments.
+        Defaults to None which reads them from sys.argv.
+
+    Returns:
+        int: Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark float, decimal and integer minor unit pricing."
+    )
+    parser.add_argument("--baskets", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=20)
+    parser.add_argument("--quantity", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    for throughput in measure(args.baskets, args.products, args.quantity):
+        print(
+            f"{throughput.mode:<10} {throughput.rate:>12.0f} baskets/s "
+            f"total={throughput.total}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,252 @@
+import argparse
+import json
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import product
+from os.path import exists
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.stubs import PriceStub
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class Case:
+    products: int
+    quantity: int
+    catalogue: int
+    offers: int
+
+    @property
+    def name(self) -> str:
+        return (
+            f"products={self.products} quantity={self.quantity} "
+            f"catalogue={self.catalogue} offers={self.offers}"
+        )
+
+
+@dataclass
+class Measurement:
+    case: str
+    operation: str
+    seconds: float
+    peak: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.case} {self.operation}"
+
+
+def half_price(name: str, stubs_list: List[PriceStub]) -> List[PriceStub]:
+    return [
+        PriceStub(i.name, i.price / 2 if i.name == name else i.price)
+        for i in stubs_list
+    ]
+
+
+def cases(
+    products: Sequence[int],
+    quantities: Sequence[int],
+    catalogues: Sequence[int],
+    offers: Sequence[int],
+) -> List[Case]:
+    """
+    Sweep every combination of basket, catalogue and offer sizes.
+
+    Catalogues smaller than the number of distinct products are skipped.
+
+    Args:
+        products (Sequence[int]): Distinct products in the basket.
+        quantities (Sequence[int]): Quantity of each product in the basket.
+        catalogues (Sequence[int]): Products in the catalogue.
+        offers (Sequence[int]): Number of offers.
+
+    Returns:
+        List[Case]: Benchmark cases.
+    """
+    return [
+        Case(*sizes)
+        for sizes in product(products, quantities, catalogues, offers)
+        if sizes[2] >= sizes[0]
+    ]
+
+
+def measure(case: Case, repeat: int = 3) -> List[Measurement]:
+    """
+    Measure the time and peak memory of constructing and pricing a basket.
+
+    Every operation runs against a newly constructed pricer so that cached
+    results are not measured. The fastest time over the repeats is kept.
+
+    Args:
+        case (Case): Benchmark case.
+        repeat (int, optional): Number of repeats. Defaults to 3.
+
+    Returns:
+        List[Measurement]: One measurement per operation.
+    """
+    products = {f"product-{i}": 1.0 + i % 10 for i in range(case.catalogue)}
+    contents = {f"product-{i}": case.quantity for i in range(case.products)}
+    offers = [
+        Offer(f"Half price {name}", partial(half_price, name), frozenset({name}))
+        for name in list(products)[: case.offers]
+    ]
+
+    def construct() -> Pricer:
+        return Pricer(Basket(dict(contents)), Catalogue(dict(products)), offers)
+
+    operations: Dict[str, Callable[[Pricer], object]] = {
+        "construct": lambda _: construct(),
+        "sub_total": lambda pricer: pricer.sub_total,
+        "total": lambda pricer: pricer.total,
+        "discount": lambda pricer: pricer.discount,
+    }
+
+    measurements = []
+
+    for operation, run in operations.items():
+        seconds = []
+
+        for _ in range(repeat):
+            pricer = construct()
+            start = perf_counter()
+            run(pricer)
+            seconds.append(perf_counter() - start)
+
+        pricer = construct()
+        tracemalloc.start()
+
+        try:
+            run(pricer)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        measurements.append(Measurement(case.name, operation, min(seconds), peak))
+
+    return measurements
+
+
+def compare(
+    measurements: List[Measurement],
+    baseline: List[Measurement],
+    threshold: float,
+    floor: float = 0.0001,
+) -> List[str]:
+    """
+    Find the measurements that regressed from a baseline.
+
+    Args:
+        measurements (List[Measurement]): Current measurements.
+        baseline (List[Measurement]): Baseline measurements.
+        threshold (float): Fractional increase in time or peak memory allowed.
+        floor (float, optional): Seconds below which times are too noisy to
+        compare. Defaults to 0.0001.
+
+    Returns:
+        List[str]: Descriptions of the regressions.
+    """
+    previous = {measurement.key: measurement for measurement in baseline}
+    regressions = []
+
+    for measurement in measurements:
+        if measurement.key not in previous:
+            continue
+
+        before = previous[measurement.key]
+
+        if measurement.seconds > max(before.seconds, floor) * (1 + threshold):
+            regressions.append(
+                f"{measurement.key}: "
+                f"{before.seconds:.6f}s -> {measurement.seconds:.6f}s"
+            )
+
+        if measurement.peak > before.peak * (1 + threshold):
+            regressions.append(
+                f"{measurement.key}: {before.peak}B -> {measurement.peak}B"
+            )
+
+    return regressions
+
+
+def load(path: str) -> List[Measurement]:
+    """
+    Load measurements from a json baseline.
+
+    Args:
+        path (str): Baseline path.
+
+    Returns:
+        List[Measurement]: Measurements.
+    """
+    with open(path, encoding="utf-8") as stream:
+        return [Measurement(**measurement) for measurement in json.load(stream)]
+
+
+def save(measurements: List[Measurement], path: str) -> None:
+    """
+    Save measurements as a json baseline.
+
+    Args:
+        measurements (List[Measurement]): Measurements.
+        path (str): Baseline path.
+    """
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump([asdict(x) for x in measurements], stream, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite.
+
+    Args:
+        argv (Optional[List[str]], optional): Command line arguments.
+        Defaults to None which reads them from sys.argv.
+
+    Returns:
+        int: Exit code which is 1 if any measurement regressed.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the shopping pricer.")
+    parser.add_argument("--products", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--quantities", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--catalogues", type=int, nargs="+", default=[100, 10000])
+    parser.add_argument("--offers", type=int, nargs="+", default=[0, 10])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", help="Json baseline to compare against.")
+    parser.add_argument("--save", help="Path to save the measurements to.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    # A missing baseline is checked before measuring so the job fails fast.
+    if args.baseline and not exists(args.baseline):
+        parser.error(f"No baseline at {args.baseline}, save one with --save")
+
+    measurements = [
+        measurement
+        for case in cases(args.products, args.quantities, args.catalogues, args.offers)
+        for measurement in measure(case, args.repeat)
+    ]
+
+    for measurement in measurements:
+        print(
+            f"{measurement.key:<70} "
+            f"{measurement.seconds:>12.6f}s {measurement.peak:>12}B"
+        )
+
+    if args.save:
+        save(measurements, args.save)
+
+    if args.baseline:
+        regressions = compare(measurements, load(args.baseline), args.threshold)
+
+        for regression in regressions:
+            print(f"Regression {regression}", file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
@@ -1,9 +1,134 @@
-from .basket.basket import Basket
-from .basket.exceptions import (BasketQuantityError, BasketTypeError,
-                                ProductNotInBasket)
-from .catalogue.catalogue import Catalogue
-from .catalogue.exceptions import CataloguePriceError, CatalogueTypeError
-from .pricer.offer import Offer
-from .pricer.pricer import Pricer
-from .pricer.stubs import PriceStub
-from .utils.types import dict_matches_type
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Exports are imported from their submodule the first time they are accessed
+# so that importing the catalogue or basket doesn't load the pricer.
+_EXPORTS: Dict[str, str] = {
+    "Basket": "basket.basket",
+    "BasketQuantityError": "basket.exceptions",
+    "BasketTypeError": "basket.exceptions",
+    "ProductNotInBasket": "basket.exceptions",
+    "load_basket": "basket.loaders",
+    "read_basket_csv": "basket.loaders",
+    "read_basket_jsonl": "basket.loaders",
+    "BasketSnapshot": "basket.snapshot",
+    "Catalogue": "catalogue.catalogue",
+    "CatalogueLike": "catalogue.catalogue",
+    "ColumnarCatalogue": "catalogue.columnar",
+    "CatalogueDuplicateError": "catalogue.exceptions",
+    "CatalogueFormatError": "catalogue.exceptions",
+    "CataloguePriceError": "catalogue.exceptions",
+    "CatalogueTypeError": "catalogue.exceptions",
+    "load_catalogue": "catalogue.loaders",
+    "read_catalogue_csv": "catalogue.loaders",
+    "read_catalogue_jsonl": "catalogue.loaders",
+    "MinorCatalogue": "catalogue.minor",
+    "from_minor": "catalogue.minor",
+    "to_minor": "catalogue.minor",
+    "MappedCatalogue": "catalogue.packed",
+    "PackedCatalogue": "catalogue.packed",
+    "pack_catalogue": "catalogue.packed",
+    "write_catalogue": "catalogue.packed",
+    "SharedCatalogue": "catalogue.shared",
+    "BatchPricer": "pricer.batch",
+    "BatchTotals": "pricer.batch",
+    "BufferOffer": "pricer.buffer",
+    "BufferPricer": "pricer.buffer",
+    "PriceBuffer": "pricer.buffer",
+    "CacheStats": "pricer.cache",
+    "PriceCache": "pricer.cache",
+    "BundlePrice": "pricer.declarative",
+    "BuyNForM": "pricer.declarative",
+    "BuyOneGetOneFree": "pricer.declarative",
+    "DeclarativeOffer": "pricer.declarative",
+    "MultiBuy": "pricer.declarative",
+    "PercentageOff": "pricer.declarative",
+    "format_offers": "pricer.definitions",
+    "pack_offers": "pricer.definitions",
+    "parse_offers": "pricer.definitions",
+    "read_offers": "pricer.definitions",
+    "unpack_offers": "pricer.definitions",
+    "OfferDefinitionError": "pricer.exceptions",
+    "OfferFormatError": "pricer.exceptions",
+    "OfferParameterError": "pricer.exceptions",
+    "GroupOffer": "pricer.groups",
+    "GroupPricer": "pricer.groups",
+    "PriceGroup": "pricer.groups",
+    "IncrementalPricer": "pricer.incremental",
+    "Offer": "pricer.offer",
+    "Pricer": "pricer.pricer",
+    "Quote": "pricer.quote",
+    "ConflictPolicy": "pricer.resolution",
+    "Resolution": "pricer.resolution",
+    "resolve": "pricer.resolution",
+    "PricingService": "pricer.service",
+    "ServiceConfig": "pricer.service",
+    "ShardedPricer": "pricer.sharded",
+    "StreamingOffer": "pricer.streaming",
+    "StreamingPricer": "pricer.streaming",
+    "PriceStub": "pricer.stubs",
+    "PriceStubArray": "pricer.stubs",
+    "Metrics": "pricer.trace",
+    "MetricsCollector": "pricer.trace",
+    "OfferTrace": "pricer.trace",
+    "PricingTrace": "pricer.trace",
+    "dict_matches_type": "utils.types",
+}
+
+if TYPE_CHECKING:
+    # Static analysis can't follow the lazy exports so they are imported here.
+    from .basket.basket import Basket
+    from .basket.exceptions import (BasketQuantityError, BasketTypeError,
+                                    ProductNotInBasket)
+    from .basket.loaders import load_basket, read_basket_csv, read_basket_jsonl
+    from .basket.snapshot import BasketSnapshot
+    from .catalogue.catalogue import Catalogue, CatalogueLike
+    from .catalogue.columnar import ColumnarCatalogue
+    from .catalogue.exceptions import (CatalogueDuplicateError,
+                                       CatalogueFormatError,
+                                       CataloguePriceError, CatalogueTypeError)
+    from .catalogue.loaders import (load_catalogue, read_catalogue_csv,
+                                    read_catalogue_jsonl)
+    from .catalogue.minor import MinorCatalogue, from_minor, to_minor
+    from .catalogue.packed import (MappedCatalogue, PackedCatalogue,
+                                   pack_catalogue, write_catalogue)
+    from .catalogue.shared import SharedCatalogue
+    from .pricer.batch import BatchPricer, BatchTotals
+    from .pricer.buffer import BufferOffer, BufferPricer, PriceBuffer
+    from .pricer.cache import CacheStats, PriceCache
+    from .pricer.declarative import (BundlePrice, BuyNForM, BuyOneGetOneFree,
+                                     DeclarativeOffer, MultiBuy, PercentageOff)
+    from .pricer.definitions import (format_offers, pack_offers, parse_offers,
+                                     read_offers, unpack_offers)
+    from .pricer.exceptions import (OfferDefinitionError, OfferFormatError,
+                                    OfferParameterError)
+    from .pricer.groups import GroupOffer, GroupPricer, PriceGroup
+    from .pricer.incremental import IncrementalPricer
+    from .pricer.offer import Offer
+    from .pricer.pricer import Pricer
+    from .pricer.quote import Quote
+    from .pricer.resolution import ConflictPolicy, Resolution, resolve
+    from .pricer.service import PricingService, ServiceConfig
+    from .pricer.sharded import ShardedPricer
+    from .pricer.streaming import StreamingOffer, StreamingPricer
+    from .pricer.stubs import PriceStub, PriceStubArray
+    from .pricer.trace import (Metrics, MetricsCollector, OfferTrace,
+                               PricingTrace)
+    from .utils.types import dict_matches_type
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+
+    # Later lookups find the export without calling this function again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_EXPORTS])
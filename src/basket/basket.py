@@ -1,40 +1,59 @@
-from ..utils.types import dict_matches_type
+from ..utils.types import dict_matches_positive, dict_matches_type
 from .exceptions import (BasketQuantityError, BasketTypeError,
                          ProductNotInBasket)
-from dataclasses import dataclass
-from typing import Any, Dict, ItemsView, Iterator, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, ItemsView, Iterator, List, Optional
+
+Listener = Callable[[str], None]
 
 
 @dataclass
 class Basket:
     contents: Dict[str, int]
+    version: int = field(default=0, compare=False, repr=False)
+    listeners: List[Listener] = field(default_factory=list, compare=False, repr=False)
 
-    def __init__(self, contents: Optional[Dict[str, int]] = None) -> None:
+    def __init__(
+        self, contents: Optional[Dict[str, int]] = None, trusted: bool = False
+    ) -> None:
         """
         Initialize a Basket instance.
 
         Args:
             contents (Optional[Dict[str, int]], optional): Dictionary representing
             products and their quantities in the basket. Defaults to None.
+            trusted (bool, optional): Skip validating contents that were already
+            validated upstream. Defaults to False.
 
         Raises:
             BasketTypeError: Basket contents must be a dictionary of strings to integers.
             BasketQuantityError: Product quantities must be non-negative integers.
         """
 
+        # The version is incremented on every mutation so that pricers can
+        # cheaply detect when their cached results are stale.
+        self.version = 0
+        self.listeners = []
+
         # We use None over {} as the default argument since it's immutable.
         if contents is None:
             self.contents = {}
 
         else:
-            if not isinstance(contents, dict) or not dict_matches_type(
-                contents, str, int
+            # Valid contents are checked in a single pass that stops at the
+            # first invalid item and only then is the error worked out.
+            if not trusted and not (
+                isinstance(contents, dict)
+                and dict_matches_positive(contents, str, int)
             ):
-                raise BasketTypeError(contents)
+                if not isinstance(contents, dict) or not dict_matches_type(
+                    contents, str, int
+                ):
+                    raise BasketTypeError(contents)
 
-            for name, quantity in contents.items():
-                if quantity <= 0:
-                    raise BasketQuantityError(name, contents)
+                for name, quantity in contents.items():
+                    if quantity <= 0:
+                        raise BasketQuantityError(name, contents)
 
             self.contents = contents
 
@@ -94,6 +113,9 @@ class Basket:
         """
         Add an item to the basket.
 
+        Listeners are notified after the item is added, so if one raises the
+        item stays in the basket and the first error is raised afterwards.
+
         Args:
             name (str): Product name.
         """
@@ -102,6 +124,9 @@ class Basket:
         else:
             self.contents[name] = 1
 
+        self.version += 1
+        self._notify(name)
+
     def remove(self, name: str) -> None:
         """
         Remove an item from the basket.
@@ -119,3 +144,39 @@ class Basket:
 
         if self.contents[name] == 0:
             self.contents.pop(name)
+
+        self.version += 1
+        self._notify(name)
+
+    def subscribe(self, listener: Listener) -> None:
+        """
+        Subscribe to changes in the basket contents.
+
+        Args:
+            listener (Listener): Called with a product name whenever
+            that product is added to or removed from the basket.
+        """
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        """
+        Unsubscribe from changes in the basket contents.
+
+        Args:
+            listener (Listener): A subscribed listener.
+        """
+        self.listeners.remove(listener)
+
+    def _notify(self, name: str) -> None:
+        # Every listener is notified even if an earlier one raises so that none
+        # of them miss the change, and the first error is raised afterwards.
+        error: Optional[Exception] = None
+
+        for listener in list(self.listeners):
+            try:
+                listener(name)
+            except Exception as raised:  # pylint: disable=W0718
+                error = error or raised
+
+        if error is not None:
+            raise error
@@ -1,7 +1,8 @@
-from typing import Any, Dict
+from ..utils.errors import PicklableError
+from typing import Any, Dict, Optional
 
 
-class ProductNotInBasket(Exception):
+class ProductNotInBasket(PicklableError):
     def __init__(self, name: str, basket_contents: Dict[str, int]) -> None:
         super().__init__(
             f"""
@@ -11,22 +12,26 @@ class ProductNotInBasket(Exception):
         )
 
 
-class BasketQuantityError(Exception):
-    def __init__(self, name: str, basket_contents: Dict[str, int]) -> None:
+class BasketQuantityError(PicklableError):
+    def __init__(
+        self, name: str, basket_contents: Dict[str, int], line: Optional[int] = None
+    ) -> None:
         super().__init__(
             f"""
              Product quantities must be non-negative integers.
              Product: '{name}' is invalid.
              Basket contents: {basket_contents}
+             {'Line: ' + str(line) if line is not None else ''}
              """
         )
 
 
-class BasketTypeError(Exception):
-    def __init__(self, basket_contents: Any) -> None:
+class BasketTypeError(PicklableError):
+    def __init__(self, basket_contents: Any, line: Optional[int] = None) -> None:
         super().__init__(
             f"""
              Basket contents must be a dictionary of strings to integers.
              Basket contents: {basket_contents}
+             {'Line: ' + str(line) if line is not None else ''}
              """
         )
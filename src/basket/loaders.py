@@ -0,0 +1,112 @@
+from ..utils.rows import Row, csv_rows, jsonl_rows
+from .basket import Basket
+from .exceptions import BasketQuantityError, BasketTypeError
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+FIELDS = ("name", "quantity")
+
+
+def read_basket_csv(stream: TextIO) -> Basket:
+    """
+    Read a basket from a csv stream with name and quantity columns.
+
+    Args:
+        stream (TextIO): Csv text stream.
+
+    Raises:
+        BasketTypeError: A row is not a product name and an integer quantity.
+        BasketQuantityError: A row has a quantity that is not positive.
+
+    Returns:
+        Basket: A basket of items and their quantities.
+    """
+    return read_basket_rows(csv_rows(stream, FIELDS))
+
+
+def read_basket_jsonl(stream: TextIO) -> Basket:
+    """
+    Read a basket from a json lines stream of name and quantity objects.
+
+    Args:
+        stream (TextIO): Json lines text stream.
+
+    Raises:
+        BasketTypeError: A row is not a product name and an integer quantity.
+        BasketQuantityError: A row has a quantity that is not positive.
+
+    Returns:
+        Basket: A basket of items and their quantities.
+    """
+    return read_basket_rows(jsonl_rows(stream, FIELDS))
+
+
+def load_basket(path: str) -> Basket:
+    """
+    Load a basket from a csv or json lines file.
+
+    Args:
+        path (str): Path to a file with a .csv, .jsonl or .ndjson extension.
+
+    Raises:
+        ValueError: The file extension is not supported.
+        BasketTypeError: A row is not a product name and an integer quantity.
+        BasketQuantityError: A row has a quantity that is not positive.
+
+    Returns:
+        Basket: A basket of items and their quantities.
+    """
+    if path.endswith(".csv"):
+        reader = read_basket_csv
+    elif path.endswith((".jsonl", ".ndjson")):
+        reader = read_basket_jsonl
+    else:
+        raise ValueError(f"Unsupported basket file: {path}")
+
+    with open(path, encoding="utf-8", newline="") as stream:
+        return reader(stream)
+
+
+def read_basket_rows(rows: Iterable[Row]) -> Basket:
+    """
+    Build a basket from rows of names and quantities, validating each as it arrives.
+
+    Repeated product names have their quantities summed.
+
+    Args:
+        rows (Iterable[Row]): Line numbers, names and quantities.
+
+    Raises:
+        BasketTypeError: A row is not a product name and an integer quantity.
+        BasketQuantityError: A row has a quantity that is not positive.
+
+    Returns:
+        Basket: A basket of items and their quantities.
+    """
+    contents: Dict[str, int] = {}
+
+    for line, name, value in rows:
+        quantity = _quantity(value)
+
+        if not isinstance(name, str) or quantity is None:
+            raise BasketTypeError({name: value}, line)
+
+        if quantity <= 0:
+            raise BasketQuantityError(name, {name: quantity}, line)
+
+        contents[name] = contents.get(name, 0) + quantity
+
+    # The rows have already been validated so they are not checked again.
+    return Basket(contents, trusted=True)
+
+
+def _quantity(value: Any) -> Optional[int]:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    return None
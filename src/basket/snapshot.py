@@ -0,0 +1,70 @@
+from .basket import Basket
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Iterator, Tuple
+
+
+@dataclass(frozen=True)
+class BasketSnapshot:
+    contents: Tuple[Tuple[str, int], ...]
+    digest: int = field(compare=False, repr=False)
+    names: FrozenSet[str] = field(compare=False, repr=False)
+
+    def __init__(self, basket: Basket) -> None:
+        """
+        Initialize a BasketSnapshot instance.
+
+        A snapshot is an immutable copy of a basket's contents that can be
+        used as a dictionary key. Its items are sorted so that baskets with
+        the same contents have equal snapshots, and its hash and set of product
+        names are computed once.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+        """
+        contents = tuple(sorted(basket.items()))
+        object.__setattr__(self, "contents", contents)
+        object.__setattr__(self, "digest", hash(contents))
+        object.__setattr__(self, "names", frozenset(basket.contents))
+
+    def __hash__(self) -> int:
+        return self.digest
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if an item is in the snapshot contents.
+
+        Args:
+            item (Any): Item to check.
+
+        Returns:
+            bool: True if the item is in the snapshot contents.
+        """
+        return item in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate through the product names in a snapshot.
+
+        Yields:
+            Iterator[str]: Product names in sorted order.
+        """
+        return (name for name, _ in self.contents)
+
+    @property
+    def count(self) -> int:
+        """
+        Get the total number of items in the snapshot.
+
+        Returns:
+            int: The number of items in the snapshot.
+        """
+        return sum(quantity for _, quantity in self.contents)
+
+    def basket(self) -> Basket:
+        """
+        Create a mutable basket with the snapshot contents.
+
+        Returns:
+            Basket: A new basket.
+        """
+        return Basket(dict(self.contents), trusted=True)
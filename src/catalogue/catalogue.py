@@ -1,39 +1,69 @@
-from ..utils.types import dict_matches_type
+from ..utils.types import dict_matches_positive, dict_matches_type
 from .exceptions import CataloguePriceError, CatalogueTypeError, UnknownPrice
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from math import isfinite
+from typing import Any, Dict, List, Mapping, Optional, Protocol
+
+
+# Pricers only read prices so they accept any catalogue with these members,
+# such as the columnar, packed and shared catalogues.
+class CatalogueLike(Protocol):
+    @property
+    def version(self) -> int: ...
+
+    @property
+    def product_names(self) -> List[str]: ...
+
+    def __contains__(self, item: Any) -> bool: ...
+
+    def price(self, name: str) -> float: ...
 
 
 @dataclass
 class Catalogue:
     products: Dict[str, float]
+    version: int = field(default=0, compare=False, repr=False)
 
-    def __init__(self, products: Optional[Dict[str, float]] = None) -> None:
+    def __init__(
+        self, products: Optional[Dict[str, float]] = None, trusted: bool = False
+    ) -> None:
         """
         Initialize a Catalogue instance.
 
         Args:
             products (Optional[Dict[str, float]], optional): Dictionary representing
             products and their prices. Defaults to None.
+            trusted (bool, optional): Skip validating products that were already
+            validated upstream. Defaults to False.
 
         Raises:
             CatalogueTypeError: Catalogue products must be a dictionary of strings to floats.
             CataloguePriceError: Catalogue products prices must be float values.
         """
 
+        # The version is incremented on every price change so that pricers can
+        # cheaply detect when their cached results are stale.
+        self.version = 0
+
         # We use None over {} as the default argument since it's immutable.
         if products is None:
             self.products = {}
 
         else:
-            if not isinstance(products, dict) or not dict_matches_type(
-                products, str, float
+            # Valid products are checked in a single pass that stops at the
+            # first invalid item and only then is the error worked out.
+            if not trusted and not (
+                isinstance(products, dict)
+                and dict_matches_positive(products, str, float)
             ):
-                raise CatalogueTypeError(products)
+                if not isinstance(products, dict) or not dict_matches_type(
+                    products, str, float
+                ):
+                    raise CatalogueTypeError(products)
 
-            for name, price in products.items():
-                if price <= 0:
-                    raise CataloguePriceError(name, products)
+                for name, price in products.items():
+                    if not isfinite(price) or price <= 0:
+                        raise CataloguePriceError(name, products)
 
             self.products = products
 
@@ -76,3 +106,58 @@ class Catalogue:
             raise UnknownPrice(name, self.product_names)
 
         return self.products[name]
+
+    def set_price(self, name: str, price: float) -> None:
+        """
+        Set the price of an item in a catalogue.
+
+        Args:
+            name (str): Item name.
+            price (float): New price of the item.
+
+        Raises:
+            CatalogueTypeError: Catalogue products must be a dictionary of strings to floats.
+            CataloguePriceError: Catalogue products prices must be float values.
+        """
+        self.apply_updates({name: price})
+
+    def apply_updates(self, changes: Mapping[str, Optional[float]]) -> None:
+        """
+        Insert, update and delete many prices at once.
+
+        Only the changed rows are validated and either every change is
+        applied or none are. The version is incremented once per batch.
+
+        Args:
+            changes (Mapping[str, Optional[float]]): New prices by item name.
+            A price of None deletes the item.
+
+        Raises:
+            CatalogueTypeError: Catalogue products must be a dictionary of strings to floats.
+            CataloguePriceError: Catalogue products prices must be float values.
+            UnknownPrice: A deleted product name is not in the catalogue.
+        """
+        for name, price in changes.items():
+            if price is None:
+                if name not in self.products:
+                    raise UnknownPrice(name, self.product_names)
+            else:
+                self._validate(name, price)
+
+        if not changes:
+            return
+
+        for name, price in changes.items():
+            if price is None:
+                del self.products[name]
+            else:
+                self.products[name] = price
+
+        self.version += 1
+
+    def _validate(self, name: str, price: float) -> None:
+        if not isinstance(name, str) or not isinstance(price, float):
+            raise CatalogueTypeError({name: price})
+
+        if not isfinite(price) or price <= 0:
+            raise CataloguePriceError(name, {name: price})
@@ -0,0 +1,137 @@
+from ..utils.types import dict_matches_positive, dict_matches_type
+from .catalogue import Catalogue
+from .exceptions import CataloguePriceError, CatalogueTypeError, UnknownPrice
+from array import array
+from dataclasses import dataclass, field
+from math import isfinite
+from typing import Any, Dict, Iterable, List, Sequence
+
+
+@dataclass
+class ColumnarCatalogue:
+    names: List[str]
+    prices: "array[float]"
+    ids: Dict[str, int] = field(compare=False, repr=False)
+    version: int = field(default=0, compare=False, repr=False)
+
+    def __init__(self, names: Sequence[str], prices: Iterable[float]) -> None:
+        """
+        Initialize a ColumnarCatalogue instance.
+
+        Product names are interned to integer ids and prices are stored
+        in a contiguous array of doubles indexed by those ids.
+
+        Args:
+            names (Sequence[str]): Product names.
+            prices (Iterable[float]): Product prices in the same order as the names.
+
+        Raises:
+            CatalogueTypeError: Catalogue products must be a dictionary of strings to floats.
+            CataloguePriceError: Catalogue products prices must be float values.
+        """
+        self.version = 0
+
+        # The names and prices are materialised once so that iterators can be
+        # both validated and stored.
+        self.names = list(names)
+        price_list = list(prices)
+        products = dict(zip(self.names, price_list))
+
+        if len(price_list) != len(self.names) or len(products) != len(self.names):
+            raise CatalogueTypeError(products)
+
+        # Valid products are checked with the same single pass as Catalogue
+        # and the error is only worked out for invalid products.
+        if not dict_matches_positive(products, str, float):
+            if not dict_matches_type(products, str, float):
+                raise CatalogueTypeError(products)
+
+            for name, price in products.items():
+                if not isfinite(price) or price <= 0:
+                    raise CataloguePriceError(name, products)
+
+        self.prices = array("d", price_list)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_catalogue(cls, catalogue: Catalogue) -> "ColumnarCatalogue":
+        """
+        Convert a catalogue into a columnar catalogue.
+
+        Args:
+            catalogue (Catalogue): A catalogue of items and their prices.
+
+        Returns:
+            ColumnarCatalogue: An equivalent columnar catalogue.
+        """
+        return cls(list(catalogue.products), catalogue.products.values())
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if an item is in the catalogue.
+
+        Args:
+            item (Any): Item to check.
+
+        Returns:
+            bool: True if the item is in the catalogue.
+        """
+        return item in self.ids
+
+    @property
+    def product_names(self) -> List[str]:
+        """
+        Get a list of the product names in a catalogue.
+
+        Returns:
+            List[str]: List of product names.
+        """
+        return list(self.names)
+
+    def product_id(self, name: str) -> int:
+        """
+        Get the id of an item in a catalogue.
+
+        Args:
+            name (str): Item name.
+
+        Raises:
+            UnknownPrice: Product name is not in the catalogue.
+
+        Returns:
+            int: Id of the product.
+        """
+        if name not in self.ids:
+            raise UnknownPrice(name, self.product_names)
+
+        return self.ids[name]
+
+    def price(self, name: str) -> float:
+        """
+        Get the price of an item in a catalogue.
+
+        Args:
+            name (str): Item name.
+
+        Raises:
+            UnknownPrice: Product name is not in the catalogue.
+
+        Returns:
+            float: Price of the product.
+        """
+        return self.prices[self.product_id(name)]
+
+    def price_ids(self, ids: Iterable[int]) -> "array[float]":
+        """
+        Get the prices of many items in a catalogue by their ids.
+
+        Args:
+            ids (Iterable[int]): Product ids.
+
+        Raises:
+            IndexError: A product id is not in the catalogue.
+
+        Returns:
+            array[float]: Prices of the products in the same order as the ids.
+        """
+        return array("d", map(self.prices.__getitem__, ids))
@@ -1,32 +1,67 @@
-from typing import Any, Dict, List
+from ..utils.errors import PicklableError
+from typing import Any, Dict, List, Optional
 
 
-class CatalogueTypeError(Exception):
-    def __init__(self, catalogue_products: Any) -> None:
+class CatalogueTypeError(PicklableError):
+    def __init__(self, catalogue_products: Any, line: Optional[int] = None) -> None:
         super().__init__(
             f"""
              Catalogue products must be a dictionary of strings to floats.
              Products: {catalogue_products}
+             {'Line: ' + str(line) if line is not None else ''}
              """
         )
 
 
-class CataloguePriceError(Exception):
-    def __init__(self, name: str, catalogue_products: Dict[str, float]) -> None:
+class CataloguePriceError(PicklableError):
+    def __init__(
+        self,
+        name: str,
+        catalogue_products: Dict[str, float],
+        line: Optional[int] = None,
+    ) -> None:
         super().__init__(
             f"""
              Catalogue products prices must be float values.
              Product: '{name}' is invalid.
              Products: {catalogue_products}
+             {'Line: ' + str(line) if line is not None else ''}
              """
         )
 
 
-class UnknownPrice(Exception):
-    def __init__(self, name: str, catalogue_names: List[str]) -> None:
+class CatalogueDuplicateError(PicklableError):
+    def __init__(self, name: str, line: Optional[int] = None) -> None:
+        super().__init__(
+            f"""
+             Catalogue product names must be unique.
+             Product: '{name}' is listed more than once.
+             {'Line: ' + str(line) if line is not None else ''}
+             """
+        )
+
+
+class UnknownPrice(PicklableError):
+    def __init__(
+        self, name: str, catalogue_names: List[str], count: Optional[int] = None
+    ) -> None:
+        # Large catalogues only list a sample of their names.
+        shown = len(catalogue_names)
+
         super().__init__(
             f"""
              Product: '{name}' is not in the catalogue.
              Catalogue product names: {catalogue_names}
+             {f'Showing {shown} of {count} products' if count is not None else ''}
+             """
+        )
+
+
+class CatalogueFormatError(PicklableError):
+    def __init__(self, source: str) -> None:
+        super().__init__(
+            f"""
+             Catalogue data is not in the packed catalogue format.
+             Source: {source}
              """
         )
@@ -0,0 +1,122 @@
+from ..utils.rows import Row, csv_rows, jsonl_rows
+from .catalogue import Catalogue
+from .exceptions import (CatalogueDuplicateError, CataloguePriceError,
+                         CatalogueTypeError)
+from math import isfinite
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+FIELDS = ("name", "price")
+
+
+def read_catalogue_csv(stream: TextIO) -> Catalogue:
+    """
+    Read a catalogue from a csv stream with name and price columns.
+
+    Args:
+        stream (TextIO): Csv text stream.
+
+    Raises:
+        CatalogueTypeError: A row is not a product name and a float price.
+        CataloguePriceError: A row has a price that is not positive and finite.
+        CatalogueDuplicateError: A product name is listed in more than one row.
+
+    Returns:
+        Catalogue: A catalogue of items and their prices.
+    """
+    return read_catalogue_rows(csv_rows(stream, FIELDS))
+
+
+def read_catalogue_jsonl(stream: TextIO) -> Catalogue:
+    """
+    Read a catalogue from a json lines stream of name and price objects.
+
+    Args:
+        stream (TextIO): Json lines text stream.
+
+    Raises:
+        CatalogueTypeError: A row is not a product name and a float price.
+        CataloguePriceError: A row has a price that is not positive and finite.
+        CatalogueDuplicateError: A product name is listed in more than one row.
+
+    Returns:
+        Catalogue: A catalogue of items and their prices.
+    """
+    return read_catalogue_rows(jsonl_rows(stream, FIELDS))
+
+
+def load_catalogue(path: str) -> Catalogue:
+    """
+    Load a catalogue from a csv or json lines file.
+
+    Args:
+        path (str): Path to a file with a .csv, .jsonl or .ndjson extension.
+
+    Raises:
+        ValueError: The file extension is not supported.
+        CatalogueTypeError: A row is not a product name and a float price.
+        CataloguePriceError: A row has a price that is not positive and finite.
+        CatalogueDuplicateError: A product name is listed in more than one row.
+
+    Returns:
+        Catalogue: A catalogue of items and their prices.
+    """
+    if path.endswith(".csv"):
+        reader = read_catalogue_csv
+    elif path.endswith((".jsonl", ".ndjson")):
+        reader = read_catalogue_jsonl
+    else:
+        raise ValueError(f"Unsupported catalogue file: {path}")
+
+    with open(path, encoding="utf-8", newline="") as stream:
+        return reader(stream)
+
+
+def read_catalogue_rows(rows: Iterable[Row]) -> Catalogue:
+    """
+    Build a catalogue from rows of names and prices, validating each as it arrives.
+
+    Args:
+        rows (Iterable[Row]): Line numbers, names and prices.
+
+    Raises:
+        CatalogueTypeError: A row is not a product name and a float price.
+        CataloguePriceError: A row has a price that is not positive and finite.
+        CatalogueDuplicateError: A product name is listed in more than one row.
+
+    Returns:
+        Catalogue: A catalogue of items and their prices.
+    """
+    products: Dict[str, float] = {}
+
+    for line, name, value in rows:
+        price = _price(value)
+
+        if not isinstance(name, str) or price is None:
+            raise CatalogueTypeError({name: value}, line)
+
+        if not isfinite(price) or price <= 0:
+            raise CataloguePriceError(name, {name: price}, line)
+
+        if name in products:
+            raise CatalogueDuplicateError(name, line)
+
+        products[name] = price
+
+    # The rows have already been validated so they are not checked again.
+    return Catalogue(products, trusted=True)
+
+
+def _price(value: Any) -> Optional[float]:
+    if isinstance(value, float):
+        return value
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    return None
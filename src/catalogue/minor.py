@@ -0,0 +1,119 @@
+from .catalogue import Catalogue
+from .exceptions import CataloguePriceError, CatalogueTypeError
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any, Dict, Optional
+
+
+def to_minor(price: float, exponent: int = 2) -> int:
+    """
+    Convert a price to an integer number of minor units.
+
+    The price is rounded half to even from its shortest decimal representation
+    so that values like 1.005 are not affected by binary rounding.
+
+    >>> to_minor(1.005)
+    100
+
+    >>> to_minor(12.34)
+    1234
+
+    Args:
+        price (float): Price in major units.
+        exponent (int, optional): Number of minor unit digits. Defaults to 2.
+
+    Returns:
+        int: Price in minor units.
+    """
+    return int(
+        Decimal(repr(price)).scaleb(exponent).to_integral_value(ROUND_HALF_EVEN)
+    )
+
+
+def from_minor(amount: int, exponent: int = 2) -> Decimal:
+    """
+    Convert an integer number of minor units to an exact decimal price.
+
+    >>> from_minor(1234)
+    Decimal('12.34')
+
+    Args:
+        amount (int): Price in minor units.
+        exponent (int, optional): Number of minor unit digits. Defaults to 2.
+
+    Returns:
+        Decimal: Price in major units.
+    """
+    return Decimal(amount).scaleb(-exponent)
+
+
+def _is_minor(price: Any) -> bool:
+    return isinstance(price, int) and not isinstance(price, bool)
+
+
+class MinorCatalogue(Catalogue):
+    products: Dict[str, int]  # type: ignore
+
+    def __init__(
+        self, products: Optional[Dict[str, int]] = None, trusted: bool = False
+    ) -> None:
+        """
+        Initialize a MinorCatalogue instance.
+
+        A minor catalogue stores prices as integer minor units, such as pence,
+        so that offers and totals computed from them are exact.
+
+        Args:
+            products (Optional[Dict[str, int]], optional): Dictionary representing
+            products and their prices in minor units. Defaults to None.
+            trusted (bool, optional): Skip validating products that were already
+            validated upstream. Defaults to False.
+
+        Raises:
+            CatalogueTypeError: Catalogue products must be a dictionary of strings to integers.
+            CataloguePriceError: Catalogue products prices must be positive.
+        """
+        super().__init__()
+
+        if products is not None and trusted:
+            self.products = products
+
+        elif products is not None:
+            if not isinstance(products, dict):
+                raise CatalogueTypeError(products)
+
+            for name, price in products.items():
+                if not isinstance(name, str) or not _is_minor(price):
+                    raise CatalogueTypeError(products)
+
+                if price <= 0:
+                    raise CataloguePriceError(name, products)  # type: ignore
+
+            self.products = products
+
+    @classmethod
+    def from_catalogue(
+        cls, catalogue: Catalogue, exponent: int = 2
+    ) -> "MinorCatalogue":
+        """
+        Convert a catalogue of float prices into a minor catalogue.
+
+        Args:
+            catalogue (Catalogue): A catalogue of items and their prices.
+            exponent (int, optional): Number of minor unit digits. Defaults to 2.
+
+        Returns:
+            MinorCatalogue: An equivalent catalogue in minor units.
+        """
+        return cls(
+            {
+                name: to_minor(price, exponent)
+                for name, price in catalogue.products.items()
+            }
+        )
+
+    def _validate(self, name: str, price: float) -> None:
+        if not isinstance(name, str) or not _is_minor(price):
+            raise CatalogueTypeError({name: price})
+
+        if price <= 0:
+            raise CataloguePriceError(name, {name: price})
@@ -0,0 +1,235 @@
+from .catalogue import Catalogue
+from .exceptions import CatalogueFormatError, UnknownPrice
+from dataclasses import dataclass, field
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from typing import Any, List, Optional, Union
+
+# A packed catalogue is laid out as a header with a magic string and the
+# number of products, an array of prices, an array of offsets into the
+# names and then the utf-8 encoded names themselves. Products are sorted
+# by their encoded names so lookups are a binary search over the offsets.
+MAGIC = b"SHOPCAT\x01"
+HEADER = Struct("<8sQ")
+DOUBLE = Struct("<d")
+OFFSET = Struct("<Q")
+
+# Unknown price errors only decode this many names rather than the whole catalogue.
+NAME_SAMPLE = 20
+
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+
+
+def pack_catalogue(catalogue: Catalogue) -> bytes:
+    """
+    Pack a catalogue into the packed catalogue format.
+
+    Args:
+        catalogue (Catalogue): A catalogue of items and their prices.
+
+    Returns:
+        bytes: Packed catalogue.
+    """
+    products = sorted(
+        (name.encode(), price) for name, price in catalogue.products.items()
+    )
+
+    offsets = [0]
+    for name, _ in products:
+        offsets.append(offsets[-1] + len(name))
+
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, len(products)),
+            *[DOUBLE.pack(price) for _, price in products],
+            *[OFFSET.pack(offset) for offset in offsets],
+            *[name for name, _ in products],
+        ]
+    )
+
+
+def write_catalogue(catalogue: Catalogue, path: str) -> None:
+    """
+    Write a catalogue to a file in the packed catalogue format.
+
+    Args:
+        catalogue (Catalogue): A catalogue of items and their prices.
+        path (str): File path.
+    """
+    with open(path, "wb") as stream:
+        stream.write(pack_catalogue(catalogue))
+
+
+@dataclass
+class PackedCatalogue:
+    buffer: Buffer = field(repr=False)
+    count: int
+
+    def __init__(self, buffer: Buffer, source: str = "<buffer>") -> None:
+        """
+        Initialize a PackedCatalogue instance.
+
+        A packed catalogue reads prices directly from a buffer in the packed
+        catalogue format without loading the products into a dictionary.
+
+        Args:
+            buffer (Buffer): Packed catalogue.
+            source (str, optional): Description of the buffer used in errors.
+            Defaults to "<buffer>".
+
+        Raises:
+            CatalogueFormatError: The buffer is not a packed catalogue or
+            is too short to hold its products.
+        """
+        if len(buffer) < HEADER.size:
+            raise CatalogueFormatError(source)
+
+        magic, count = HEADER.unpack_from(buffer)
+
+        if magic != MAGIC:
+            raise CatalogueFormatError(source)
+
+        offsets = HEADER.size + DOUBLE.size * count
+        names = offsets + OFFSET.size * (count + 1)
+
+        # The buffer must hold the prices, the offset table and every name so
+        # that a truncated catalogue is rejected here rather than on lookup.
+        if len(buffer) < names:
+            raise CatalogueFormatError(source)
+
+        (first,) = OFFSET.unpack_from(buffer, offsets)
+        (last,) = OFFSET.unpack_from(buffer, offsets + OFFSET.size * count)
+
+        if first != 0 or len(buffer) < names + last:
+            raise CatalogueFormatError(source)
+
+        self.buffer = buffer
+        self.count = count
+
+        self._offsets = offsets
+        self._names = names
+
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the catalogue.
+
+        Packed catalogues can't be changed so their version is always 0.
+
+        Returns:
+            int: Catalogue version.
+        """
+        return 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if an item is in the catalogue.
+
+        Args:
+            item (Any): Item to check.
+
+        Returns:
+            bool: True if the item is in the catalogue.
+        """
+        return isinstance(item, str) and self._search(item.encode()) is not None
+
+    @property
+    def product_names(self) -> List[str]:
+        """
+        Get a list of the product names in a catalogue.
+
+        Returns:
+            List[str]: List of product names.
+        """
+        return [self._name(i).decode() for i in range(self.count)]
+
+    def price(self, name: str) -> float:
+        """
+        Get the price of an item in a catalogue.
+
+        Args:
+            name (str): Item name.
+
+        Raises:
+            UnknownPrice: Product name is not in the catalogue.
+
+        Returns:
+            float: Price of the product.
+        """
+        i = self._search(name.encode())
+
+        if i is None:
+            shown = range(min(self.count, NAME_SAMPLE))
+            sample = [self._name(j).decode() for j in shown]
+            raise UnknownPrice(name, sample, self.count)
+
+        return DOUBLE.unpack_from(self.buffer, HEADER.size + DOUBLE.size * i)[0]
+
+    def _offset(self, i: int) -> int:
+        return OFFSET.unpack_from(self.buffer, self._offsets + OFFSET.size * i)[0]
+
+    def _name(self, i: int) -> bytes:
+        start = self._names + self._offset(i)
+        end = self._names + self._offset(i + 1)
+        return bytes(self.buffer[start:end])
+
+    def _search(self, name: bytes) -> Optional[int]:
+        low, high = 0, self.count
+
+        while low < high:
+            middle = (low + high) // 2
+            current = self._name(middle)
+
+            if current == name:
+                return middle
+
+            if current < name:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+
+class MappedCatalogue(PackedCatalogue):
+    def __init__(self, path: str) -> None:
+        """
+        Initialize a MappedCatalogue instance.
+
+        The file is memory mapped read only so that pages are loaded on
+        demand and shared between processes that open the same file.
+
+        Args:
+            path (str): Path to a packed catalogue file.
+
+        Raises:
+            CatalogueFormatError: The file is not a packed catalogue.
+        """
+        with open(path, "rb") as stream:
+            try:
+                mapped = mmap(stream.fileno(), 0, access=ACCESS_READ)
+            except ValueError as error:
+                raise CatalogueFormatError(path) from error
+
+        try:
+            super().__init__(mapped, path)
+        except CatalogueFormatError:
+            mapped.close()
+            raise
+
+        self.path = path
+
+    def __enter__(self) -> "MappedCatalogue":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the catalogue file.
+        """
+        self.buffer.close()  # type: ignore
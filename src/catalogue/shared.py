@@ -0,0 +1,284 @@
+import os
+import sys
+from .catalogue import Catalogue
+from .exceptions import CatalogueFormatError
+from .packed import PackedCatalogue, pack_catalogue
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from secrets import token_hex
+from struct import Struct
+from typing import Any, Dict, List, Optional, Tuple
+
+# The control block is a sequence lock, the catalogue version and the name
+# of the shared memory block holding that version in the packed catalogue
+# format. The writer makes the sequence odd while it updates the control
+# block so readers retry rather than read a torn version and name.
+CONTROL = Struct("<QQ32s")
+EMPTY = pack_catalogue(Catalogue({}))
+
+
+class SharedCatalogue(PackedCatalogue):
+    def __init__(self, name: str, catalogue: Optional[Catalogue] = None) -> None:
+        """
+        Initialize a SharedCatalogue instance.
+
+        A shared catalogue reads prices from a packed catalogue in shared
+        memory so that every process pricing baskets shares one copy. One
+        process creates and publishes the catalogue and any number of
+        processes attach to it by name. Each lookup first checks the control
+        block and moves to the latest published version, so readers see
+        price updates without restarting.
+
+        Args:
+            name (str): Name of the catalogue's control block.
+            catalogue (Optional[Catalogue], optional): Catalogue to publish
+            under a new control block, which makes this catalogue the writer.
+            Defaults to None which attaches to an existing catalogue.
+
+        Raises:
+            FileNotFoundError: No catalogue has been created with the name.
+            FileExistsError: A catalogue has already been created with the name.
+            CatalogueFormatError: The shared memory is not a shared catalogue.
+        """
+        # The empty catalogue is replaced when the first version is attached.
+        super().__init__(EMPTY, name)
+        self.name = name
+        self.owner = catalogue is not None
+        self._control = _open(name, CONTROL.size if self.owner else 0)
+        self._created: Dict[str, SharedMemory] = {}
+        self._block: Optional[SharedMemory] = None
+        self._version = 0
+
+        if catalogue is not None:
+            self._created[name] = self._control
+            CONTROL.pack_into(self._control.buf, 0, 0, 0, b"")
+            self.publish(catalogue)
+            return
+
+        try:
+            self._refresh()
+        except CatalogueFormatError:
+            self._control.close()
+            raise
+
+    @classmethod
+    def create(
+        cls, catalogue: Catalogue, name: Optional[str] = None
+    ) -> "SharedCatalogue":
+        """
+        Publish a catalogue to shared memory.
+
+        The returned catalogue owns the shared memory and is the only one
+        that can publish new versions or unlink it.
+
+        Args:
+            catalogue (Catalogue): A catalogue of items and their prices.
+            name (Optional[str], optional): Name of the control block.
+            Defaults to None which generates a unique name.
+
+        Returns:
+            SharedCatalogue: The writer's shared catalogue.
+        """
+        return cls(name or f"shop_{token_hex(6)}", catalogue)
+
+    @property
+    def version(self) -> int:
+        """
+        Get the latest published version of the catalogue.
+
+        Returns:
+            int: Catalogue version.
+        """
+        self._refresh()
+        return self._version
+
+    def __len__(self) -> int:
+        self._refresh()
+        return super().__len__()
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Check if an item is in the catalogue.
+
+        Args:
+            item (Any): Item to check.
+
+        Returns:
+            bool: True if the item is in the catalogue.
+        """
+        self._refresh()
+        return super().__contains__(item)
+
+    @property
+    def product_names(self) -> List[str]:
+        """
+        Get a list of the product names in a catalogue.
+
+        Returns:
+            List[str]: List of product names.
+        """
+        self._refresh()
+        return super().product_names
+
+    def price(self, name: str) -> float:
+        """
+        Get the price of an item in a catalogue.
+
+        Args:
+            name (str): Item name.
+
+        Raises:
+            UnknownPrice: Product name is not in the catalogue.
+
+        Returns:
+            float: Price of the product.
+        """
+        self._refresh()
+        return super().price(name)
+
+    def publish(self, catalogue: Catalogue) -> None:
+        """
+        Publish a new version of the catalogue.
+
+        The new version is written to its own block of shared memory and then
+        swapped in by updating the control block, so readers see either the
+        old or the new catalogue and never a mix of both.
+
+        Args:
+            catalogue (Catalogue): A catalogue of items and their prices.
+
+        Raises:
+            PermissionError: The catalogue was attached rather than created.
+        """
+        if not self.owner:
+            raise PermissionError(f"Only the creator can publish to: {self.name}")
+
+        sequence, version, previous = CONTROL.unpack_from(self._control.buf)
+        packed = pack_catalogue(catalogue)
+        block = _open(f"{self.name}_{version + 1}", len(packed))
+        block.buf[: len(packed)] = packed
+        self._created[block.name] = block
+
+        CONTROL.pack_into(self._control.buf, 0, sequence + 1, version, previous)
+        CONTROL.pack_into(
+            self._control.buf, 0, sequence + 2, version + 1, block.name.encode()
+        )
+        self._refresh()
+
+        # Readers that already attached to the previous version keep their
+        # mapping after it is unlinked.
+        if previous.rstrip(b"\0"):
+            _unlink(self._created.pop(previous.rstrip(b"\0").decode()))
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory.
+        """
+        self._detach()
+
+        for memory in self._created.values():
+            memory.close()
+
+        if self.name not in self._created:
+            self._control.close()
+
+    def unlink(self) -> None:
+        """
+        Close and destroy the shared memory so no process can attach to it.
+
+        Raises:
+            PermissionError: The catalogue was attached rather than created.
+        """
+        if not self.owner:
+            raise PermissionError(f"Only the creator can unlink: {self.name}")
+
+        self.close()
+
+        for memory in self._created.values():
+            _unlink(memory)
+
+        self._created = {}
+
+    def __enter__(self) -> "SharedCatalogue":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def _read(self) -> Tuple[int, str]:
+        # Retry until the sequence is even and unchanged around the read.
+        while True:
+            control = CONTROL.unpack_from(self._control.buf)
+            sequence, version, block = control
+
+            if sequence % 2 == 0 and CONTROL.unpack_from(self._control.buf) == control:
+                return version, block.rstrip(b"\0").decode()
+
+    def _refresh(self) -> None:
+        while True:
+            version, block = self._read()
+
+            if self._block is not None and version == self._version:
+                return
+
+            if not block:
+                raise CatalogueFormatError(self.name)
+
+            try:
+                attached = self._created.get(block) or _open(block)
+                break
+            except FileNotFoundError:
+                # The version was swapped out again before it could be
+                # attached, so the control block is read again.
+                continue
+
+        self._detach()
+        self._block = attached
+        PackedCatalogue.__init__(self, attached.buf, block)
+        self._version = version
+
+    def _detach(self) -> None:
+        # The buffer must be released before the shared memory is closed.
+        if self._block is not None:
+            self.buffer = b""
+
+            if self._block.name not in self._created:
+                self._block.close()
+
+            self._block = None
+
+
+# Shared memory is unlinked explicitly by the writer rather than by the
+# resource tracker. Forked readers share the writer's tracker and other
+# readers have their own, so tracking would either unlink the catalogue
+# when a reader exits or drop the writer's registration.
+def _open(name: str, size: int = 0) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        # Linters running on older versions don't know the track parameter.
+        # pylint: disable-next=unexpected-keyword-arg
+        return SharedMemory(name, bool(size), size, track=False)
+
+    memory = SharedMemory(name, bool(size), size)
+
+    if os.name == "posix":
+        resource_tracker.unregister(_tracked(memory), "shared_memory")
+
+    return memory
+
+
+def _unlink(memory: SharedMemory) -> None:
+    # Untracked shared memory is only unregistered on unlink before Python 3.13.
+    if sys.version_info < (3, 13) and os.name == "posix":
+        resource_tracker.register(_tracked(memory), "shared_memory")
+
+    memory.close()
+    memory.unlink()
+
+
+def _tracked(memory: SharedMemory) -> str:
+    # The resource tracker names POSIX shared memory with a leading slash,
+    # which the public name leaves out.
+    return f"/{memory.name}"
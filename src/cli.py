@@ -0,0 +1,315 @@
+import argparse
+import json
+import sys
+from .basket.basket import Basket
+from .catalogue.loaders import load_catalogue
+from .pricer.batch import BatchPricer, initialize_worker, worker_price_each
+from .pricer.definitions import EXTENSIONS, read_offers
+from .pricer.offer import Offer
+from collections import deque
+from contextlib import ExitStack
+from importlib import import_module
+from itertools import islice
+from math import ceil, log
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from time import perf_counter
+from typing import (Any, Deque, Iterable, Iterator, List, Optional, TextIO,
+                    Tuple, Union)
+
+Result = Union[Tuple[float, float], Exception]
+Item = Tuple[int, float, Union[Basket, Exception]]
+
+
+def load_offers(spec: Optional[str], cache: Optional[str] = None) -> List[Offer]:
+    """
+    Read offers from a definitions file or import them from a module.
+
+    Args:
+        spec (Optional[str]): Path to a .json, .toml or .bin offers file or a
+        module and attribute separated by a colon. The attribute is a list of
+        offers or a function returning one.
+        cache (Optional[str], optional): Path to a packed offers cache used
+        with definitions files. Defaults to None.
+
+    Raises:
+        ValueError: The spec is not a module and attribute.
+
+    Returns:
+        List[Offer]: List of offers.
+    """
+    if spec is None:
+        return []
+
+    if spec.endswith(EXTENSIONS):
+        return list(read_offers(spec, cache))
+
+    module, _, attribute = spec.partition(":")
+
+    if not module or not attribute:
+        raise ValueError(f"Offers must be given as module:attribute: {spec}")
+
+    offers = getattr(import_module(module), attribute)
+    return list(offers() if callable(offers) else offers)
+
+
+def read_baskets(stream: TextIO) -> Iterator[Item]:
+    """
+    Stream the baskets in a json lines file of product quantities.
+
+    Args:
+        stream (TextIO): Json lines text stream.
+
+    Yields:
+        Iterator[Item]: Line number, time it was read and the basket or the
+        error raised when parsing it.
+    """
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+
+        start = perf_counter()
+
+        try:
+            yield line, start, Basket(json.loads(text))
+        except Exception as error:  # pylint: disable=W0718
+            yield line, start, error
+
+
+def price_baskets(
+    pricer: BatchPricer,
+    items: Iterable[Item],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+) -> Iterator[Tuple[int, float, Result]]:
+    """
+    Price a stream of baskets in their original order.
+
+    Args:
+        pricer (BatchPricer): Batch pricer.
+        items (Iterable[Item]): Line numbers, read times and baskets.
+        workers (Optional[int], optional): Number of worker processes.
+        Defaults to None which prices the baskets in this process.
+        chunksize (int, optional): Number of baskets sent to a worker
+        process at a time. Defaults to 256.
+
+    Yields:
+        Iterator[Tuple[int, float, Result]]: Line number, read time and the
+        sub-total and total or the error raised for each basket.
+    """
+    if workers is None:
+        for line, start, basket in items:
+            if isinstance(basket, Exception):
+                yield line, start, basket
+            else:
+                yield line, start, pricer.price_each([basket])[0]
+
+        return
+
+    iterator = iter(items)
+    chunks = iter(lambda: list(islice(iterator, chunksize)), [])
+
+    with Pool(workers, initialize_worker, (pricer,)) as pool:
+        # Chunks are kept in order so their results can be matched back up,
+        # and only a few are submitted ahead of the workers so the stream
+        # isn't read into memory faster than it can be priced.
+        pending: Deque[Tuple[List[Item], "AsyncResult[List[Any]]"]] = deque()
+
+        for chunk in chunks:
+            baskets = [b for _, _, b in chunk if isinstance(b, Basket)]
+            pending.append((chunk, pool.apply_async(worker_price_each, (baskets,))))
+
+            if len(pending) >= 2 * workers:
+                yield from _merge(*pending.popleft())
+
+        while pending:
+            yield from _merge(*pending.popleft())
+
+
+def _merge(
+    chunk: List[Item], results: "AsyncResult[List[Any]]"
+) -> List[Tuple[int, float, Result]]:
+    # The results only cover the baskets that were parsed.
+    priced = iter(results.get())
+    return [
+        (line, start, basket if isinstance(basket, Exception) else next(priced))
+        for line, start, basket in chunk
+    ]
+
+
+def format_result(line: int, result: Result) -> str:
+    """
+    Format a pricing result as a line of json.
+
+    Args:
+        line (int): Line number of the basket.
+        result (Result): Sub-total and total or the error raised.
+
+    Returns:
+        str: Json object.
+    """
+    record: Any
+
+    if isinstance(result, Exception):
+        record = {
+            "line": line,
+            "error": type(result).__name__,
+            "message": " ".join(str(result).split()),
+        }
+    else:
+        sub_total, total = result
+        record = {
+            "line": line,
+            "sub_total": sub_total,
+            "discount": sub_total - total,
+            "total": total,
+        }
+
+    return json.dumps(record)
+
+
+class LatencyHistogram:
+    def __init__(
+        self, smallest: float = 1e-6, growth: float = 1.05, buckets: int = 512
+    ) -> None:
+        """
+        Initialize a LatencyHistogram instance.
+
+        Latencies are counted in a fixed number of buckets whose bounds grow
+        geometrically, so memory stays constant however many baskets are
+        priced and each percentile is within the growth factor of the exact
+        latency.
+
+        Args:
+            smallest (float, optional): Upper bound in seconds of the first
+            bucket. Defaults to 1e-6.
+            growth (float, optional): Ratio between the bounds of neighbouring
+            buckets. Defaults to 1.05.
+            buckets (int, optional): Number of buckets. Latencies above the
+            last bound are counted in the last bucket. Defaults to 512.
+        """
+        self.smallest = smallest
+        self.growth = growth
+        self.counts = [0] * buckets
+        self.count = 0
+
+    def add(self, latency: float) -> None:
+        """
+        Count a latency.
+
+        Args:
+            latency (float): Latency in seconds.
+        """
+        i = 0
+
+        if latency > self.smallest:
+            i = min(
+                ceil(log(latency / self.smallest, self.growth)), len(self.counts) - 1
+            )
+
+        self.counts[i] += 1
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a percentile of the latencies by the nearest rank.
+
+        The upper bound of the bucket holding the latency is returned.
+
+        >>> histogram = LatencyHistogram(1.0, 2.0, 8)
+        >>> for latency in [1.0, 2.0, 3.0, 4.0]:
+        ...     histogram.add(latency)
+        >>> histogram.percentile(50)
+        2.0
+        >>> histogram.percentile(100)
+        4.0
+
+        Args:
+            q (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Percentile latency in seconds or 0.0 if there are no latencies.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(-(-self.count * q // 100), 1)
+        seen = 0
+
+        for i, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= rank:
+                return self.smallest * self.growth**i
+
+        return 0.0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Price a stream of baskets and write their totals as json lines.
+
+    Args:
+        argv (Optional[List[str]], optional): Command line arguments.
+        Defaults to None which reads them from sys.argv.
+
+    Returns:
+        int: Exit code which is 1 if any basket could not be priced.
+    """
+    parser = argparse.ArgumentParser(
+        prog="shopping", description="Price baskets of products."
+    )
+    parser.add_argument("catalogue", help="Catalogue csv or json lines file.")
+    parser.add_argument(
+        "baskets", nargs="?", help="Json lines file of baskets. Defaults to stdin."
+    )
+    parser.add_argument(
+        "--offers", help="Offers file or offers to import as module:attribute."
+    )
+    parser.add_argument("--offers-cache", help="Packed offers cache file.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    parser.add_argument("--chunksize", type=int, default=256)
+    parser.add_argument(
+        "--stats", action="store_true", help="Print throughput and latency."
+    )
+    args = parser.parse_args(argv)
+
+    pricer = BatchPricer(
+        load_catalogue(args.catalogue), load_offers(args.offers, args.offers_cache)
+    )
+
+    latencies = LatencyHistogram()
+    errors = 0
+    start = perf_counter()
+
+    with ExitStack() as stack:
+        stream = (
+            sys.stdin
+            if args.baskets is None
+            else stack.enter_context(open(args.baskets, encoding="utf-8"))
+        )
+
+        for line, read, result in price_baskets(
+            pricer, read_baskets(stream), args.workers, args.chunksize
+        ):
+            print(format_result(line, result))
+            latencies.add(perf_counter() - read)
+            errors += isinstance(result, Exception)
+
+    seconds = perf_counter() - start
+
+    if args.stats:
+        print(
+            f"baskets: {latencies.count} errors: {errors} seconds: {seconds:.3f} "
+            f"throughput: {latencies.count / seconds if seconds else 0:.0f} baskets/s "
+            f"p50: {latencies.percentile(50) * 1000:.3f}ms "
+            f"p95: {latencies.percentile(95) * 1000:.3f}ms "
+            f"p99: {latencies.percentile(99) * 1000:.3f}ms",
+            file=sys.stderr,
+        )
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import pickle
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from ..catalogue.exceptions import UnknownPrice
+from ..utils.workers import WorkerState
+from .declarative import CompiledOffers, compile_offers
+from .index import OfferIndex
+from .offer import Offer
+from .stubs import PriceStub
+from array import array
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Result = Union[Tuple[float, float], Exception]
+
+# Each worker process prices baskets with its own copy of the batch pricer
+# which is sent once when the pool starts rather than with every task.
+WORKER: WorkerState["BatchPricer"] = WorkerState()
+
+
+@dataclass
+class BatchTotals:
+    sub_totals: "array[float]"
+    discounts: "array[float]"
+    totals: "array[float]"
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+
+class BatchPricer:
+    def __init__(
+        self, catalogue: CatalogueLike, offers: Optional[List[Offer]] = None
+    ) -> None:
+        """
+        Initialize a BatchPricer instance.
+
+        A batch pricer prices many baskets against one catalogue and list of
+        offers. The offer index and compiled offers are built once and reused
+        for every basket.
+
+        Args:
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Offer]], optional): A list of offers to modify that
+            modify the final prices of items in the basket. Defaults to None.
+        """
+        self.catalogue = catalogue
+
+        # We use None over [] as the default argument since it's immutable.
+        self.offers = [] if offers is None else offers
+
+        self.index = OfferIndex(self.offers)
+        self.compiled = compile_offers(self.offers)
+
+    def price(self, basket: Basket) -> Tuple[float, float]:
+        """
+        Price a single basket.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+
+        Returns:
+            Tuple[float, float]: Sub-total and total.
+        """
+        return self._price(basket, {})
+
+    def price_each(self, baskets: Iterable[Basket]) -> List[Result]:
+        """
+        Price each basket, returning errors rather than raising them.
+
+        Args:
+            baskets (Iterable[Basket]): Baskets of items and their quantities.
+
+        Returns:
+            List[Result]: Sub-total and total or the error raised for each basket.
+        """
+        results: List[Result] = []
+        prices: Dict[str, float] = {}
+
+        for basket in baskets:
+            try:
+                results.append(self._price(basket, prices))
+            except Exception as error:  # pylint: disable=W0718
+                results.append(error)
+
+        return results
+
+    def price_many(
+        self,
+        baskets: Iterable[Basket],
+        processes: Optional[int] = None,
+        chunksize: int = 1024,
+    ) -> BatchTotals:
+        """
+        Price many baskets.
+
+        Args:
+            baskets (Iterable[Basket]): Baskets of items and their quantities.
+            processes (Optional[int], optional): Number of worker processes.
+            Defaults to None which prices the baskets in this process.
+            chunksize (int, optional): Number of baskets sent to a worker
+            process at a time. Defaults to 1024.
+
+        Raises:
+            UnknownPrice: A product in a basket is not listed in the catalogue.
+
+        Returns:
+            BatchTotals: Sub-totals, discounts and totals in basket order.
+        """
+        totals = BatchTotals(array("d"), array("d"), array("d"))
+
+        if processes is None:
+            prices: Dict[str, float] = {}
+            self._collect((self._price(basket, prices) for basket in baskets), totals)
+
+        else:
+            with Pool(processes, initialize_worker, (self,)) as pool:
+                results = pool.imap(worker_price_each, _chunks(baskets, chunksize))
+
+                # Errors are returned by the workers and raised here so the
+                # first failing basket stops the batch.
+                self._collect(
+                    (
+                        _raise(result)
+                        for chunk_results in results
+                        for result in chunk_results
+                    ),
+                    totals,
+                )
+
+        return totals
+
+    def _price(self, basket: Basket, prices: Dict[str, float]) -> Tuple[float, float]:
+        catalogue = self.catalogue
+
+        # Each product is looked up in the catalogue once per batch and then
+        # read from the dict, which is much cheaper than a packed or shared
+        # catalogue lookup for products that appear in many baskets.
+        for name in basket.contents:
+            if name not in prices:
+                if name not in catalogue:
+                    raise UnknownPrice(name, catalogue.product_names)
+
+                prices[name] = catalogue.price(name)
+
+        offers = self.index.relevant(basket.contents)
+
+        # Any subset of compilable offers can also be compiled.
+        if self.compiled is not None and offers:
+            return CompiledOffers(offers).evaluate(  # type: ignore
+                basket.contents, prices.__getitem__
+            )
+
+        stubs_list = [
+            stub
+            for name, quantity in basket.items()
+            for stub in [PriceStub(name, prices[name])] * quantity
+        ]
+
+        sub_total = sum(stub.price for stub in stubs_list)
+
+        for offer in offers:
+            stubs_list = offer.transform(stubs_list)
+
+        return sub_total, sum(max(stub.price, 0) for stub in stubs_list)
+
+    @staticmethod
+    def _collect(results: Iterable[Tuple[float, float]], totals: BatchTotals) -> None:
+        for sub_total, total in results:
+            totals.sub_totals.append(sub_total)
+            totals.discounts.append(sub_total - total)
+            totals.totals.append(total)
+
+
+def initialize_worker(pricer: BatchPricer) -> None:
+    """
+    Set the batch pricer used by worker_price_each in this process.
+
+    This is used as a process pool initializer so the pricer is sent to each
+    worker once rather than with every task.
+
+    Args:
+        pricer (BatchPricer): Batch pricer.
+    """
+    WORKER.set(pricer)
+
+
+def worker_price_each(baskets: List[Basket]) -> List[Result]:
+    """
+    Price each basket with the worker's batch pricer.
+
+    Errors that can't be rebuilt in another process are replaced with a
+    RuntimeError holding their message, since a result that fails to unpickle
+    stops the pool from returning any further results.
+
+    Args:
+        baskets (List[Basket]): Baskets of items and their quantities.
+
+    Returns:
+        List[Result]: Sub-total and total or the error raised for each basket.
+    """
+    return [
+        _portable(result) if isinstance(result, Exception) else result
+        for result in WORKER.get().price_each(baskets)
+    ]
+
+
+def _chunks(baskets: Iterable[Basket], size: int) -> Iterable[List[Basket]]:
+    chunk: List[Basket] = []
+
+    for basket in baskets:
+        chunk.append(basket)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _raise(result: Result) -> Tuple[float, float]:
+    if isinstance(result, Exception):
+        raise result
+
+    return result
+
+
+def _portable(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:  # pylint: disable=W0718
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+    return error
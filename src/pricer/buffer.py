@@ -0,0 +1,214 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .offer import BaseOffer, Offer
+from .pricer import QuantityPricer
+from .stubs import PriceStub
+from array import array
+from dataclasses import dataclass
+from functools import partial
+from itertools import groupby
+from typing import Callable, Dict, List, Optional, Union
+
+
+class PriceBuffer:
+    def __init__(self) -> None:
+        """
+        Initialize a PriceBuffer instance.
+
+        A price buffer holds the price of every unit in a basket in one
+        contiguous array. The units of each product occupy a contiguous span
+        so offers can rewrite only the slots of the products they target.
+        """
+        self.prices: "array[float]" = array("d")
+        self.spans: Dict[str, range] = {}
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @classmethod
+    def from_stubs(cls, stubs_list: List[PriceStub]) -> "PriceBuffer":
+        """
+        Create a price buffer from a list of price stubs.
+
+        Args:
+            stubs_list (List[PriceStub]): List of price stubs where the stubs
+            of each product are consecutive.
+
+        Raises:
+            ValueError: The stubs of a product are not consecutive.
+
+        Returns:
+            PriceBuffer: Price buffer.
+        """
+        buffer = cls()
+
+        for name, stubs in groupby(stubs_list, lambda stub: stub.name):
+            if name in buffer.spans:
+                raise ValueError(f"Price stubs for: '{name}' are not consecutive")
+
+            start = len(buffer.prices)
+            buffer.prices.extend(stub.price for stub in stubs)
+            buffer.spans[name] = range(start, len(buffer.prices))
+
+        return buffer
+
+    def extend(self, name: str, price: float, quantity: int) -> None:
+        """
+        Append the units of a product to the buffer.
+
+        Args:
+            name (str): Product name.
+            price (float): Unit price.
+            quantity (int): Number of units.
+        """
+        start = len(self.prices)
+        self.prices.extend([price] * quantity)
+        self.spans[name] = range(start, len(self.prices))
+
+    def span(self, name: str) -> range:
+        """
+        Get the slots of a product's units.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            range: Slots of the product's units, which is empty if
+            the product is not in the buffer.
+        """
+        return self.spans.get(name, range(0))
+
+    def scale(self, name: str, factor: float) -> None:
+        """
+        Multiply the price of every unit of a product.
+
+        Args:
+            name (str): Product name.
+            factor (float): Price multiplier.
+        """
+        for i in self.span(name):
+            self.prices[i] *= factor
+
+    def stubs_list(self) -> List[PriceStub]:
+        """
+        Convert the buffer into a list of price stubs.
+
+        Returns:
+            List[PriceStub]: List of price stubs.
+        """
+        return [
+            PriceStub(name, self.prices[i])
+            for name, span in self.spans.items()
+            for i in span
+        ]
+
+    def total(self) -> float:
+        """
+        Sum the prices in the buffer, dropping negative prices to zero.
+
+        Returns:
+            float: Total cost.
+        """
+        return sum(max(price, 0) for price in self.prices)
+
+
+@dataclass
+class BufferOffer(BaseOffer[Callable[[PriceBuffer], None]]):
+    def to_offer(self) -> Offer:
+        """
+        Adapt the offer to operate on price stubs.
+
+        The stubs are copied into a price buffer, the offer is applied and
+        the buffer is converted back into stubs. The stubs of each product
+        must be consecutive.
+
+        Returns:
+            Offer: An equivalent price stub offer.
+        """
+        return Offer(self.title, partial(_restore, self.transform), self.products)
+
+
+class BufferPricer(QuantityPricer):
+    def __init__(
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Union[Offer, BufferOffer]]] = None,
+    ) -> None:
+        """
+        Initialize a BufferPricer instance.
+
+        A buffer pricer runs its offers over a single shared price buffer.
+        Buffer offers rewrite the slots they target in place so no list of
+        price stubs is copied between offers. Price stub offers are adapted
+        by converting the buffer to price stubs and writing the transformed
+        prices back, which requires them to preserve the order of the stubs.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Union[Offer, BufferOffer]]], optional): A list of
+            offers that modify the final prices of items in the basket.
+            Defaults to None.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+        """
+        super().__init__(basket, catalogue, offers)  # type: ignore
+
+    @property
+    def buffer(self) -> PriceBuffer:
+        """
+        Get the price buffer after applying every offer.
+
+        Raises:
+            ValueError: A price stub offer changed the number or order of
+            the price stubs.
+
+        Returns:
+            PriceBuffer: Price buffer.
+        """
+
+        def compute() -> PriceBuffer:
+            buffer = PriceBuffer()
+
+            for name, quantity in self.basket.items():
+                buffer.extend(name, self.catalogue.price(name), quantity)
+
+            for offer in self.relevant_offers:
+                if isinstance(offer, BufferOffer):
+                    offer.transform(buffer)
+                else:
+                    _apply_stubs(offer, buffer)
+
+            return buffer
+
+        return self._memo("buffer", compute)
+
+    def _total(self) -> float:
+        return self.buffer.total()
+
+
+def _apply_stubs(offer: Offer, buffer: PriceBuffer) -> None:
+    stubs_list = offer.transform(buffer.stubs_list())
+
+    if len(stubs_list) != len(buffer):
+        raise ValueError(f"Offer: '{offer.title}' changed the number of price stubs")
+
+    # Prices are written back by position so each stub must still be in the
+    # slot of the product it was created for.
+    names = [name for name, span in buffer.spans.items() for _ in span]
+
+    for i, stub in enumerate(stubs_list):
+        if stub.name != names[i]:
+            raise ValueError(f"Offer: '{offer.title}' changed the order of price stubs")
+
+        buffer.prices[i] = stub.price
+
+
+def _restore(
+    transform: Callable[[PriceBuffer], None], stubs_list: List[PriceStub]
+) -> List[PriceStub]:
+    buffer = PriceBuffer.from_stubs(stubs_list)
+    transform(buffer)
+    return buffer.stubs_list()
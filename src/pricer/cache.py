@@ -0,0 +1,144 @@
+from ..basket.basket import Basket
+from ..basket.snapshot import BasketSnapshot
+from ..catalogue.catalogue import CatalogueLike
+from .offer import Offer
+from .pricer import Pricer
+from .quote import Quote
+from .versioning import OfferVersioning
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Callable, List, Optional, Tuple, Union
+
+Key = Tuple[BasketSnapshot, Tuple[int, ...]]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the fraction of lookups that were answered from the cache.
+
+        Returns:
+            float: Hit rate between 0 and 1.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PriceCache(OfferVersioning):
+    def __init__(
+        self,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Offer]] = None,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """
+        Initialize a PriceCache instance.
+
+        A price cache remembers the quotes of baskets it has priced so that
+        identical baskets are priced with a single dictionary lookup. Quotes
+        are keyed by a snapshot of the basket and the catalogue and offer
+        versions, so changing a price or the offers never returns a stale
+        quote. The least recently used quote is evicted once the cache is
+        full and quotes older than the time to live are dropped.
+
+        Args:
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Offer]], optional): A list of offers to modify that
+            modify the final prices of items in the basket. Defaults to None.
+            max_entries (int, optional): Maximum number of cached quotes.
+            Defaults to 1024.
+            ttl (Optional[float], optional): Seconds a quote stays valid.
+            Defaults to None which keeps quotes until they are evicted.
+            clock (Callable[[], float], optional): Time source in seconds.
+            Defaults to time.monotonic.
+        """
+        self.catalogue = catalogue
+        self._init_offers(offers)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[Key, Tuple[Quote, float]]" = OrderedDict()
+    def __len__(self) -> int:
+        """
+        Get the number of cached quotes.
+
+        Returns:
+            int: Number of cached quotes.
+        """
+        return len(self._entries)
+
+    @property
+    def version(self) -> Tuple[int, ...]:
+        """
+        Get a token identifying the current catalogue and offers.
+
+        Returns:
+            Tuple[int, ...]: Version token.
+        """
+        return (
+            id(self.catalogue),
+            self.catalogue.version,
+            *self.offers_version,
+        )
+
+    def clear(self) -> None:
+        """
+        Drop every cached quote.
+        """
+        self._entries.clear()
+
+    def price(self, basket: Union[Basket, BasketSnapshot]) -> Quote:
+        """
+        Price a basket, reusing the quote of an identical basket if cached.
+
+        Args:
+            basket (Union[Basket, BasketSnapshot]): A basket or a snapshot of one.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+
+        Returns:
+            Quote: Sub-total, discount and total of the basket.
+        """
+        snapshot = (
+            basket if isinstance(basket, BasketSnapshot) else BasketSnapshot(basket)
+        )
+        key = (snapshot, self.version)
+        now = self.clock()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            quote, expires = entry
+
+            if now < expires:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return quote
+
+            del self._entries[key]
+            self.stats.expirations += 1
+
+        self.stats.misses += 1
+        pricer = Pricer(snapshot.basket(), self.catalogue, self.offers)
+        quote = Quote(pricer.sub_total, pricer.discount, pricer.total)
+
+        expires = float("inf") if self.ttl is None else now + self.ttl
+        self._entries[key] = (quote, expires)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+        return quote
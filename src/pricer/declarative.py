@@ -0,0 +1,387 @@
+from .exceptions import OfferParameterError
+from .offer import Offer
+from .stubs import PriceStub
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (Any, Callable, Dict, Iterable, List, Mapping, Optional,
+                    Set, Tuple)
+
+Prices = Callable[[str], float]
+
+
+class DeclarativeOffer(Offer, ABC):
+    def __init__(self, title: str, products: Iterable[str]) -> None:
+        """
+        Initialize a DeclarativeOffer instance.
+
+        Declarative offers can be applied to price stubs like any other offer
+        but can also be evaluated in closed form from product quantities.
+
+        Args:
+            title (str): Offer title.
+            products (Iterable[str]): Names of the products the offer reads.
+        """
+        super().__init__(title, self.apply, frozenset(products))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.title!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return False
+
+        return self.parameters == other.parameters  # type: ignore
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """
+        Get the parameters that define the offer.
+
+        Returns:
+            Dict[str, Any]: Offer parameters.
+        """
+        return {k: v for k, v in vars(self).items() if k != "transform"}
+
+    @abstractmethod
+    def discount(self, quantities: Mapping[str, int], prices: Prices) -> float:
+        """
+        Get the amount the offer discounts from the undiscounted prices.
+
+        Args:
+            quantities (Mapping[str, int]): Product quantities.
+            prices (Prices): Product price lookup.
+
+        Returns:
+            float: Discount amount.
+        """
+
+    @abstractmethod
+    def apply(self, stubs_list: List[PriceStub]) -> List[PriceStub]:
+        """
+        Apply the offer to a list of price stubs.
+
+        Args:
+            stubs_list (List[PriceStub]): List of price stubs.
+
+        Returns:
+            List[PriceStub]: List of price stubs after applying the offer.
+        """
+
+
+class BuyNForM(DeclarativeOffer):
+    def __init__(self, product: str, n: int, m: int) -> None:
+        """
+        Initialize a BuyNForM instance.
+
+        Every complete group of n units of the product costs the price of m units.
+
+        Args:
+            product (str): Product name.
+            n (int): Number of units in a group.
+            m (int): Number of units paid for in a group.
+
+        Raises:
+            OfferParameterError: n is not positive or m is not between 1 and n.
+        """
+        if not n > 0:
+            raise OfferParameterError("BuyNForM", "n", n)
+
+        if not 0 < m <= n:
+            raise OfferParameterError("BuyNForM", "m", m)
+
+        super().__init__(f"Buy {n} {product} for the price of {m}", [product])
+        self.product = product
+        self.n = n
+        self.m = m
+
+    def discount(self, quantities: Mapping[str, int], prices: Prices) -> float:
+        groups = quantities.get(self.product, 0) // self.n
+
+        if groups == 0:
+            return 0
+
+        return groups * (self.n - self.m) * prices(self.product)
+
+    def apply(self, stubs_list: List[PriceStub]) -> List[PriceStub]:
+        free = (
+            sum(1 for stub in stubs_list if stub.name == self.product)
+            // self.n
+            * self.n
+        )
+        stubs: List[PriceStub] = []
+        position = 0
+
+        for stub in stubs_list:
+            if stub.name == self.product:
+                if position < free and position % self.n >= self.m:
+                    # Multiplying by zero keeps the price type, so integer
+                    # prices in minor units stay integers.
+                    stub = PriceStub(stub.name, stub.price * 0)
+                position += 1
+
+            stubs.append(stub)
+
+        return stubs
+
+
+class BuyOneGetOneFree(BuyNForM):
+    def __init__(self, product: str) -> None:
+        """
+        Initialize a BuyOneGetOneFree instance.
+
+        Args:
+            product (str): Product name.
+        """
+        super().__init__(product, 2, 1)
+        self.title = f"Buy one {product} get one free"
+
+
+class PercentageOff(DeclarativeOffer):
+    def __init__(self, product: str, percent: float) -> None:
+        """
+        Initialize a PercentageOff instance.
+
+        Args:
+            product (str): Product name.
+            percent (float): Percentage discounted from every unit.
+
+        Raises:
+            OfferParameterError: The percentage is not between 0 and 100.
+        """
+        if not 0 <= percent <= 100:
+            raise OfferParameterError("PercentageOff", "percent", percent)
+
+        super().__init__(f"{percent:g}% off {product}", [product])
+        self.product = product
+        self.percent = percent
+
+    def discount(self, quantities: Mapping[str, int], prices: Prices) -> float:
+        quantity = quantities.get(self.product, 0)
+
+        if quantity == 0:
+            return 0
+
+        price = prices(self.product)
+        return quantity * (price - self.discounted(price))
+
+    def apply(self, stubs_list: List[PriceStub]) -> List[PriceStub]:
+        return [
+            PriceStub(stub.name, self.discounted(stub.price))
+            if stub.name == self.product
+            else stub
+            for stub in stubs_list
+        ]
+
+    def discounted(self, price: float) -> float:
+        """
+        Get the discounted price of a unit.
+
+        Integer prices in minor units are rounded half to even. Negative
+        prices are dropped to zero as they are when totalling price stubs.
+
+        Args:
+            price (float): Unit price.
+
+        Returns:
+            float: Discounted unit price.
+        """
+        if isinstance(price, int):
+            return max(round(price - price * self.percent / 100), 0)
+
+        return max(price - price * self.percent / 100, 0)
+
+
+class MultiBuy(DeclarativeOffer):
+    def __init__(self, product: str, quantity: int, price: float) -> None:
+        """
+        Initialize a MultiBuy instance.
+
+        Every complete group of units of the product costs a fixed price.
+
+        Args:
+            product (str): Product name.
+            quantity (int): Number of units in a group.
+            price (float): Price of a group.
+
+        Raises:
+            OfferParameterError: The quantity is not positive or the price is negative.
+        """
+        if not quantity > 0:
+            raise OfferParameterError("MultiBuy", "quantity", quantity)
+
+        if not price >= 0:
+            raise OfferParameterError("MultiBuy", "price", price)
+
+        super().__init__(f"{quantity} {product} for {price:g}", [product])
+        self.product = product
+        self.quantity = quantity
+        self.price = price
+
+    def discount(self, quantities: Mapping[str, int], prices: Prices) -> float:
+        groups = quantities.get(self.product, 0) // self.quantity
+
+        if groups == 0:
+            return 0
+
+        return groups * (self.quantity * prices(self.product) - self.price)
+
+    def apply(self, stubs_list: List[PriceStub]) -> List[PriceStub]:
+        grouped = (
+            sum(1 for stub in stubs_list if stub.name == self.product)
+            // self.quantity
+            * self.quantity
+        )
+        stubs: List[PriceStub] = []
+        position = 0
+
+        # Integer group prices in minor units are split into whole units with
+        # the remainder spread over the first units of each group.
+        exact = isinstance(self.price, int)
+        share, remainder = divmod(self.price, self.quantity)
+
+        for stub in stubs_list:
+            if stub.name == self.product:
+                if position < grouped and exact and isinstance(stub.price, int):
+                    extra = 1 if position % self.quantity < remainder else 0
+                    stub = PriceStub(stub.name, share + extra)
+                elif position < grouped:
+                    stub = PriceStub(stub.name, self.price / self.quantity)
+                position += 1
+
+            stubs.append(stub)
+
+        return stubs
+
+
+class BundlePrice(DeclarativeOffer):
+    def __init__(self, products: Iterable[str], price: float) -> None:
+        """
+        Initialize a BundlePrice instance.
+
+        Every complete set of one unit of each product costs a fixed price.
+
+        Args:
+            products (Iterable[str]): Product names in the bundle.
+            price (float): Price of a bundle.
+
+        Raises:
+            OfferParameterError: The bundle is empty, lists a product more than
+            once or the price is negative.
+        """
+        names = tuple(sorted(products))
+
+        if not names or len(set(names)) != len(names):
+            raise OfferParameterError("BundlePrice", "products", list(names))
+
+        if not price >= 0:
+            raise OfferParameterError("BundlePrice", "price", price)
+
+        super().__init__(f"{' + '.join(names)} for {price:g}", names)
+        self.names = names
+        self.price = price
+
+    def discount(self, quantities: Mapping[str, int], prices: Prices) -> float:
+        bundles = min(quantities.get(name, 0) for name in self.names)
+
+        if bundles == 0:
+            return 0
+
+        return bundles * (sum(prices(name) for name in self.names) - self.price)
+
+    def apply(self, stubs_list: List[PriceStub]) -> List[PriceStub]:
+        counts = {name: 0 for name in self.names}
+        unit_prices: Dict[str, float] = {}
+
+        for stub in stubs_list:
+            if stub.name in counts:
+                counts[stub.name] += 1
+                unit_prices.setdefault(stub.name, stub.price)
+
+        bundles = min(counts.values())
+
+        if bundles == 0:
+            return stubs_list
+
+        # Bundled units are scaled so the units in each bundle sum to its price.
+        # Integer prices in minor units are rounded down and the remainder is
+        # added to the first product in the bundle.
+        scale = self.price / sum(unit_prices.values())
+        bundled = {name: price * scale for name, price in unit_prices.items()}
+
+        if all(isinstance(p, int) for p in (self.price, *unit_prices.values())):
+            bundled = {
+                name: price * self.price // sum(unit_prices.values())
+                for name, price in unit_prices.items()
+            }
+            bundled[self.names[0]] += self.price - sum(bundled.values())
+
+        positions = {name: 0 for name in self.names}
+        stubs: List[PriceStub] = []
+
+        for stub in stubs_list:
+            if stub.name in positions:
+                if positions[stub.name] < bundles:
+                    stub = PriceStub(stub.name, bundled[stub.name])
+                positions[stub.name] += 1
+
+            stubs.append(stub)
+
+        return stubs
+
+
+@dataclass
+class CompiledOffers:
+    offers: List[DeclarativeOffer]
+
+    def evaluate(
+        self, quantities: Mapping[str, int], prices: Prices
+    ) -> Tuple[float, float]:
+        """
+        Evaluate the sub-total and total of a basket in closed form.
+
+        Args:
+            quantities (Mapping[str, int]): Product quantities.
+            prices (Prices): Product price lookup.
+
+        Returns:
+            Tuple[float, float]: Sub-total and total.
+        """
+        sub_total = sum(
+            prices(name) * quantity for name, quantity in quantities.items()
+        )
+        discount = sum(offer.discount(quantities, prices) for offer in self.offers)
+        return sub_total, sub_total - discount
+
+
+def compile_offers(offers: List[Offer]) -> Optional[CompiledOffers]:
+    """
+    Compile a list of offers into a closed form evaluation.
+
+    Offers can only be compiled when they are all declarative and no product
+    is targeted by more than one offer, since only then are their discounts
+    independent of the order they are applied in. An empty list of offers is
+    not compiled so that the basket is totalled unit by unit.
+
+    Args:
+        offers (List[Offer]): List of offers.
+
+    Returns:
+        Optional[CompiledOffers]: Compiled offers or None if they can't be compiled.
+    """
+    if not offers:
+        return None
+
+    targeted: Set[str] = set()
+
+    for offer in offers:
+        if not isinstance(offer, DeclarativeOffer):
+            return None
+
+        products = offer.products or frozenset()
+
+        if targeted & products:
+            return None
+
+        targeted |= products
+
+    return CompiledOffers(offers)  # type: ignore
@@ -0,0 +1,335 @@
+import json
+from .declarative import (BundlePrice, BuyNForM, BuyOneGetOneFree,
+                          DeclarativeOffer, MultiBuy, PercentageOff)
+from .exceptions import (OfferDefinitionError, OfferFormatError,
+                         OfferParameterError)
+from hashlib import blake2b
+from math import isfinite
+from os.path import exists
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    tomllib = None  # type: ignore
+
+# Each offer type is named in definitions by a key and built from its
+# parameters in the order its constructor takes them.
+TYPES: Dict[str, Tuple[Type[DeclarativeOffer], Tuple[str, ...]]] = {
+    "buy_n_for_m": (BuyNForM, ("product", "n", "m")),
+    "buy_one_get_one_free": (BuyOneGetOneFree, ("product",)),
+    "percentage_off": (PercentageOff, ("product", "percent")),
+    "multi_buy": (MultiBuy, ("product", "quantity", "price")),
+    "bundle_price": (BundlePrice, ("products", "price")),
+}
+
+NAMES = {cls: name for name, (cls, _) in TYPES.items()}
+CODES = {name: code for code, name in enumerate(TYPES)}
+CODED = list(TYPES.values())
+
+PARAMETERS: Dict[str, Any] = {
+    "product": str,
+    "products": list,
+    "n": int,
+    "m": int,
+    "quantity": int,
+    "percent": (int, float),
+    "price": (int, float),
+}
+
+EXTENSIONS = (".json", ".toml", ".bin")
+
+# Packed offers are laid out as a header with a magic string, a digest of
+# the definitions they were compiled from, the number of offers and the size
+# of the string table. The string table holds every product name separated
+# by null bytes and is followed by one fixed size record per offer. Records
+# are the offer's type code, a bit for each number that was an integer and
+# then its parameters, with names stored as indexes into the string table
+# and prices stored as doubles which are exact for integers below 2 ** 53.
+MAGIC = b"SHOPOFR\x01"
+HEADER = Struct("<8s16sQQ")
+LAYOUTS = {"product": "I", "products": "II", "n": "q", "m": "q", "quantity": "q"}
+RECORDS = [
+    Struct("<BB" + "".join(LAYOUTS.get(parameter, "d") for parameter in parameters))
+    for _, parameters in TYPES.values()
+]
+
+
+def parse_offers(document: Mapping[str, Any]) -> List[DeclarativeOffer]:
+    """
+    Build offers from a document of offer definitions.
+
+    >>> parse_offers({"offers": [{"type": "buy_one_get_one_free", "product": "a"}]})
+    [BuyOneGetOneFree('Buy one a get one free')]
+
+    Args:
+        document (Mapping[str, Any]): Document with a list of offer definitions.
+
+    Raises:
+        OfferDefinitionError: A definition has an unknown type or invalid parameters.
+
+    Returns:
+        List[DeclarativeOffer]: Offers in the order they are defined.
+    """
+    definitions = document.get("offers") if isinstance(document, Mapping) else None
+
+    if not isinstance(definitions, list):
+        raise OfferDefinitionError(document)
+
+    return [_parse(definition) for definition in definitions]
+
+
+def format_offers(offers: List[DeclarativeOffer]) -> Dict[str, Any]:
+    """
+    Convert offers into a document of offer definitions.
+
+    Args:
+        offers (List[DeclarativeOffer]): Offers with a known type.
+
+    Raises:
+        OfferDefinitionError: An offer does not have a known type.
+
+    Returns:
+        Dict[str, Any]: Document that can be written as json or toml.
+    """
+    return {
+        "offers": [{"type": _name(offer), **_arguments(offer)} for offer in offers]
+    }
+
+
+def pack_offers(offers: List[DeclarativeOffer], digest: bytes = bytes(16)) -> bytes:
+    """
+    Pack offers into the packed offers format.
+
+    Args:
+        offers (List[DeclarativeOffer]): Offers with a known type.
+        digest (bytes, optional): Digest of the definitions the offers were
+        built from. Defaults to zeros.
+
+    Raises:
+        OfferDefinitionError: An offer does not have a known type.
+        OfferFormatError: An integer parameter does not fit in 64 bits.
+
+    Returns:
+        bytes: Packed offers.
+    """
+    strings: List[str] = []
+    positions: Dict[str, int] = {}
+    records = [_pack_record(offer, strings, positions) for offer in offers]
+
+    table = "\0".join(strings).encode()
+    header = HEADER.pack(MAGIC, digest, len(offers), len(table))
+    return b"".join([header, table, *records])
+
+
+def unpack_offers(buffer: bytes, source: str = "<buffer>") -> List[DeclarativeOffer]:
+    """
+    Build offers from the packed offers format.
+
+    Args:
+        buffer (bytes): Packed offers.
+        source (str, optional): Description of the buffer used in errors.
+        Defaults to "<buffer>".
+
+    Raises:
+        OfferFormatError: The buffer is not in the packed offers format.
+
+    Returns:
+        List[DeclarativeOffer]: Offers in the order they were packed.
+    """
+    try:
+        magic, _, count, size = HEADER.unpack_from(buffer)
+
+        if magic != MAGIC:
+            raise OfferFormatError(source)
+
+        offset = HEADER.size + size
+        table = bytes(buffer[HEADER.size : offset]).decode()
+        names = table.split("\0") if table else []
+        offers: List[DeclarativeOffer] = []
+
+        for _ in range(count):
+            offer, offset = _unpack_record(buffer, offset, names, source)
+            offers.append(offer)
+
+    # Struct errors are raised when the buffer is cut short.
+    except (
+        IndexError,
+        OfferParameterError,
+        StructError,
+        UnicodeDecodeError,
+    ) as error:
+        raise OfferFormatError(source) from error
+
+    return offers
+
+
+def read_offers(path: str, cache: Optional[str] = None) -> List[DeclarativeOffer]:
+    """
+    Read offers from a json or toml definitions file or a packed offers file.
+
+    When a cache path is given the definitions are only parsed if the cache
+    was not compiled from the same definitions, and the cache is rewritten.
+
+    Args:
+        path (str): Path to a file with a .json, .toml or .bin extension.
+        cache (Optional[str], optional): Path to a packed offers cache.
+        Defaults to None.
+
+    Raises:
+        ValueError: The file extension is not supported.
+        OfferDefinitionError: A definition has an unknown type or invalid parameters.
+        OfferFormatError: A .bin file is not in the packed offers format.
+
+    Returns:
+        List[DeclarativeOffer]: Offers in the order they are defined.
+    """
+    if not path.endswith(EXTENSIONS):
+        raise ValueError(f"Unsupported offers file: {path}")
+
+    if path.endswith(".toml") and tomllib is None:
+        raise ValueError(f"Reading toml offers requires Python 3.11: {path}")
+
+    with open(path, "rb") as stream:
+        source = stream.read()
+
+    if path.endswith(".bin"):
+        return unpack_offers(source, path)
+
+    digest = blake2b(source, digest_size=16).digest()
+
+    if cache is not None and exists(cache):
+        with open(cache, "rb") as stream:
+            cached = stream.read()
+
+        if len(cached) >= HEADER.size and HEADER.unpack_from(cached)[1] == digest:
+            try:
+                return unpack_offers(cached, cache)
+            except OfferFormatError:
+                pass
+
+    if path.endswith(".toml"):
+        document = tomllib.loads(source.decode())
+    else:
+        document = json.loads(source)
+
+    offers = parse_offers(document)
+
+    if cache is not None:
+        with open(cache, "wb") as stream:
+            stream.write(pack_offers(offers, digest))
+
+    return offers
+
+
+def _parse(definition: Any) -> DeclarativeOffer:
+    if not isinstance(definition, Mapping) or definition.get("type") not in TYPES:
+        raise OfferDefinitionError(definition)
+
+    cls, parameters = TYPES[definition["type"]]
+
+    if set(definition) != {"type", *parameters} or not all(
+        _valid(parameter, definition[parameter]) for parameter in parameters
+    ):
+        raise OfferDefinitionError(definition)
+
+    # Ranges are checked by the offer itself so they are only defined once.
+    try:
+        return cls(*(definition[parameter] for parameter in parameters))
+    except OfferParameterError as error:
+        raise OfferDefinitionError(definition) from error
+
+
+def _valid(parameter: str, value: Any) -> bool:
+    if isinstance(value, bool) or not isinstance(value, PARAMETERS[parameter]):
+        return False
+
+    if parameter == "products":
+        return all(isinstance(name, str) for name in value)
+
+    return not isinstance(value, float) or isfinite(value)
+
+
+def _name(offer: DeclarativeOffer) -> str:
+    # Subclasses of the known types are not named since they may not be
+    # rebuilt from the same parameters.
+    name = NAMES.get(type(offer))
+
+    if name is None:
+        raise OfferDefinitionError(offer)
+
+    return name
+
+
+def _arguments(offer: DeclarativeOffer) -> Dict[str, Any]:
+    # Bundles store their products sorted under names.
+    return {
+        parameter: list(offer.names)  # type: ignore
+        if parameter == "products"
+        else getattr(offer, parameter)
+        for parameter in TYPES[_name(offer)][1]
+    }
+
+
+def _pack_record(
+    offer: DeclarativeOffer, strings: List[str], positions: Dict[str, int]
+) -> bytes:
+    # Product names are added to the string table as they are first seen.
+    code = CODES[_name(offer)]
+    values: List[Any] = []
+    integers = 0
+
+    for i, (parameter, value) in enumerate(_arguments(offer).items()):
+        if parameter == "product":
+            if value not in positions:
+                positions[value] = len(strings)
+                strings.append(value)
+
+            values.append(positions[value])
+        elif parameter == "products":
+            values.extend([len(strings), len(value)])
+            strings.extend(value)
+        elif parameter in LAYOUTS:
+            values.append(value)
+        else:
+            integers |= isinstance(value, int) << i
+            values.append(value)
+
+    # Struct errors are raised for integers that don't fit in 64 bits.
+    try:
+        return RECORDS[code].pack(code, integers, *values)
+    except StructError as error:
+        raise OfferFormatError(offer.title) from error
+
+
+def _unpack_record(
+    buffer: bytes, offset: int, names: List[str], source: str
+) -> Tuple[DeclarativeOffer, int]:
+    code = buffer[offset]
+    record = RECORDS[code]
+    _, integers, *values = record.unpack_from(buffer, offset)
+    cls, parameters = CODED[code]
+    arguments: List[Any] = []
+    i = 0
+
+    for bit, parameter in enumerate(parameters):
+        if parameter == "product":
+            arguments.append(names[values[i]])
+        elif parameter == "products":
+            products = names[values[i] : values[i] + values[i + 1]]
+
+            # Slices past the end of the string table are cut short silently.
+            if len(products) != values[i + 1]:
+                raise OfferFormatError(source)
+
+            arguments.append(products)
+            i += 1
+        elif integers >> bit & 1:
+            arguments.append(int(values[i]))
+        else:
+            arguments.append(values[i])
+        i += 1
+
+    return cls(*arguments), offset + record.size
@@ -0,0 +1,32 @@
+from ..utils.errors import PicklableError
+from typing import Any
+
+
+class OfferDefinitionError(PicklableError):
+    def __init__(self, definition: Any) -> None:
+        super().__init__(
+            f"""
+             Offer definitions must have a known type and its parameters.
+             Definition: {definition}
+             """
+        )
+
+
+class OfferFormatError(PicklableError):
+    def __init__(self, source: str) -> None:
+        super().__init__(
+            f"""
+             Offer data is not in the packed offers format.
+             Source: {source}
+             """
+        )
+
+
+class OfferParameterError(PicklableError):
+    def __init__(self, offer: str, parameter: str, value: Any) -> None:
+        super().__init__(
+            f"""
+             Offer parameters must be within their valid range.
+             Offer: {offer} has an invalid {parameter}: {value}
+             """
+        )
@@ -0,0 +1,171 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .offer import BaseOffer, Offer, Transform
+from .pricer import QuantityPricer
+from .stubs import PriceStub
+from dataclasses import dataclass
+from functools import partial, reduce
+from typing import List, Optional, Union
+
+
+@dataclass
+class PriceGroup:
+    name: str
+    price: float
+    quantity: int
+
+
+@dataclass
+class GroupOffer(BaseOffer[Transform[List[PriceGroup]]]):
+    @classmethod
+    def from_offer(cls, offer: Offer) -> "GroupOffer":
+        """
+        Adapt a price stub offer to operate on price groups.
+
+        The groups are expanded into price stubs, transformed by the offer
+        and then compressed back into groups. This is as expensive as the
+        original offer and should only be used as a fallback.
+
+        Args:
+            offer (Offer): A price stub offer.
+
+        Returns:
+            GroupOffer: An equivalent price group offer.
+        """
+        return cls(offer.title, partial(_adapt, offer.transform), offer.products)
+
+    def to_offer(self) -> Offer:
+        """
+        Adapt the offer to operate on price stubs.
+
+        The stubs are compressed into groups, transformed by the offer and
+        then expanded back into stubs.
+
+        Returns:
+            Offer: An equivalent price stub offer.
+        """
+        return Offer(self.title, partial(_restore, self.transform), self.products)
+
+
+def expand(groups_list: List[PriceGroup]) -> List[PriceStub]:
+    """
+    Expand a list of price groups into a list of price stubs.
+
+    Args:
+        groups_list (List[PriceGroup]): List of price groups.
+
+    Returns:
+        List[PriceStub]: List of price stubs.
+    """
+    return [
+        stub
+        for group in groups_list
+        for stub in [PriceStub(group.name, group.price)] * group.quantity
+    ]
+
+
+def compress(stubs_list: List[PriceStub]) -> List[PriceGroup]:
+    """
+    Compress consecutive price stubs with the same name and price into groups.
+
+    Args:
+        stubs_list (List[PriceStub]): List of price stubs.
+
+    Returns:
+        List[PriceGroup]: List of price groups.
+    """
+    groups_list: List[PriceGroup] = []
+
+    for stub in stubs_list:
+        if (
+            groups_list
+            and groups_list[-1].name == stub.name
+            and groups_list[-1].price == stub.price
+        ):
+            groups_list[-1].quantity += 1
+        else:
+            groups_list.append(PriceGroup(stub.name, stub.price, 1))
+
+    return groups_list
+
+
+def _adapt(
+    transform: Transform[List[PriceStub]], groups_list: List[PriceGroup]
+) -> List[PriceGroup]:
+    return compress(transform(expand(groups_list)))
+
+
+def _restore(
+    transform: Transform[List[PriceGroup]], stubs_list: List[PriceStub]
+) -> List[PriceStub]:
+    return expand(transform(compress(stubs_list)))
+
+
+class GroupPricer(QuantityPricer):
+    def __init__(
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Union[Offer, GroupOffer]]] = None,
+    ) -> None:
+        """
+        Initialize a GroupPricer instance.
+
+        A group pricer prices a basket as a list of (name, price, quantity)
+        groups so that its cost scales with the number of distinct products
+        rather than the number of units.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Union[Offer, GroupOffer]]], optional): A list of
+            offers that modify the final prices of items in the basket. Price stub
+            offers are adapted with GroupOffer.from_offer. Defaults to None.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+        """
+        super().__init__(basket, catalogue, offers)  # type: ignore
+
+    @property
+    def group_offers(self) -> List[GroupOffer]:
+        """
+        Get the offers as price group offers.
+
+        Returns:
+            List[GroupOffer]: List of price group offers.
+        """
+        return self._memo(
+            "group_offers",
+            lambda: [
+                offer if isinstance(offer, GroupOffer) else GroupOffer.from_offer(offer)
+                for offer in self.relevant_offers
+            ],
+        )
+
+    @property
+    def groups_list(self) -> List[PriceGroup]:
+        """
+        Converts the basket into a list of price groups consisting
+        of products, their current prices and their quantities.
+
+        Returns:
+            List[PriceGroup]: List of price groups.
+        """
+        return self._memo(
+            "groups_list",
+            lambda: [
+                PriceGroup(name, self.catalogue.price(name), quantity)
+                for name, quantity in self.basket.items()
+            ],
+        )
+
+    def _total(self) -> float:
+        return sum(
+            max(group.price, 0) * group.quantity
+            for group in reduce(
+                lambda groups_list, offer: offer.transform(groups_list),
+                self.group_offers,
+                self.groups_list,
+            )
+        )
@@ -0,0 +1,222 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .offer import Offer
+from .pricer import Pricer
+from .stubs import PriceStub
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class IncrementalPricer(Pricer):
+    def __init__(
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Offer]] = None,
+    ) -> None:
+        """
+        Initialize an IncrementalPricer instance.
+
+        An incremental pricer subscribes to its basket and, when a product is
+        added or removed, only reprices the products that share an offer with
+        it. Products are grouped into components that are connected by the
+        names declared in Offer.products. If any offer does not declare its
+        products the pricer falls back to repricing the whole basket.
+
+        Basket.add raises UnknownPrice when the product is not listed in the
+        catalogue, but the product stays in the basket since the pricer is
+        only notified after the change. The totals raise UnknownPrice until
+        the product is removed again.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Offer]], optional): A list of offers to modify that
+            modify the final prices of items in the basket. Defaults to None.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+        """
+        super().__init__(basket, catalogue, offers)
+
+        self._components: Dict[str, str] = {}
+        self._members: Dict[str, List[str]] = {}
+        self._component_offers: Dict[str, List[Offer]] = {}
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._totals = (_RunningSum(), _RunningSum())
+        self._incremental = False
+        self._built_state: Optional[Tuple[int, ...]] = None
+
+        self.basket.subscribe(self._reprice)
+
+    @property
+    def sub_total(self) -> float:
+        """
+        Get the value of all the items in the basket without offer applied.
+
+        Returns:
+            float: Sub-total value.
+        """
+        if not self._sync():
+            return super().sub_total
+
+        return self._totals[0].value
+
+    @property
+    def total(self) -> float:
+        """
+        Get the basket total cost after applying offers.
+
+        Returns:
+            float: Total cost.
+        """
+        if not self._sync():
+            return super().total
+
+        return self._totals[1].value
+
+    def close(self) -> None:
+        """
+        Unsubscribe the pricer from its basket.
+        """
+        self.basket.unsubscribe(self._reprice)
+
+    def _catalogue_state(self) -> Tuple[int, ...]:
+        # The basket is tracked through its listener so it is left out here.
+        return self.state[2:]
+
+    def _sync(self) -> bool:
+        if self._built_state != self._catalogue_state():
+            self._incremental = all(
+                offer.products is not None for offer in self.offers
+            )
+
+            if self._incremental:
+                self._build()
+            else:
+                self._built_state = self._catalogue_state()
+
+        return self._incremental
+
+    def _build(self) -> None:
+        # Products are connected by the offers that declare them using a
+        # union find so that each component can be priced independently.
+        parents: Dict[str, str] = {}
+
+        def find(name: str) -> str:
+            while parents.setdefault(name, name) != name:
+                name = parents[name]
+            return name
+
+        for offer in self.offers:
+            names = sorted(offer.products or [])
+
+            for name in names:
+                parents[find(name)] = find(names[0])
+
+        self._components = {name: find(name) for name in parents}
+        self._members = {}
+        self._component_offers = {}
+
+        for name, component in self._components.items():
+            self._members.setdefault(component, []).append(name)
+
+        for offer in self.offers:
+            if offer.products:
+                component = self._components[next(iter(offer.products))]
+                self._component_offers.setdefault(component, []).append(offer)
+
+        self._prices = {}
+        self._totals = (_RunningSum(), _RunningSum())
+
+        components: Set[str] = {
+            self._components.get(name, name) for name in self.basket
+        }
+
+        for component in components:
+            self._update(component)
+
+        # The pricer is only built once every component has been priced, so
+        # a product missing from the catalogue leaves it to be rebuilt.
+        self._built_state = self._catalogue_state()
+
+    def _reprice(self, name: str) -> None:
+        if self._incremental and self._built_state == self._catalogue_state():
+            try:
+                self._update(self._components.get(name, name))
+            except Exception:
+                # The pricer is rebuilt on the next read rather than left
+                # with a component that was only partly repriced.
+                self._built_state = None
+                raise
+
+    def _update(self, component: str) -> None:
+        # Products declared by an offer that are not in the basket are
+        # skipped so they don't need to be listed in the catalogue.
+        stubs_list = [
+            stub
+            for name in self._members.get(component, [component])
+            if self.basket.quantity(name)
+            for stub in [PriceStub(name, self.catalogue.price(name))]
+            * self.basket.quantity(name)
+        ]
+
+        prices = None
+
+        if stubs_list:
+            sub_total = sum(stub.price for stub in stubs_list)
+
+            for offer in self._component_offers.get(component, []):
+                stubs_list = offer.transform(stubs_list)
+
+            total = sum(max(stub.price, 0) for stub in stubs_list)
+            prices = (sub_total, total)
+
+        # The running totals only change by this component's old and new
+        # prices so updates don't depend on the size of the basket.
+        for running, old in zip(self._totals, self._prices.pop(component, (0, 0))):
+            running.add(-old)
+
+        if prices is not None:
+            self._prices[component] = prices
+
+            for running, new in zip(self._totals, prices):
+                running.add(new)
+
+
+class _RunningSum:
+    def __init__(self) -> None:
+        """
+        Initialize a _RunningSum instance.
+
+        A running sum uses Neumaier's compensated summation, which keeps the
+        rounding error of each addition, so adding and then subtracting
+        many amounts doesn't drift from the exact sum.
+        """
+        self._sum: Any = 0
+        self._error: Any = 0
+
+    @property
+    def value(self) -> Any:
+        """
+        Get the compensated sum.
+
+        Returns:
+            Any: Sum of the amounts added.
+        """
+        return self._sum + self._error
+
+    def add(self, amount: Any) -> None:
+        """
+        Add an amount to the sum.
+
+        Args:
+            amount (Any): Amount to add, which is negative to subtract it.
+        """
+        total = self._sum + amount
+
+        if abs(self._sum) >= abs(amount):
+            self._error += (self._sum - total) + amount
+        else:
+            self._error += (amount - total) + self._sum
+
+        self._sum = total
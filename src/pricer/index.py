@@ -0,0 +1,49 @@
+from .offer import Offer
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+
+@dataclass
+class OfferIndex:
+    offers: List[Offer]
+    products: Dict[str, List[int]] = field(repr=False)
+    universal: List[int] = field(repr=False)
+
+    def __init__(self, offers: List[Offer]) -> None:
+        """
+        Initialize an OfferIndex instance.
+
+        An offer index maps each product name to the positions of the offers
+        that declare it. Offers that do not declare their products are
+        relevant to every basket.
+
+        Args:
+            offers (List[Offer]): List of offers.
+        """
+        self.offers = offers
+        self.products = {}
+        self.universal = []
+
+        for i, offer in enumerate(offers):
+            if offer.products is None:
+                self.universal.append(i)
+            else:
+                for name in offer.products:
+                    self.products.setdefault(name, []).append(i)
+
+    def relevant(self, names: Iterable[str]) -> List[Offer]:
+        """
+        Get the offers that can affect a basket, in their original order.
+
+        Args:
+            names (Iterable[str]): Product names in the basket.
+
+        Returns:
+            List[Offer]: Relevant offers.
+        """
+        positions = set(self.universal)
+
+        for name in names:
+            positions.update(self.products.get(name, ()))
+
+        return [self.offers[i] for i in sorted(positions)]
@@ -1,12 +1,39 @@
 from .stubs import PriceStub
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, List, TypeVar
+from typing import Any, Callable, FrozenSet, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
 Transform = Callable[[T], T]
 
 
 @dataclass
-class Offer:
+class BaseOffer(Generic[F], ABC):
     title: str
-    transform: Transform[List[PriceStub]]
+    transform: F
+
+    # The names of the products the transform reads and modifies.
+    # Offers that leave this as None may read any product in the basket.
+    products: Optional[FrozenSet[str]] = None
+
+    @abstractmethod
+    def to_offer(self) -> "Offer":
+        """
+        Adapt the offer to operate on price stubs.
+
+        Returns:
+            Offer: An equivalent price stub offer.
+        """
+
+
+@dataclass
+class Offer(BaseOffer[Transform[List[PriceStub]]]):
+    def to_offer(self) -> "Offer":
+        """
+        Get the offer as a price stub offer, which it already is.
+
+        Returns:
+            Offer: The offer itself.
+        """
+        return self
@@ -1,46 +1,161 @@
 from ..basket.basket import Basket
-from ..catalogue.catalogue import Catalogue
+from ..catalogue.catalogue import CatalogueLike
 from ..catalogue.exceptions import UnknownPrice
+from .declarative import CompiledOffers, compile_offers
+from .index import OfferIndex
 from .offer import Offer
-from .stubs import PriceStub
+from .resolution import ConflictPolicy, Resolution, resolve
+from .stubs import PriceStub, PriceStubArray
+from .trace import Metrics, PricingTrace
+from .versioning import OfferVersioning
 from dataclasses import dataclass
-from functools import reduce
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 @dataclass
-class Pricer:
+class Pricer(OfferVersioning):
     basket: Basket
-    catalogue: Catalogue
+    catalogue: CatalogueLike
     offers: List[Offer]
 
     def __init__(
-        self, basket: Basket, catalogue: Catalogue, offers: Optional[List[Offer]] = None
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Offer]] = None,
+        trusted: bool = False,
     ) -> None:
         """
         Initialize a Pricer instance.
 
         Args:
             basket (Basket): A basket of items and their quantities.
-            catalogue (Catalogue): A catalogue of items and their prices.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
             offers (Optional[List[Offer]], optional): A list of offers to modify that
             modify the final prices of items in the basket. Defaults to None.
+            trusted (bool, optional): Skip checking every product in the basket
+            is in the catalogue. Defaults to False.
 
         Raises:
             UnknownPrice: A product in the basket is not listed in the catalogue.
         """
-        for product in basket:
-            if product not in catalogue:
-                raise UnknownPrice(product, catalogue.product_names)
+        if not trusted:
+            for product in basket:
+                if product not in catalogue:
+                    raise UnknownPrice(product, catalogue.product_names)
 
         self.basket = basket
         self.catalogue = catalogue
+        self._init_offers(offers)
+
+        self.trace: Optional[PricingTrace] = None
+        self.metrics: Optional[Metrics] = None
+        self._instrumented = False
+        self._index: Optional[OfferIndex] = None
+        self._index_state: Optional[Tuple[int, ...]] = None
+        self._cache: Dict[str, Any] = {}
+        self._cache_state: Optional[Tuple[int, ...]] = None
+
+    @property
+    def state(self) -> Tuple[int, ...]:
+        """
+        Get a token identifying the current basket, catalogue and offers.
+
+        The token changes whenever the basket or catalogue are replaced or
+        mutated through their methods, or the offers list is replaced,
+        resized or changed with add_offer and remove_offer.
+
+        Returns:
+            Tuple[int, ...]: State token.
+        """
+        return (
+            id(self.basket),
+            self.basket.version,
+            id(self.catalogue),
+            self.catalogue.version,
+            *self.offers_version,
+        )
+
+    @property
+    def stale(self) -> bool:
+        """
+        Check if cached results were computed before the basket, catalogue or
+        offers last changed.
+
+        Returns:
+            bool: True if the next result will be recomputed.
+        """
+        return self._cache_state is not None and self._cache_state != self.state
+
+    def _memo(self, key: str, compute: Callable[[], T]) -> T:
+        # Every cached value is dropped at once when the state changes.
+        state = self.state
+
+        if state != self._cache_state:
+            self._cache = {}
+            self._cache_state = state
+
+        if key not in self._cache:
+            self._cache[key] = compute()
+
+        return self._cache[key]  # type: ignore
+
+    def invalidate(self) -> None:
+        """
+        Drop all cached results.
+
+        This is only needed after mutating the basket contents, catalogue
+        products or offers list directly rather than through their methods.
+        """
+        self._cache = {}
+        self._cache_state = None
+
+    def instrument(
+        self, enabled: bool = True, metrics: Optional[Metrics] = None
+    ) -> None:
+        """
+        Record a trace of each offer applied when pricing the basket.
+
+        The trace of the latest pricing is stored in the trace attribute and
+        each offer trace is passed to the metrics callback. Offers are applied
+        one by one rather than evaluated in closed form while instrumented so
+        that every offer is traced.
+
+        Args:
+            enabled (bool, optional): Whether to record traces. Defaults to True.
+            metrics (Optional[Metrics], optional): Called with each offer trace.
+            Defaults to None.
+        """
+        self._instrumented = enabled
+        self.metrics = metrics
+        self.invalidate()
+
+    def resolve(
+        self,
+        policy: ConflictPolicy = ConflictPolicy.EXCLUSIVE,
+        budget: Optional[float] = 0.1,
+    ) -> Resolution:
+        """
+        Choose the combination of offers that minimises the basket total.
 
-        # We use None over [] as the default argument since it's immutable.
-        if offers is None:
-            self.offers = []
-        else:
-            self.offers = offers
+        Args:
+            policy (ConflictPolicy, optional): How overlapping offers can be
+            combined. Defaults to ConflictPolicy.EXCLUSIVE.
+            budget (Optional[float], optional): Seconds allowed for the search.
+            Defaults to 0.1. None allows an unbounded search.
+
+        Returns:
+            Resolution: Chosen offers in their original order and the basket total.
+        """
+        offers = self.stub_offers
+        resolution = resolve(self.basket, self.catalogue, offers, policy, budget)
+
+        # Adapted offers are swapped back for the offers they were adapted from.
+        originals = {id(a): o for a, o in zip(offers, self.relevant_offers)}
+        resolution.offers = [originals[id(offer)] for offer in resolution.offers]
+        return resolution
 
     @property
     def stubs_list(self) -> List[PriceStub]:
@@ -48,14 +163,142 @@ class Pricer:
         Converts the basket into a list of price stubs consisting
         of products and their current prices.
 
+        The list is cached so it must not be mutated by offers.
+
         Returns:
             List[PriceStub]: List of price stubs.
         """
-        return [
-            stub
-            for name, quantity in self.basket.items()
-            for stub in [PriceStub(name, self.catalogue.price(name))] * quantity
-        ]
+        return self._memo(
+            "stubs_list",
+            lambda: [
+                stub
+                for name, quantity in self.basket.items()
+                for stub in [PriceStub(name, self.catalogue.price(name))] * quantity
+            ],
+        )
+
+    @property
+    def stubs_array(self) -> PriceStubArray:
+        """
+        Converts the basket into a compact array of price stubs.
+
+        The array can be passed to offers in place of the list of price stubs
+        since it iterates as price stubs.
+
+        Returns:
+            PriceStubArray: Array of price stubs.
+        """
+
+        def compute() -> PriceStubArray:
+            stubs_array = PriceStubArray()
+
+            for name, quantity in self.basket.items():
+                stubs_array.extend(name, self.catalogue.price(name), quantity)
+
+            return stubs_array
+
+        return self._memo("stubs_array", compute)
+
+    @property
+    def stages(self) -> List[List[PriceStub]]:
+        """
+        Get the price stubs list after applying each relevant offer in turn.
+
+        Returns:
+            List[List[PriceStub]]: One list of price stubs per relevant offer.
+        """
+
+        def compute() -> List[List[PriceStub]]:
+            stages: List[List[PriceStub]] = []
+            stubs_list = self.stubs_list
+
+            if not self._instrumented:
+                for offer in self.stub_offers:
+                    stubs_list = offer.transform(stubs_list)
+                    stages.append(stubs_list)
+
+                return stages
+
+            self.trace = PricingTrace()
+
+            for offer in self.stub_offers:
+                stubs_list = self.trace.apply(offer, stubs_list, self.metrics)
+                stages.append(stubs_list)
+
+            return stages
+
+        return self._memo("stages", compute)
+
+    @property
+    def index(self) -> OfferIndex:
+        """
+        Get the index of offers by the products they declare.
+
+        The index is only rebuilt when the offers change.
+
+        Returns:
+            OfferIndex: Offer index.
+        """
+        state = self.offers_version
+
+        if self._index is None or state != self._index_state:
+            self._index = OfferIndex(self.offers)
+            self._index_state = state
+
+        return self._index
+
+    @property
+    def relevant_offers(self) -> List[Offer]:
+        """
+        Get the offers that can affect the basket, in their original order.
+
+        Returns:
+            List[Offer]: Offers that declare a product in the basket or
+            do not declare their products.
+        """
+        return self._memo(
+            "relevant_offers", lambda: self.index.relevant(self.basket.contents)
+        )
+
+    @property
+    def stub_offers(self) -> List[Offer]:
+        """
+        Get the relevant offers as price stub offers.
+
+        Offers written for other pricing modes are adapted to price stubs
+        with their to_offer method.
+
+        Returns:
+            List[Offer]: Price stub offers in their original order.
+        """
+        return self._memo(
+            "stub_offers",
+            lambda: [offer.to_offer() for offer in self.relevant_offers],
+        )
+
+    @property
+    def compiled(self) -> Optional[CompiledOffers]:
+        """
+        Get the offers compiled into a closed form evaluation.
+
+        Offers are not compiled while the pricer is instrumented.
+
+        Returns:
+            Optional[CompiledOffers]: Compiled offers or None if they can't be compiled.
+        """
+        if self._instrumented:
+            return None
+
+        return self._memo("compiled", lambda: compile_offers(self.relevant_offers))
+
+    def _evaluate(self) -> Tuple[float, float]:
+        # The compiled offers are only evaluated once for both totals.
+        return self._memo(
+            "evaluate",
+            lambda: self.compiled.evaluate(  # type: ignore
+                self.basket.contents, self.catalogue.price
+            ),
+        )
 
     @property
     def sub_total(self) -> float:
@@ -65,7 +308,10 @@ class Pricer:
         Returns:
             float: Sub-total value.
         """
-        return sum(stub.price for stub in self.stubs_list)
+        if self.compiled is not None:
+            return self._evaluate()[0]
+
+        return self._memo("sub_total", self._sub_total)
 
     @property
     def discount(self) -> float:
@@ -75,7 +321,7 @@ class Pricer:
         Returns:
             float: Total amount discounted
         """
-        return self.sub_total - self.total
+        return self._memo("discount", lambda: self.sub_total - self.total)
 
     @property
     def total(self) -> float:
@@ -86,14 +332,36 @@ class Pricer:
             float: Total cost.
         """
 
-        # We fold through the offers here rather than using a for loop to invert
-        # the control over the stub list's state.
+        if self.compiled is not None:
+            return self._evaluate()[1]
+
+        return self._memo("total", self._total)
+
+    def _sub_total(self) -> float:
+        return sum(stub.price for stub in self.stubs_list)
+
+    def _total(self) -> float:
         # We must use max(stub.price, 0) to drop negative price values to zero.
+        return sum(max(stub.price, 0) for stub in self.final_stubs_list)
+
+    @property
+    def final_stubs_list(self) -> List[PriceStub]:
+        """
+        Get the price stubs list after applying every offer.
+
+        Returns:
+            List[PriceStub]: List of price stubs.
+        """
+        stages = self.stages
+        return stages[-1] if stages else self.stubs_list
+
+
+# Pricers that total the basket without expanding it into price stubs sum the
+# sub-total from each product's price and quantity, and only override _total
+# to apply their offers.
+class QuantityPricer(Pricer):
+    def _sub_total(self) -> float:
         return sum(
-            max(stub.price, 0)
-            for stub in reduce(
-                lambda stubs_list, offer: offer.transform(stubs_list),  # type: ignore
-                self.offers,
-                self.stubs_list,
-            )
+            self.catalogue.price(name) * quantity
+            for name, quantity in self.basket.items()
         )
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Quote:
+    sub_total: float
+    discount: float
+    total: float
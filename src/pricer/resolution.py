@@ -0,0 +1,265 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .offer import Offer
+from .stubs import PriceStub
+from dataclasses import dataclass
+from enum import Enum
+from time import perf_counter
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class ConflictPolicy(Enum):
+    # Offers that share a product can't both be applied.
+    EXCLUSIVE = "exclusive"
+
+    # Any combination of offers can be applied in their original order.
+    STACKABLE = "stackable"
+
+
+@dataclass
+class Resolution:
+    offers: List[Offer]
+    total: float
+    optimal: bool
+
+
+# The offers chosen so far, the price stubs after applying them and their total.
+_State = Tuple[List[int], List[PriceStub], float]
+
+
+class _Component:
+    def __init__(
+        self,
+        offers: List[Offer],
+        basket: Basket,
+        stubs_lists: Dict[str, List[PriceStub]],
+        deadline: float,
+    ) -> None:
+        self.offers = offers
+        self.names = set().union(*(o.products or basket.contents for o in offers))
+        self.stubs_list = [
+            stub for name in basket if name in self.names for stub in stubs_lists[name]
+        ]
+        self.deadline = deadline
+        self.optimal = True
+
+    def solve(self, policy: ConflictPolicy) -> List[Offer]:
+        search = (
+            self.exclusive if policy == ConflictPolicy.EXCLUSIVE else self.stackable
+        )
+        return [self.offers[i] for i in search()]
+
+    def total(self, chosen: List[Offer]) -> float:
+        stubs_list = self.stubs_list
+
+        for offer in chosen:
+            stubs_list = offer.transform(stubs_list)
+
+        return sum(max(stub.price, 0) for stub in stubs_list)
+
+    def expired(self) -> bool:
+        if perf_counter() > self.deadline:
+            self.optimal = False
+
+        return not self.optimal
+
+    def exclusive(self) -> List[int]:
+        # Disjoint offers discount independently, so this is a maximum weight
+        # independent set problem solved by branch and bound.
+        base = self.total([])
+        weights = [base - self.total([offer]) for offer in self.offers]
+        order = sorted(
+            (i for i, weight in enumerate(weights) if weight > 0),
+            key=lambda i: -weights[i],
+        )
+
+        best: Tuple[int, ...] = ()
+        best_weight = 0.0
+
+        # The greedy solution is the incumbent if the budget runs out.
+        for i in order:
+            if not any(self.conflict(i, j) for j in best):
+                best += (i,)
+                best_weight += weights[i]
+
+        remaining = [sum(weights[i] for i in order[k:]) for k in range(len(order))]
+        remaining.append(0.0)
+
+        # The search is depth first over an explicit stack so that components
+        # with many offers don't hit the recursion limit.
+        stack: List[Tuple[int, Tuple[int, ...], float]] = [(0, (), 0.0)]
+
+        while stack and not self.expired():
+            k, chosen, weight = stack.pop()
+
+            if weight + remaining[k] <= best_weight:
+                continue
+
+            if k == len(order):
+                best, best_weight = chosen, weight
+                continue
+
+            i = order[k]
+            stack.append((k + 1, chosen, weight))
+
+            if not any(self.conflict(i, j) for j in chosen):
+                stack.append((k + 1, (*chosen, i), weight + weights[i]))
+
+        return sorted(best)
+
+    def stackable(self) -> List[int]:
+        # Offers are decided in their original order, so subsets that leave
+        # the stubs in the same state share every later decision and only the
+        # first of them is kept. Every partial subset is itself a solution
+        # that skips the remaining offers, so the incumbent improves as the
+        # search goes.
+        base = self.total([])
+        remaining = self.remaining(base)
+
+        # Applying every offer is the incumbent if the budget runs out.
+        best = list(range(len(self.offers)))
+        best_total = self.total(self.offers)
+
+        if base < best_total:
+            best, best_total = [], base
+
+        states: List[_State] = [([], self.stubs_list, base)]
+
+        for k, offer in enumerate(self.offers):
+            expanded: Dict[Tuple[Tuple[str, float], ...], _State] = {}
+
+            for chosen, stubs_list, total in states:
+                if self.expired():
+                    return best
+
+                if max(total - remaining[k], 0.0) >= best_total:
+                    continue
+
+                applied = offer.transform(stubs_list)
+                applied_total = sum(max(stub.price, 0) for stub in applied)
+
+                if applied_total < best_total:
+                    best, best_total = [*chosen, k], applied_total
+
+                for state in [
+                    (chosen, stubs_list, total),
+                    ([*chosen, k], applied, applied_total),
+                ]:
+                    expanded.setdefault(
+                        tuple((stub.name, stub.price) for stub in state[1]), state
+                    )
+
+            states = list(expanded.values())
+
+        return best
+
+    def remaining(self, base: float) -> List[float]:
+        # The most each suffix of the offers can save if every offer discounts
+        # no more after other offers than it does alone.
+        gains = [max(base - self.total([offer]), 0.0) for offer in self.offers]
+        return [sum(gains[k:]) for k in range(len(gains) + 1)]
+
+    def conflict(self, i: int, j: int) -> bool:
+        first = self.offers[i].products
+        second = self.offers[j].products
+        return first is None or second is None or bool(first & second)
+
+
+def resolve(
+    basket: Basket,
+    catalogue: CatalogueLike,
+    offers: List[Offer],
+    policy: ConflictPolicy = ConflictPolicy.EXCLUSIVE,
+    budget: Optional[float] = 0.1,
+) -> Resolution:
+    """
+    Choose the combination of offers that minimises the basket total.
+
+    Offers are split into components that share products and each component
+    is searched independently. Exclusive offers are chosen with a branch and
+    bound over their discounts. Stackable offers are chosen by deciding each
+    offer in the original order, merging subsets that leave the basket priced
+    the same and pruning subsets whose remaining offers can't beat the best
+    total found, assuming an offer never discounts more after other offers
+    than it does alone. The declarative offers all hold to this since each
+    discount shrinks with the prices it is applied to, but a stackable offer
+    that rewards earlier discounts can be missed while the resolution is
+    still marked as optimal. When the time budget runs out the best
+    combination found so far is returned and marked as not optimal.
+
+    Args:
+        basket (Basket): A basket of items and their quantities.
+        catalogue (CatalogueLike): A catalogue of items and their prices.
+        offers (List[Offer]): Candidate offers.
+        policy (ConflictPolicy, optional): How overlapping offers can be
+        combined. Defaults to ConflictPolicy.EXCLUSIVE.
+        budget (Optional[float], optional): Seconds allowed for the search.
+        Defaults to 0.1. None allows an unbounded search.
+
+    Raises:
+        UnknownPrice: A product in the basket is not listed in the catalogue.
+
+    Returns:
+        Resolution: Chosen offers in their original order and the basket total.
+    """
+    deadline = float("inf") if budget is None else perf_counter() + budget
+    positions = {id(offer): i for i, offer in enumerate(offers)}
+
+    stubs_lists: Dict[str, List[PriceStub]] = {
+        name: [PriceStub(name, catalogue.price(name))] * quantity
+        for name, quantity in basket.items()
+    }
+
+    chosen: List[Offer] = []
+    total = 0.0
+    optimal = True
+    covered: Set[str] = set()
+
+    for group in _components([o for o in offers if _relevant(o, basket)]):
+        component = _Component(group, basket, stubs_lists, deadline)
+        covered |= component.names
+
+        selected = component.solve(policy)
+        chosen.extend(selected)
+        total += component.total(selected)
+        optimal = optimal and component.optimal
+
+    total += sum(
+        stub.price
+        for name in basket
+        if name not in covered
+        for stub in stubs_lists[name]
+    )
+
+    return Resolution(sorted(chosen, key=lambda o: positions[id(o)]), total, optimal)
+
+
+def _relevant(offer: Offer, basket: Basket) -> bool:
+    return offer.products is None or any(name in basket for name in offer.products)
+
+
+def _components(offers: List[Offer]) -> List[List[Offer]]:
+    # Offers that do not declare their products touch the whole basket.
+    if any(offer.products is None for offer in offers):
+        return [offers] if offers else []
+
+    parents: Dict[str, str] = {}
+
+    def find(name: str) -> str:
+        while parents.setdefault(name, name) != name:
+            name = parents[name]
+        return name
+
+    for offer in offers:
+        names = sorted(offer.products or [])
+
+        for name in names:
+            parents[find(name)] = find(names[0])
+
+    groups: Dict[str, List[Offer]] = {}
+
+    for offer in offers:
+        if offer.products:
+            groups.setdefault(find(next(iter(offer.products))), []).append(offer)
+
+    return list(groups.values())
@@ -0,0 +1,155 @@
+import asyncio
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .batch import BatchPricer, initialize_worker, worker_price_each
+from .offer import Offer
+from .quote import Quote
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, List, Optional, Set, Tuple
+
+
+# A batch is priced once it has max_batch baskets or max_delay seconds after
+# its first basket arrived. Batches with at least heavy_units items are priced
+# off the event loop, in processes worker processes if set or otherwise in the
+# loop's default thread pool.
+@dataclass(frozen=True)
+class ServiceConfig:
+    max_batch: int = 64
+    max_delay: float = 0.001
+    heavy_units: int = 10000
+    processes: Optional[int] = None
+
+
+class PricingService:
+    def __init__(
+        self,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Offer]] = None,
+        config: Optional[ServiceConfig] = None,
+    ) -> None:
+        """
+        Initialize a PricingService instance.
+
+        A pricing service coalesces concurrent pricing requests into batches
+        and prices each batch at once.
+
+        Args:
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Offer]], optional): A list of offers to modify that
+            modify the final prices of items in the basket. Defaults to None.
+            config (Optional[ServiceConfig], optional): Batching and worker
+            settings. Defaults to None which uses the ServiceConfig defaults.
+        """
+        self.pricer = BatchPricer(catalogue, offers)
+        self.config = ServiceConfig() if config is None else config
+        self.batches = 0
+
+        self._executor: Optional[Executor] = None
+        self._pending: List[Tuple[Basket, "asyncio.Future[Quote]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Running batches are referenced here so they aren't garbage collected.
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+        # Workers receive the pricer once when they start rather than with every batch.
+        if self.config.processes is not None:
+            self._executor = ProcessPoolExecutor(
+                self.config.processes,
+                initializer=initialize_worker,
+                initargs=(self.pricer,),
+            )
+
+    async def __aenter__(self) -> "PricingService":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        # Requests still waiting for their batch to fill are priced now rather
+        # than when the timer fires, and every batch finishes before the
+        # workers are shut down off the event loop.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._pending:
+            self._dispatch()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    async def price(self, basket: Basket) -> Quote:
+        """
+        Price a basket.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+
+        Returns:
+            Quote: Sub-total, discount and total.
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Quote]" = loop.create_future()
+        self._pending.append((basket, future))
+
+        if len(self._pending) >= self.config.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.config.max_delay, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Basket, "asyncio.Future[Quote]"]]) -> None:
+        try:
+            results = await self._price([basket for basket, _ in batch])
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+
+                if isinstance(result, tuple):
+                    sub_total, total = result
+                    future.set_result(Quote(sub_total, sub_total - total, total))
+                else:
+                    future.set_exception(result)
+
+        # A batch that can't be priced at all, for example because its baskets
+        # can't be sent to a worker process, fails every request left in it.
+        except Exception as error:  # pylint: disable=W0718
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _price(self, baskets: List[Basket]) -> List[Any]:
+        if sum(basket.count for basket in baskets) < self.config.heavy_units:
+            return self.pricer.price_each(baskets)
+
+        loop = asyncio.get_running_loop()
+
+        if self._executor is None:
+            return await loop.run_in_executor(None, self.pricer.price_each, baskets)
+
+        return await loop.run_in_executor(self._executor, worker_price_each, baskets)
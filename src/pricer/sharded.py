@@ -0,0 +1,164 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from ..utils.workers import WorkerState
+from .index import OfferIndex
+from .offer import Offer
+from .pricer import Pricer
+from .stubs import PriceStub
+from itertools import chain, repeat
+from multiprocessing import Pool
+from os import cpu_count
+from typing import List, Optional, Set, Tuple
+
+Shard = List[Tuple[str, int]]
+
+# Each worker process prices shards with its own copy of the catalogue and
+# local offers which are sent once when the pool starts.
+WORKER: WorkerState[Tuple[CatalogueLike, OfferIndex]] = WorkerState()
+
+
+class ShardedPricer(Pricer):
+    def __init__(
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Offer]] = None,
+        processes: Optional[int] = None,
+        shards: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a ShardedPricer instance.
+
+        A sharded pricer splits a large basket by product across worker
+        processes. Offers that declare a single product are local and run in
+        the shards unless an earlier offer that spans several products also
+        touches that product. Every other offer runs afterwards on the merged
+        price stubs. Shards are contiguous runs of the basket so the merged
+        stubs, and the totals summed from them in order, are identical to
+        pricing the basket serially.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Offer]], optional): A list of offers to modify that
+            modify the final prices of items in the basket. Defaults to None.
+            processes (Optional[int], optional): Number of worker processes.
+            Defaults to None which uses the number of CPUs.
+            shards (Optional[int], optional): Number of shards the basket is
+            split into. Defaults to None which uses one per process.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+        """
+        super().__init__(basket, catalogue, offers)
+        self.processes = processes or cpu_count() or 1
+        self.shards = shards or self.processes
+
+    @property
+    def partition(self) -> Tuple[List[Offer], List[Offer]]:
+        """
+        Split the relevant offers into local offers and merge offers.
+
+        Returns:
+            Tuple[List[Offer], List[Offer]]: Offers run in the shards and offers
+            run on the merged price stubs, each in their original order.
+        """
+
+        def compute() -> Tuple[List[Offer], List[Offer]]:
+            local: List[Offer] = []
+            merged: List[Offer] = []
+            spanned: Set[str] = set()
+            universal = False
+
+            for offer in self.relevant_offers:
+                products = offer.products
+
+                if (
+                    products is not None
+                    and len(products) == 1
+                    and not universal
+                    and not products & spanned
+                ):
+                    local.append(offer)
+                    continue
+
+                merged.append(offer)
+
+                if products is None:
+                    universal = True
+                else:
+                    spanned |= products
+
+            return local, merged
+
+        return self._memo("partition", compute)
+
+    @property
+    def final_stubs_list(self) -> List[PriceStub]:
+        """
+        Get the price stubs list after applying every offer.
+
+        Returns:
+            List[PriceStub]: List of price stubs.
+        """
+        local, merged = self.partition
+
+        if not local:
+            return super().final_stubs_list
+
+        return self._memo(
+            "sharded_stubs", lambda: self._merge(merged, self._run(local))
+        )
+
+    def _split(self) -> List[Shard]:
+        items = list(self.basket.items())
+        size = -(-len(items) // self.shards) or 1
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _run(self, local: List[Offer]) -> List[List[float]]:
+        shards = self._split()
+
+        with Pool(
+            min(self.processes, len(shards)),
+            _initialize,
+            (self.catalogue, local),
+        ) as pool:
+            return pool.map(_price_shard, shards)
+
+    def _merge(
+        self, merged: List[Offer], prices: List[List[float]]
+    ) -> List[PriceStub]:
+        names = chain.from_iterable(
+            repeat(name, quantity) for name, quantity in self.basket.items()
+        )
+        stubs_list = [
+            PriceStub(name, price)
+            for name, price in zip(names, chain.from_iterable(prices))
+        ]
+
+        for offer in merged:
+            stubs_list = offer.transform(stubs_list)
+
+        return stubs_list
+
+
+def _initialize(catalogue: CatalogueLike, offers: List[Offer]) -> None:
+    WORKER.set((catalogue, OfferIndex(offers)))
+
+
+def _price_shard(shard: Shard) -> List[float]:
+    catalogue, index = WORKER.get()
+    stubs_list = [
+        stub
+        for name, quantity in shard
+        for stub in [PriceStub(name, catalogue.price(name))] * quantity
+    ]
+
+    for offer in index.relevant(name for name, _ in shard):
+        stubs_list = offer.transform(stubs_list)
+
+    # Local offers only reprice their own product so the stubs must stay in place.
+    if len(stubs_list) != sum(quantity for _, quantity in shard):
+        raise ValueError("Local offers must not add or remove price stubs")
+
+    return [stub.price for stub in stubs_list]
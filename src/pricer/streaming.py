@@ -0,0 +1,83 @@
+from ..basket.basket import Basket
+from ..catalogue.catalogue import CatalogueLike
+from .offer import BaseOffer, Offer, Transform
+from .pricer import QuantityPricer
+from .stubs import PriceStub
+from dataclasses import dataclass
+from functools import partial
+from typing import Iterator, List, Optional, Union
+
+
+@dataclass
+class StreamingOffer(BaseOffer[Transform[Iterator[PriceStub]]]):
+    def to_offer(self) -> Offer:
+        """
+        Adapt the offer to operate on price stubs.
+
+        The offer is applied to a stream over the stubs and the stream it
+        returns is collected back into a list.
+
+        Returns:
+            Offer: An equivalent price stub offer.
+        """
+        return Offer(self.title, partial(_restore, self.transform), self.products)
+
+
+class StreamingPricer(QuantityPricer):
+    def __init__(
+        self,
+        basket: Basket,
+        catalogue: CatalogueLike,
+        offers: Optional[List[Union[Offer, StreamingOffer]]] = None,
+    ) -> None:
+        """
+        Initialize a StreamingPricer instance.
+
+        A streaming pricer passes a lazy stream of price stubs through its
+        offers and sums the total in a single pass. Streaming offers transform
+        the stream one stub at a time so the expanded basket is never held in
+        memory. Price stub offers need random access so the stream is collected
+        into a list before they are applied.
+
+        Args:
+            basket (Basket): A basket of items and their quantities.
+            catalogue (CatalogueLike): A catalogue of items and their prices.
+            offers (Optional[List[Union[Offer, StreamingOffer]]], optional): A list
+            of offers that modify the final prices of items in the basket.
+            Defaults to None.
+
+        Raises:
+            UnknownPrice: A product in the basket is not listed in the catalogue.
+        """
+        super().__init__(basket, catalogue, offers)  # type: ignore
+
+    def stubs_stream(self) -> Iterator[PriceStub]:
+        """
+        Stream the basket as price stubs consisting
+        of products and their current prices.
+
+        Yields:
+            Iterator[PriceStub]: Price stubs.
+        """
+        for name, quantity in self.basket.items():
+            stub = PriceStub(name, self.catalogue.price(name))
+
+            for _ in range(quantity):
+                yield stub
+
+    def _total(self) -> float:
+        stream = self.stubs_stream()
+
+        for offer in self.relevant_offers:
+            if isinstance(offer, StreamingOffer):
+                stream = offer.transform(stream)
+            else:
+                stream = iter(offer.transform(list(stream)))
+
+        return sum(max(stub.price, 0) for stub in stream)
+
+
+def _restore(
+    transform: Transform[Iterator[PriceStub]], stubs_list: List[PriceStub]
+) -> List[PriceStub]:
+    return list(transform(iter(stubs_list)))
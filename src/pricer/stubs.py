@@ -1,7 +1,83 @@
+from array import array
 from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Union, overload
 
 
 @dataclass
 class PriceStub:
+    # Slots drop the per instance dictionary since baskets can hold many stubs.
+    __slots__ = ("name", "price")
+
     name: str
     price: float
+
+
+class PriceStubArray:
+    def __init__(self, stubs_list: Iterable[PriceStub] = ()) -> None:
+        """
+        Initialize a PriceStubArray instance.
+
+        A price stub array stores price stubs as interned name ids and prices
+        in parallel typed arrays. Iterating or indexing it creates price stub
+        views on demand so it can be passed to existing offers.
+
+        Args:
+            stubs_list (Iterable[PriceStub], optional): Price stubs. Defaults to ().
+        """
+        self.names: List[str] = []
+        self.name_ids: "array[int]" = array("I")
+        self.prices: "array[float]" = array("d")
+        self._ids: Dict[str, int] = {}
+
+        for stub in stubs_list:
+            self.extend(stub.name, stub.price, 1)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self) -> Iterator[PriceStub]:
+        names = self.names
+
+        for name_id, price in zip(self.name_ids, self.prices):
+            yield PriceStub(names[name_id], price)
+
+    @overload
+    def __getitem__(self, index: int) -> PriceStub: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[PriceStub]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[PriceStub, List[PriceStub]]:
+        if isinstance(index, slice):
+            return [
+                PriceStub(self.names[name_id], price)
+                for name_id, price in zip(self.name_ids[index], self.prices[index])
+            ]
+
+        return PriceStub(self.names[self.name_ids[index]], self.prices[index])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (PriceStubArray, list)):
+            return len(self) == len(other) and all(
+                x == y for x, y in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def extend(self, name: str, price: float, quantity: int) -> None:
+        """
+        Append units of a product to the array.
+
+        Args:
+            name (str): Product name.
+            price (float): Unit price.
+            quantity (int): Number of units.
+        """
+        if name not in self._ids:
+            self._ids[name] = len(self.names)
+            self.names.append(name)
+
+        self.name_ids.extend([self._ids[name]] * quantity)
+        self.prices.extend([price] * quantity)
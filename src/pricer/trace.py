@@ -0,0 +1,117 @@
+import tracemalloc
+from .offer import Offer
+from .stubs import PriceStub
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class OfferTrace:
+    title: str
+    seconds: float
+    stubs_in: int
+    stubs_out: int
+    allocated: int
+
+
+Metrics = Callable[[OfferTrace], None]
+
+
+@dataclass
+class PricingTrace:
+    offers: List[OfferTrace] = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        """
+        Get the total time spent applying offers.
+
+        Returns:
+            float: Seconds.
+        """
+        return sum(offer.seconds for offer in self.offers)
+
+    @property
+    def by_title(self) -> Dict[str, List[OfferTrace]]:
+        """
+        Get the offer traces grouped by their offer titles.
+
+        Returns:
+            Dict[str, List[OfferTrace]]: Offer traces in the order they were
+            applied, since several offers can share a title.
+        """
+        traces: Dict[str, List[OfferTrace]] = {}
+
+        for offer in self.offers:
+            traces.setdefault(offer.title, []).append(offer)
+
+        return traces
+
+    def apply(
+        self,
+        offer: Offer,
+        stubs_list: List[PriceStub],
+        metrics: Optional[Metrics] = None,
+    ) -> List[PriceStub]:
+        """
+        Apply an offer and record its trace.
+
+        Allocations are only measured while tracemalloc is tracing.
+
+        Args:
+            offer (Offer): Offer to apply.
+            stubs_list (List[PriceStub]): List of price stubs.
+            metrics (Optional[Metrics], optional): Called with the offer trace.
+            Defaults to None.
+
+        Returns:
+            List[PriceStub]: List of price stubs after applying the offer.
+        """
+        tracing = tracemalloc.is_tracing()
+        before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = perf_counter()
+
+        result = offer.transform(stubs_list)
+
+        seconds = perf_counter() - start
+        after = tracemalloc.get_traced_memory()[0] if tracing else 0
+
+        trace = OfferTrace(
+            offer.title, seconds, len(stubs_list), len(result), after - before
+        )
+        self.offers.append(trace)
+
+        if metrics is not None:
+            metrics(trace)
+
+        return result
+
+
+# A metrics collector aggregates offer traces into counters and cumulative
+# histograms of seconds keyed by offer title in the style of Prometheus
+# metrics. The buckets are the histogram upper bounds in seconds.
+@dataclass
+class MetricsCollector:
+    buckets: Sequence[float] = (0.0001, 0.001, 0.01, 0.1, 1.0)
+    calls: Dict[str, int] = field(default_factory=dict)
+    seconds: Dict[str, float] = field(default_factory=dict)
+    stubs: Dict[str, int] = field(default_factory=dict)
+    histograms: Dict[str, List[int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.buckets = sorted(self.buckets)
+
+    def __call__(self, trace: OfferTrace) -> None:
+        self.calls[trace.title] = self.calls.get(trace.title, 0) + 1
+        self.seconds[trace.title] = self.seconds.get(trace.title, 0.0) + trace.seconds
+        self.stubs[trace.title] = self.stubs.get(trace.title, 0) + trace.stubs_out
+
+        # The last bucket counts observations above every bound.
+        histogram = self.histograms.setdefault(
+            trace.title, [0] * (len(self.buckets) + 1)
+        )
+
+        for i in range(bisect_left(self.buckets, trace.seconds), len(histogram)):
+            histogram[i] += 1
@@ -0,0 +1,50 @@
+from .offer import Offer
+from typing import List, Optional, Tuple
+
+
+# Classes that cache results computed from a list of offers use the offers
+# version to tell when those results were computed from different offers.
+class OfferVersioning:
+    offers: List[Offer]
+    _offers_version: int
+
+    def _init_offers(self, offers: Optional[List[Offer]]) -> None:
+        # We use None over [] as the default argument since it's immutable.
+        self.offers = [] if offers is None else offers
+        self._offers_version = 0
+
+    @property
+    def offers_version(self) -> Tuple[int, ...]:
+        """
+        Get a token identifying the current offers.
+
+        The token changes whenever the offers list is replaced, resized or
+        changed with add_offer and remove_offer.
+
+        Returns:
+            Tuple[int, ...]: Offers version token.
+        """
+        return (id(self.offers), len(self.offers), self._offers_version)
+
+    def add_offer(self, offer: Offer) -> None:
+        """
+        Add an offer to the offers.
+
+        Args:
+            offer (Offer): Offer to apply after the existing offers.
+        """
+        self.offers.append(offer)
+        self._offers_version += 1
+
+    def remove_offer(self, offer: Offer) -> None:
+        """
+        Remove an offer from the offers.
+
+        Args:
+            offer (Offer): Offer to remove.
+
+        Raises:
+            ValueError: The offer is not in the offers.
+        """
+        self.offers.remove(offer)
+        self._offers_version += 1
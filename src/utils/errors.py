@@ -0,0 +1,28 @@
+from typing import Any, Callable, Dict, Tuple
+
+
+class PicklableError(Exception):
+    """
+    Exception that can be sent between processes.
+
+    Exceptions are pickled with their args, which subclasses replace with a
+    formatted message, so the arguments they were raised with are kept and
+    used to rebuild them instead.
+    """
+
+    _arguments: Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "PicklableError":
+        error = super().__new__(cls, *args)
+        error._arguments = (args, kwargs)
+        return error
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        args, kwargs = self._arguments
+        return _rebuild, (type(self), args, kwargs)
+
+
+def _rebuild(
+    cls: Callable[..., PicklableError], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> PicklableError:
+    return cls(*args, **kwargs)
@@ -0,0 +1,59 @@
+import csv
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+Row = Tuple[int, Any, Any]
+
+
+def csv_rows(stream: TextIO, fields: Tuple[str, str]) -> Iterator[Row]:
+    """
+    Stream the rows of a two column csv file.
+
+    A header row matching the field names is skipped.
+
+    Args:
+        stream (TextIO): Csv text stream.
+        fields (Tuple[str, str]): Names of the key and value columns.
+
+    Yields:
+        Iterator[Row]: Line number, key and value of each row. The key is the
+        whole row and the value is None if the row does not have two columns.
+    """
+    reader = csv.reader(stream)
+
+    for row in reader:
+        if not row or (reader.line_num == 1 and tuple(row) == fields):
+            continue
+
+        if len(row) != 2:
+            yield reader.line_num, ",".join(row), None
+        else:
+            yield reader.line_num, row[0], row[1]
+
+
+def jsonl_rows(stream: TextIO, fields: Tuple[str, str]) -> Iterator[Row]:
+    """
+    Stream the rows of a json lines file of objects.
+
+    Args:
+        stream (TextIO): Json lines text stream.
+        fields (Tuple[str, str]): Names of the key and value fields.
+
+    Yields:
+        Iterator[Row]: Line number, key and value of each row. The key is the
+        whole line and the value is None if the line is not an object with
+        both fields.
+    """
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+
+        try:
+            row = json.loads(text)
+        except ValueError:
+            row = None
+
+        if not isinstance(row, dict) or not all(field in row for field in fields):
+            yield line, text.strip(), None
+        else:
+            yield line, row[fields[0]], row[fields[1]]
@@ -1,5 +1,7 @@
 from typing import Any, Dict
 
+INF = float("inf")
+
 
 def dict_matches_type(dct: Dict[Any, Any], keys: Any, values: Any) -> bool:
     """
@@ -9,9 +11,29 @@ def dict_matches_type(dct: Dict[Any, Any], keys: Any, values: Any) -> bool:
     >>> dict_matches_type({"a": "1"}, str, int)
     False
     """
+    # A generator lets all stop at the first mismatch.
+    return all(isinstance(k, keys) and isinstance(v, values) for k, v in dct.items())
+
+
+def dict_matches_positive(dct: Dict[Any, Any], keys: Any, values: Any) -> bool:
+    """
+    Check every key and value type and that every value is positive and finite
+    in one pass.
+
+    >>> dict_matches_positive({"a": 1}, str, int)
+    True
+
+    >>> dict_matches_positive({"a": 0}, str, int)
+    False
+
+    >>> dict_matches_positive({"a": float("inf")}, str, float)
+    False
+
+    >>> dict_matches_positive({"a": "1"}, str, int)
+    False
+    """
+    # Chained comparisons are false for nan so it is rejected with infinity.
     return all(
-        [
-            *[isinstance(x, keys) for x in dct],
-            *[isinstance(x, values) for x in dct.values()],
-        ]
+        isinstance(k, keys) and isinstance(v, values) and 0 < v < INF
+        for k, v in dct.items()
     )
@@ -0,0 +1,39 @@
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class WorkerState(Generic[T]):
+    def __init__(self) -> None:
+        """
+        Initialize a WorkerState instance.
+
+        Worker state holds a value set by a process pool initializer so that
+        the tasks run by each worker process can share it without it being
+        sent with every task.
+        """
+        self._value: Optional[T] = None
+
+    def set(self, value: T) -> None:
+        """
+        Set the value for this process.
+
+        Args:
+            value (T): Value used by later tasks.
+        """
+        self._value = value
+
+    def get(self) -> T:
+        """
+        Get the value for this process.
+
+        Raises:
+            RuntimeError: The value has not been set in this process.
+
+        Returns:
+            T: Value set by the initializer.
+        """
+        if self._value is None:
+            raise RuntimeError("Worker state has not been initialized")
+
+        return self._value
@@ -1,3 +1,93 @@
 import sys
 
 sys.path.append("..")
+
+# pylint: disable=wrong-import-position
+import pytest
+from .fixtures import (PricingCase,
+                       buy_one_apple_get_one_free_buffer_transform,
+                       buy_one_apple_get_one_free_stream_transform,
+                       half_price_oranges_buffer_transform,
+                       half_price_oranges_groups_transform,
+                       half_price_oranges_stream_transform)
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.buffer import BufferOffer
+from src.pricer.groups import GroupOffer
+from src.pricer.streaming import StreamingOffer
+
+
+@pytest.fixture()
+def half_price_oranges_groups() -> GroupOffer:
+    return GroupOffer(
+        "Half price oranges",
+        half_price_oranges_groups_transform,
+        frozenset({"orange"}),
+    )
+
+
+@pytest.fixture()
+def half_price_oranges_buffer() -> BufferOffer:
+    return BufferOffer(
+        "Half price oranges",
+        half_price_oranges_buffer_transform,
+        frozenset({"orange"}),
+    )
+
+
+@pytest.fixture()
+def buy_one_apple_get_one_free_buffer() -> BufferOffer:
+    return BufferOffer(
+        "Buy one apple get one free",
+        buy_one_apple_get_one_free_buffer_transform,
+        frozenset({"apple"}),
+    )
+
+
+@pytest.fixture()
+def half_price_oranges_stream() -> StreamingOffer:
+    return StreamingOffer(
+        "Half price oranges",
+        half_price_oranges_stream_transform,
+        frozenset({"orange"}),
+    )
+
+
+@pytest.fixture()
+def buy_one_apple_get_one_free_stream() -> StreamingOffer:
+    return StreamingOffer(
+        "Buy one apple get one free",
+        buy_one_apple_get_one_free_stream_transform,
+        frozenset({"apple"}),
+    )
+
+
+@pytest.fixture(
+    params=[
+        [{}, 0.0, 0.0, 0.0],
+        [{"apple": 3}, 3.0, 1.0, 2.0],
+        [{"orange": 2}, 4.0, 2.0, 2.0],
+        [{"apple": 2, "orange": 2}, 6.0, 3.0, 3.0],
+    ]
+)
+def pricing_case(request: pytest.FixtureRequest) -> PricingCase:
+    """
+    Get a basket to price with buy one apple get one free and half price
+    oranges, shared by the tests of each pricing mode.
+
+    Args:
+        request (pytest.FixtureRequest): Request for the basket contents and
+        its expected sub_total, discount and total.
+
+    Returns:
+        PricingCase: The basket, its catalogue and the expected sub_total,
+        discount and total.
+    """
+    contents, sub_total, discount, total = request.param
+    return (
+        Basket(dict(contents)),
+        Catalogue({"apple": 1.0, "orange": 2.0}),
+        sub_total,
+        discount,
+        total,
+    )
@@ -1,7 +1,14 @@
 import pytest
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.buffer import PriceBuffer
+from src.pricer.groups import PriceGroup
 from src.pricer.offer import Offer
 from src.pricer.pricer import PriceStub
-from typing import List
+from typing import Iterator, List, Tuple
+
+# A basket, its catalogue and its expected sub_total, discount and total.
+PricingCase = Tuple[Basket, Catalogue, float, float, float]
 
 
 def buy_one_apple_get_one_free_transform(
@@ -23,9 +30,55 @@ def half_price_oranges_transform(stubs_list: List[PriceStub]) -> List[PriceStub]
 
 @pytest.fixture()
 def buy_one_apple_get_one_free() -> Offer:
-    return Offer("Buy one apple get one free", buy_one_apple_get_one_free_transform)
+    return Offer(
+        "Buy one apple get one free",
+        buy_one_apple_get_one_free_transform,
+        frozenset({"apple"}),
+    )
 
 
 @pytest.fixture()
 def half_price_oranges() -> Offer:
-    return Offer("Half price oranges", half_price_oranges_transform)
+    return Offer(
+        "Half price oranges", half_price_oranges_transform, frozenset({"orange"})
+    )
+
+
+def half_price_oranges_groups_transform(
+    groups_list: List[PriceGroup],
+) -> List[PriceGroup]:
+    return [
+        PriceGroup(i.name, i.price / 2 if i.name == "orange" else i.price, i.quantity)
+        for i in groups_list
+    ]
+
+
+def half_price_oranges_buffer_transform(buffer: PriceBuffer) -> None:
+    buffer.scale("orange", 0.5)
+
+
+def buy_one_apple_get_one_free_buffer_transform(buffer: PriceBuffer) -> None:
+    for i in buffer.span("apple")[1::2]:
+        buffer.prices[i] = 0.0
+
+
+def half_price_oranges_stream_transform(
+    stream: Iterator[PriceStub],
+) -> Iterator[PriceStub]:
+    for i in stream:
+        yield PriceStub(i.name, i.price / 2) if i.name == "orange" else i
+
+
+def buy_one_apple_get_one_free_stream_transform(
+    stream: Iterator[PriceStub],
+) -> Iterator[PriceStub]:
+    apples = 0
+
+    for i in stream:
+        if i.name == "apple":
+            apples += 1
+
+            if apples % 2 == 0:
+                i = PriceStub("apple", 0.0)
+
+        yield i
@@ -16,7 +16,7 @@ def test_create() -> None:
 
 @pytest.mark.parametrize(
     "contents",
-    [{"a": "1"}, {1: "a"}, {"a": 1.0}],
+    [{"a": "1"}, {1: "a"}, {"a": 1.0}, {"a": 0, "b": "1"}],
 )
 def test_basket_type_error(contents: Any) -> None:
     """
@@ -46,6 +46,13 @@ def test_basket_quantity_error(contents: Dict[str, int]) -> None:
         Basket(contents)  # type: ignore
 
 
+def test_trusted() -> None:
+    """
+    Test that trusted contents are not validated again.
+    """
+    assert Basket({"a": 0}, trusted=True).contents == {"a": 0}
+
+
 def test_contains() -> None:
     """
     Tests that products in the basket return True to
@@ -132,3 +139,13 @@ def test_product_not_in_basket_error() -> None:
     """
     with pytest.raises(ProductNotInBasket):
         Basket().remove("a")
+
+
+def test_version() -> None:
+    """
+    Tests that adding and removing items increments the basket version.
+    """
+    basket = Basket()
+    basket.add("a")
+    basket.remove("a")
+    assert basket.version == 2
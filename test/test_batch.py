@@ -0,0 +1,119 @@
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.columnar import ColumnarCatalogue
+from src.catalogue.exceptions import UnknownPrice
+from src.catalogue.packed import PackedCatalogue, pack_catalogue
+from src.pricer import batch
+from src.pricer.batch import BatchPricer, initialize_worker, worker_price_each
+from src.pricer.declarative import BuyOneGetOneFree, PercentageOff
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.stubs import PriceStub
+from src.utils.workers import WorkerState
+from typing import List, Optional
+
+baskets = [
+    Basket(),
+    Basket({"apple": 3}),
+    Basket({"orange": 2}),
+    Basket({"apple": 2, "orange": 3}),
+]
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_price_many(
+    processes: Optional[int],
+    buy_one_apple_get_one_free: Offer,
+    half_price_oranges: Offer,
+) -> None:
+    """
+    Test that pricing many baskets matches pricing each basket with a Pricer.
+
+    Args:
+        processes (Optional[int]): Number of worker processes.
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    catalogue = Catalogue({"apple": 1.0, "orange": 2.0})
+    offers_lists: List[List[Offer]] = [
+        [buy_one_apple_get_one_free, half_price_oranges],
+        [BuyOneGetOneFree("apple"), PercentageOff("orange", 50.0)],
+    ]
+
+    for offers in offers_lists:
+        totals = BatchPricer(catalogue, offers).price_many(baskets, processes, 2)
+        pricers = [Pricer(basket, catalogue, offers) for basket in baskets]
+
+        assert len(totals) == len(baskets)
+        assert list(totals.sub_totals) == [pricer.sub_total for pricer in pricers]
+        assert list(totals.discounts) == [pricer.discount for pricer in pricers]
+        assert list(totals.totals) == [pricer.total for pricer in pricers]
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_unknown_price_error(processes: Optional[int]) -> None:
+    """
+    Test that pricing a basket with an item not in the catalogue raises UnknownPrice.
+
+    Args:
+        processes (Optional[int]): Number of worker processes.
+    """
+    with pytest.raises(UnknownPrice):
+        BatchPricer(Catalogue({"a": 1.0})).price_many(
+            [Basket({"a": 1}), Basket({"b": 1})], processes
+        )
+
+
+def test_unpicklable_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that errors which can't be sent between processes are raised as RuntimeError.
+    """
+
+    def fail(_: List[PriceStub]) -> List[PriceStub]:
+        raise LocalError()
+
+    class LocalError(Exception):
+        pass
+
+    monkeypatch.setattr(batch, "WORKER", WorkerState())
+    initialize_worker(BatchPricer(Catalogue({"a": 1.0}), [Offer("Fail", fail)]))
+    (error,) = worker_price_each([Basket({"a": 1})])
+    assert isinstance(error, RuntimeError)
+
+
+def test_price_lookups() -> None:
+    """
+    Test that each product is looked up in the catalogue once per batch.
+    """
+    lookups: List[str] = []
+
+    class CountingCatalogue(Catalogue):
+        def price(self, name: str) -> float:
+            lookups.append(name)
+            return super().price(name)
+
+    catalogue = CountingCatalogue({"apple": 1.0, "orange": 2.0})
+    totals = BatchPricer(catalogue, [BuyOneGetOneFree("apple")]).price_many(baskets)
+
+    assert list(totals.totals) == [0.0, 2.0, 4.0, 7.0]
+    assert sorted(lookups) == ["apple", "orange"]
+
+
+@pytest.mark.parametrize(
+    "catalogue",
+    [
+        ColumnarCatalogue(["apple", "orange"], [1.0, 2.0]),
+        PackedCatalogue(pack_catalogue(Catalogue({"apple": 1.0, "orange": 2.0}))),
+    ],
+)
+def test_catalogues(catalogue: Catalogue) -> None:
+    """
+    Test that baskets can be priced against any catalogue backend.
+
+    Args:
+        catalogue (Catalogue): A catalogue of prices.
+    """
+    totals = BatchPricer(catalogue, [BuyOneGetOneFree("apple")]).price_many(baskets)
+    assert list(totals.totals) == [0.0, 2.0, 4.0, 7.0]
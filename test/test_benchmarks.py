@@ -0,0 +1,70 @@
+import pytest
+from benchmarks import arithmetic
+from benchmarks.suite import Measurement, cases, compare, main, measure
+from decimal import Decimal
+from pathlib import Path
+
+
+def test_cases() -> None:
+    """
+    Test that cases sweep every combination of sizes that fit in the catalogue.
+    """
+    assert len(cases([1, 10], [1, 2], [1, 10], [0])) == 6
+
+
+def test_measure() -> None:
+    """
+    Test that every operation is measured.
+    """
+    case = cases([2], [2], [4], [1])[0]
+
+    assert [measurement.operation for measurement in measure(case, 1)] == [
+        "construct",
+        "sub_total",
+        "total",
+        "discount",
+    ]
+
+
+def test_compare() -> None:
+    """
+    Test that measurements slower or larger than the baseline are regressions.
+    """
+    baseline = [Measurement("a", "total", 1.0, 100)]
+
+    assert not compare([Measurement("a", "total", 1.1, 110)], baseline, 0.2)
+    assert len(compare([Measurement("a", "total", 1.5, 150)], baseline, 0.2)) == 2
+    assert not compare([Measurement("b", "total", 1.5, 150)], baseline, 0.2)
+
+
+def test_main(tmp_path: Path) -> None:
+    """
+    Test that the suite can save and compare against a baseline and fails
+    if the baseline is missing.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+    """
+    path = str(tmp_path / "baseline.json")
+    args = ["--products", "1", "--quantities", "1", "--catalogues", "1"]
+    args += ["--repeat", "1"]
+
+    with pytest.raises(SystemExit):
+        main([*args, "--baseline", path])
+
+    assert main([*args, "--save", path]) == 0
+    assert main([*args, "--baseline", path, "--threshold", "1000"]) == 0
+
+
+def test_arithmetic() -> None:
+    """
+    Test that every price representation totals the same baskets.
+    """
+    throughputs = arithmetic.measure(baskets=2, products=3, quantity=3)
+
+    assert [throughput.mode for throughput in throughputs] == [
+        "float",
+        "decimal",
+        "minor",
+    ]
+    assert Decimal(throughputs[1].total) * 100 == int(throughputs[2].total)
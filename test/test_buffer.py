@@ -0,0 +1,102 @@
+import pytest
+from .fixtures import PricingCase, buy_one_apple_get_one_free
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.buffer import BufferOffer, BufferPricer, PriceBuffer
+from src.pricer.offer import Offer
+from src.pricer.stubs import PriceStub
+
+
+def test_price_buffer() -> None:
+    """
+    Test that a price buffer stores each product's units in a contiguous span.
+    """
+    buffer = PriceBuffer()
+    buffer.extend("a", 1.0, 2)
+    buffer.extend("b", 2.0, 1)
+    buffer.scale("b", 0.5)
+
+    assert len(buffer) == 3
+    assert buffer.span("b") == range(2, 3)
+    assert buffer.span("c") == range(0)
+    assert buffer.stubs_list() == [
+        PriceStub("a", 1.0),
+        PriceStub("a", 1.0),
+        PriceStub("b", 1.0),
+    ]
+    assert buffer.total() == 3.0
+
+
+def test_offers(
+    pricing_case: PricingCase,
+    buy_one_apple_get_one_free: Offer,
+    buy_one_apple_get_one_free_buffer: BufferOffer,
+    half_price_oranges_buffer: BufferOffer,
+) -> None:
+    """
+    Tests that buffer pricing matches stub pricing for both adapted price
+    stub offers and native buffer offers.
+
+    Args:
+        pricing_case (PricingCase): A basket, its catalogue and the expected
+        sub_total, discount and total.
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        buy_one_apple_get_one_free_buffer (BufferOffer): Buy one apple get one
+        free buffer offer.
+        half_price_oranges_buffer (BufferOffer): Half price oranges buffer offer.
+    """
+    basket, catalogue, *expected = pricing_case
+
+    for offers in [
+        [buy_one_apple_get_one_free_buffer, half_price_oranges_buffer],
+        [buy_one_apple_get_one_free, half_price_oranges_buffer],
+    ]:
+        pricer = BufferPricer(basket, catalogue, offers)  # type: ignore
+        assert [pricer.sub_total, pricer.discount, pricer.total] == expected
+
+
+def test_stub_count_error() -> None:
+    """
+    Tests that price stub offers which change the number of stubs raise a ValueError.
+    """
+    pricer = BufferPricer(
+        Basket({"a": 1}), Catalogue({"a": 1.0}), [Offer("Drop all", lambda _: [])]
+    )
+
+    with pytest.raises(ValueError):
+        pricer.total  # pylint: disable=W0104
+
+
+def test_stub_order_error() -> None:
+    """
+    Tests that price stub offers which reorder the stubs raise a ValueError.
+    """
+    pricer = BufferPricer(
+        Basket({"a": 1, "b": 1}),
+        Catalogue({"a": 1.0, "b": 2.0}),
+        [Offer("Reverse", lambda stubs_list: stubs_list[::-1])],
+    )
+
+    with pytest.raises(ValueError):
+        pricer.total  # pylint: disable=W0104
+
+
+def test_stages(half_price_oranges_buffer: BufferOffer) -> None:
+    """
+    Tests that buffer offers can be staged as price stub offers.
+
+    Args:
+        half_price_oranges_buffer (BufferOffer): Half price oranges buffer offer.
+    """
+    pricer = BufferPricer(
+        Basket({"apple": 1, "orange": 2}),
+        Catalogue({"apple": 1.0, "orange": 2.0}),
+        [half_price_oranges_buffer],
+    )
+
+    assert pricer.stages == [
+        [PriceStub("apple", 1.0), PriceStub("orange", 1.0), PriceStub("orange", 1.0)]
+    ]
+
+    with pytest.raises(ValueError):
+        PriceBuffer.from_stubs([PriceStub("a", 1.0), PriceStub("b", 1.0)] * 2)
@@ -0,0 +1,85 @@
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.basket.snapshot import BasketSnapshot
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import UnknownPrice
+from src.pricer.cache import PriceCache
+from src.pricer.offer import Offer
+from src.pricer.quote import Quote
+
+
+def test_price(half_price_oranges: Offer) -> None:
+    """
+    Test that identical baskets are priced from the cache.
+
+    Args:
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    cache = PriceCache(Catalogue({"orange": 2.0}), [half_price_oranges])
+
+    assert cache.price(Basket({"orange": 2})) == Quote(4.0, 2.0, 2.0)
+    assert cache.price(BasketSnapshot(Basket({"orange": 2}))) == Quote(4.0, 2.0, 2.0)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+    with pytest.raises(UnknownPrice):
+        cache.price(Basket({"apple": 1}))
+
+
+def test_versions(
+    buy_one_apple_get_one_free: Offer, half_price_oranges: Offer
+) -> None:
+    """
+    Test that changing a price or the offers is not answered from the cache.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    catalogue = Catalogue({"apple": 1.0, "orange": 2.0})
+    cache = PriceCache(catalogue, [half_price_oranges])
+    basket = Basket({"apple": 2, "orange": 2})
+
+    assert cache.price(basket).total == 4.0
+
+    catalogue.set_price("apple", 2.0)
+    assert cache.price(basket).total == 6.0
+
+    cache.add_offer(buy_one_apple_get_one_free)
+    assert cache.price(basket).total == 4.0
+
+    cache.remove_offer(half_price_oranges)
+    assert cache.price(basket).total == 6.0
+    assert cache.stats.hits == 0
+
+
+def test_eviction() -> None:
+    """
+    Test that the least recently used quote is evicted when the cache is full.
+    """
+    cache = PriceCache(Catalogue({"a": 1.0}), max_entries=2)
+
+    for quantity in [1, 2, 1, 3, 1, 2]:
+        cache.price(Basket({"a": quantity}))
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 2
+    assert (cache.stats.hits, cache.stats.misses) == (2, 4)
+
+
+def test_ttl() -> None:
+    """
+    Test that quotes expire after their time to live.
+    """
+    now = [0.0]
+    cache = PriceCache(Catalogue({"a": 1.0}), ttl=10.0, clock=lambda: now[0])
+
+    cache.price(Basket({"a": 1}))
+    now[0] = 5.0
+    cache.price(Basket({"a": 1}))
+    now[0] = 20.0
+    cache.price(Basket({"a": 1}))
+
+    assert cache.stats.expirations == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
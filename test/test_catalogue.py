@@ -16,7 +16,7 @@ def test_create() -> None:
 
 @pytest.mark.parametrize(
     "products",
-    [{"a": "1.0"}, {1: "a"}, {"a": 1}],
+    [{"a": "1.0"}, {1: "a"}, {"a": 1}, {"a": 0.0, "b": "1.0"}],
 )
 def test_catalogue_type_error(products: Any) -> None:
     """
@@ -35,6 +35,9 @@ def test_catalogue_type_error(products: Any) -> None:
     [
         {"a": 0.0},
         {"a": -1.0},
+        {"a": float("nan")},
+        {"a": float("inf")},
+        {"a": 1.0, "b": float("nan")},
     ],
 )
 def test_catalogue_price_error(products: Dict[str, float]) -> None:
@@ -49,6 +52,13 @@ def test_catalogue_price_error(products: Dict[str, float]) -> None:
         Catalogue(products)  # type: ignore
 
 
+def test_trusted() -> None:
+    """
+    Test that trusted products are not validated again.
+    """
+    assert Catalogue({"a": 0.0}, trusted=True).products == {"a": 0.0}
+
+
 def test_contains() -> None:
     """
     Tests that products in the catalogue return True to
@@ -80,3 +90,41 @@ def test_unknown_price_error() -> None:
     """
     with pytest.raises(UnknownPrice):
         Catalogue({"a": 1.0}).price("b")
+
+
+def test_set_price() -> None:
+    """
+    Tests that setting a price updates the catalogue and increments its version.
+    """
+    catalogue = Catalogue({"a": 1.0})
+    catalogue.set_price("a", 2.0)
+    assert catalogue.price("a") == 2.0
+    assert catalogue.version == 1
+
+    for price in [0.0, float("nan"), float("inf")]:
+        with pytest.raises(CataloguePriceError):
+            catalogue.set_price("a", price)
+
+    with pytest.raises(CatalogueTypeError):
+        catalogue.set_price("a", 1)  # type: ignore
+
+
+def test_apply_updates() -> None:
+    """
+    Tests that batches of upserts and deletes are applied atomically.
+    """
+    catalogue = Catalogue({"a": 1.0, "b": 2.0})
+    catalogue.apply_updates({"a": 3.0, "b": None, "c": 4.0})
+
+    assert catalogue.products == {"a": 3.0, "c": 4.0}
+    assert catalogue.version == 1
+
+    catalogue.apply_updates({})
+    assert catalogue.version == 1
+
+    for changes in [{"a": 5.0, "d": None}, {"a": 5.0, "c": 0.0}, {"a": 5.0, 1: 1.0}]:
+        with pytest.raises((UnknownPrice, CataloguePriceError, CatalogueTypeError)):
+            catalogue.apply_updates(changes)  # type: ignore
+
+    assert catalogue.products == {"a": 3.0, "c": 4.0}
+    assert catalogue.version == 1
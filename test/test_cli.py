@@ -0,0 +1,149 @@
+import io
+import json
+import pytest
+from itertools import count
+from pathlib import Path
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.cli import Item, LatencyHistogram, load_offers, main, price_baskets
+from src.pricer.batch import BatchPricer
+from src.pricer.declarative import BuyOneGetOneFree, PercentageOff
+from src.pricer.definitions import format_offers
+from typing import Iterator, Optional
+
+OFFERS = [BuyOneGetOneFree("apple"), PercentageOff("orange", 50)]
+
+
+@pytest.fixture
+def catalogue(tmp_path: Path) -> str:
+    """
+    Write a catalogue file.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        str: Catalogue path.
+    """
+    path = tmp_path / "catalogue.csv"
+    path.write_text("name,price\napple,1.0\norange,2.0\n")
+    return str(path)
+
+
+def test_load_offers() -> None:
+    """
+    Test that offers are imported from a module attribute.
+    """
+    assert load_offers(None) == []
+    assert load_offers("test.test_cli:OFFERS") == OFFERS
+
+    with pytest.raises(ValueError):
+        load_offers("test.test_cli")
+
+
+def test_offers_file(catalogue: str, tmp_path: Path) -> None:
+    """
+    Test that offers are read from a definitions file through a cache.
+
+    Args:
+        catalogue (str): Catalogue path.
+        tmp_path (Path): Temporary directory.
+    """
+    path = tmp_path / "offers.json"
+    path.write_text(json.dumps(format_offers(OFFERS)))
+    baskets = tmp_path / "baskets.jsonl"
+    baskets.write_text('{"apple": 2, "orange": 1}\n')
+
+    args = [catalogue, str(baskets), "--offers", str(path)]
+
+    assert main([*args, "--offers-cache", str(tmp_path / "offers.bin")]) == 0
+    assert load_offers(str(tmp_path / "offers.bin")) == OFFERS
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_main(
+    catalogue: str,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+    workers: Optional[int],
+) -> None:
+    """
+    Test that each basket is priced in order and errors are reported.
+
+    Args:
+        catalogue (str): Catalogue path.
+        tmp_path (Path): Temporary directory.
+        capsys (pytest.CaptureFixture): Captured output.
+        workers (Optional[int]): Number of worker processes.
+    """
+    baskets = tmp_path / "baskets.jsonl"
+    baskets.write_text('{"apple": 2, "orange": 1}\n{"kiwi": 1}\n\n[]\n{"apple": 3}\n')
+
+    args = [catalogue, str(baskets), "--offers", "test.test_cli:OFFERS", "--stats"]
+    args += [] if workers is None else ["--workers", str(workers), "--chunksize", "2"]
+
+    assert main(args) == 1
+
+    out, err = capsys.readouterr()
+    lines = [json.loads(line) for line in out.splitlines()]
+
+    assert lines[0] == {"line": 1, "sub_total": 4.0, "discount": 2.0, "total": 2.0}
+    assert lines[1]["error"] == "UnknownPrice"
+    assert lines[2]["line"] == 4 and lines[2]["error"] == "BasketTypeError"
+    assert lines[3] == {"line": 5, "sub_total": 3.0, "discount": 1.0, "total": 2.0}
+    assert "baskets: 4 errors: 2" in err
+
+
+def test_stdin(
+    catalogue: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Test that baskets are read from stdin by default.
+
+    Args:
+        catalogue (str): Catalogue path.
+        monkeypatch (pytest.MonkeyPatch): Patches stdin.
+        capsys (pytest.CaptureFixture): Captured output.
+    """
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"orange": 1}\n'))
+
+    assert main([catalogue]) == 0
+    assert json.loads(capsys.readouterr().out)["total"] == 2.0
+
+
+def test_read_ahead() -> None:
+    """
+    Test that worker processes don't read the whole stream of baskets ahead.
+    """
+    read = 0
+
+    def items() -> Iterator[Item]:
+        nonlocal read
+
+        for line in count(1):
+            read += 1
+            yield line, 0.0, Basket({"apple": 1})
+
+    priced = price_baskets(BatchPricer(Catalogue({"apple": 1.0})), items(), 2, 4)
+
+    assert next(priced) == (1, 0.0, (1.0, 1.0))
+    assert read <= 4 * 4
+    priced.close()
+
+
+def test_latency_histogram() -> None:
+    """
+    Test that histogram percentiles are within the bucket growth of the exact
+    nearest rank percentiles.
+    """
+    latencies = [(i * 7919 % 1000 + 1) / 1e5 for i in range(1000)]
+    histogram = LatencyHistogram()
+
+    for latency in latencies:
+        histogram.add(latency)
+
+    latencies.sort()
+
+    for q in [50, 95, 99]:
+        exact = latencies[int(len(latencies) * q / 100) - 1]
+        assert exact <= histogram.percentile(q) <= exact * histogram.growth
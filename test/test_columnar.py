@@ -0,0 +1,83 @@
+import pytest
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.columnar import ColumnarCatalogue
+from src.catalogue.exceptions import (CataloguePriceError, CatalogueTypeError,
+                                      UnknownPrice)
+from src.pricer.pricer import Pricer
+from typing import Any, List
+
+
+def test_create() -> None:
+    """
+    Test that ColumnarCatalogue instances can be initialized.
+    """
+    ColumnarCatalogue([], [])
+    ColumnarCatalogue(["a"], [1.0])
+    ColumnarCatalogue.from_catalogue(Catalogue({"a": 1.0}))
+    ColumnarCatalogue(iter(["a"]), iter([1.0]))
+
+
+@pytest.mark.parametrize(
+    "names, prices",
+    [
+        [["a"], ["1.0"]],
+        [["a"], [1]],
+        [["a"], [True]],
+        [[1], [1.0]],
+        [["a", "a"], [1.0, 1.0]],
+        [["a"], []],
+        [["a", "b"], [1.0]],
+    ],
+)
+def test_catalogue_type_error(names: List[Any], prices: List[Any]) -> None:
+    """
+    Test that initializing a ColumnarCatalogue with products that
+    have an invalid type raises a CatalogueTypeError.
+
+    Args:
+        names (List[Any]): Product names.
+        prices (List[Any]): Product prices.
+    """
+    with pytest.raises(CatalogueTypeError):
+        ColumnarCatalogue(names, prices)
+
+
+@pytest.mark.parametrize(
+    "prices",
+    [[1.0, 0.0], [-1.0, 1.0], [1.0, float("nan")], [float("inf"), 1.0]],
+)
+def test_catalogue_price_error(prices: List[float]) -> None:
+    """
+    Test that initializing a ColumnarCatalogue with products that
+    have an invalid price raises a CataloguePriceError.
+
+    Args:
+        prices (List[float]): Product prices.
+    """
+    with pytest.raises(CataloguePriceError):
+        ColumnarCatalogue(["a", "b"], prices)
+
+
+def test_lookups() -> None:
+    """
+    Tests that a columnar catalogue has the same lookups as a catalogue.
+    """
+    catalogue = ColumnarCatalogue(["a", "b"], [1.0, 2.0])
+
+    assert "a" in catalogue
+    assert "c" not in catalogue
+    assert catalogue.product_names == ["a", "b"]
+    assert catalogue.price("b") == 2.0
+    assert list(catalogue.price_ids([1, 0, 1])) == [2.0, 1.0, 2.0]
+
+    with pytest.raises(UnknownPrice):
+        catalogue.price("c")
+
+
+def test_pricer() -> None:
+    """
+    Tests that a pricer can price a basket with a columnar catalogue.
+    """
+    catalogue = ColumnarCatalogue(["a", "b"], [1.0, 2.0])
+    assert Pricer(Basket({"a": 2, "b": 1}), catalogue).total == 4.0
@@ -0,0 +1,124 @@
+import pytest
+from .fixtures import half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.declarative import (BundlePrice, BuyNForM, BuyOneGetOneFree,
+                                    DeclarativeOffer, MultiBuy, PercentageOff,
+                                    compile_offers)
+from src.pricer.exceptions import OfferParameterError
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from typing import Callable, Dict
+
+
+@pytest.mark.parametrize(
+    "offer",
+    [
+        BuyOneGetOneFree("apple"),
+        BuyNForM("apple", 3, 2),
+        PercentageOff("orange", 50.0),
+        MultiBuy("apple", 3, 2.0),
+        BundlePrice(["apple", "orange"], 2.5),
+    ],
+)
+@pytest.mark.parametrize(
+    "contents",
+    [{}, {"apple": 1}, {"apple": 5, "orange": 2}, {"apple": 2, "orange": 7}],
+)
+def test_closed_form(offer: DeclarativeOffer, contents: Dict[str, int]) -> None:
+    """
+    Test that evaluating a declarative offer in closed form
+    matches applying it to the list of price stubs.
+
+    Args:
+        offer (DeclarativeOffer): A declarative offer.
+        contents (Dict[str, int]): Basket contents.
+    """
+    basket = Basket(contents)
+    catalogue = Catalogue({"apple": 1.0, "orange": 2.0})
+    pricer = Pricer(basket, catalogue, [offer])
+    sub_total, total = compile_offers([offer]).evaluate(  # type: ignore
+        basket.contents, catalogue.price
+    )
+
+    assert sub_total == pytest.approx(sum(stub.price for stub in pricer.stubs_list))
+    assert total == pytest.approx(
+        sum(stub.price for stub in offer.transform(pricer.stubs_list))
+    )
+
+
+def test_compile_offers(half_price_oranges: Offer) -> None:
+    """
+    Test that only non overlapping declarative offers can be compiled.
+    """
+    bogof = BuyOneGetOneFree("apple")
+
+    assert compile_offers([bogof, PercentageOff("orange", 50.0)])
+    assert not compile_offers([bogof, PercentageOff("apple", 50.0)])
+    assert not compile_offers([bogof, half_price_oranges])
+    assert compile_offers([]) is None
+
+
+def test_no_offers() -> None:
+    """
+    Test that a basket without offers is totalled unit by unit.
+    """
+    pricer = Pricer(Basket({"a": 28}), Catalogue({"a": 8.45}))
+    assert pricer.total == sum([8.45] * 28)
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda: BuyNForM("apple", 0, 0),
+        lambda: BuyNForM("apple", 2, 3),
+        lambda: BuyNForM("apple", 2, 0),
+        lambda: PercentageOff("apple", 150),
+        lambda: PercentageOff("apple", -10),
+        lambda: MultiBuy("apple", 0, 1.0),
+        lambda: MultiBuy("apple", 2, -1.0),
+        lambda: BundlePrice([], 1.0),
+        lambda: BundlePrice(["apple", "apple"], 1.0),
+        lambda: BundlePrice(["apple", "orange"], -1.0),
+    ],
+)
+def test_parameter_error(create: Callable[[], DeclarativeOffer]) -> None:
+    """
+    Test that offers with out of range parameters raise OfferParameterError.
+
+    Args:
+        create (Callable[[], DeclarativeOffer]): Creates an invalid offer.
+    """
+    with pytest.raises(OfferParameterError):
+        create()
+
+
+def test_abstract() -> None:
+    """
+    Test that declarative offers must implement discount and apply.
+    """
+    with pytest.raises(TypeError):
+        DeclarativeOffer("Nothing", [])  # type: ignore  # pylint: disable=E0110
+
+
+def test_equality() -> None:
+    """
+    Test that declarative offers are equal when their parameters are equal.
+    """
+    assert BuyNForM("apple", 3, 2) == BuyNForM("apple", 3, 2)
+    assert BuyNForM("apple", 3, 2) != BuyNForM("apple", 3, 1)
+    assert BuyNForM("apple", 2, 1) != BuyOneGetOneFree("apple")
+
+
+def test_large_quantity() -> None:
+    """
+    Test that a compiled offer prices a million units without expanding them.
+    """
+    pricer = Pricer(
+        Basket({"apple": 1000000}),
+        Catalogue({"apple": 1.0}),
+        [BuyNForM("apple", 3, 2)],
+    )
+
+    assert pricer.total == 666667.0
+    assert "stubs_list" not in pricer._cache  # pylint: disable=W0212
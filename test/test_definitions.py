@@ -0,0 +1,140 @@
+import json
+import pytest
+import struct
+from pathlib import Path
+from src.pricer.declarative import (BundlePrice, BuyNForM, BuyOneGetOneFree,
+                                    MultiBuy, PercentageOff)
+from src.pricer.definitions import (format_offers, pack_offers, parse_offers,
+                                    read_offers, unpack_offers)
+from src.pricer.exceptions import OfferDefinitionError, OfferFormatError
+from src.pricer.offer import Offer
+from typing import Any
+
+OFFERS = [
+    BuyNForM("apple", 3, 2),
+    BuyOneGetOneFree("kiwi"),
+    PercentageOff("orange", 12.5),
+    MultiBuy("pear", 3, 250),
+    BundlePrice(["lime", "lemon"], 1.5),
+]
+
+TOML = """
+[[offers]]
+type = "buy_one_get_one_free"
+product = "kiwi"
+
+[[offers]]
+type = "bundle_price"
+products = ["lime", "lemon"]
+price = 1.5
+"""
+
+
+def test_round_trip() -> None:
+    """
+    Test that offers can be converted to definitions and packed losslessly.
+    """
+    assert parse_offers(format_offers(OFFERS)) == OFFERS
+    assert unpack_offers(pack_offers(OFFERS)) == OFFERS
+    assert isinstance(unpack_offers(pack_offers(OFFERS))[3].price, int)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        [],
+        {"offers": {}},
+        {"offers": [{"type": "unknown"}]},
+        {"offers": [{"type": "buy_one_get_one_free"}]},
+        {"offers": [{"type": "buy_one_get_one_free", "product": 1}]},
+        {"offers": [{"type": "buy_n_for_m", "product": "a", "n": 2, "m": True}]},
+        {"offers": [{"type": "bundle_price", "products": [1], "price": 1.0}]},
+        {"offers": [{"type": "percentage_off", "product": "a", "percent": 1, "x": 1}]},
+        {"offers": [{"type": "buy_n_for_m", "product": "a", "n": 0, "m": 0}]},
+        {"offers": [{"type": "percentage_off", "product": "a", "percent": 150}]},
+        {"offers": [{"type": "multi_buy", "product": "a", "quantity": 0, "price": 1}]},
+        {"offers": [{"type": "multi_buy", "product": "a", "quantity": 2, "price": -1}]},
+        {"offers": [{"type": "bundle_price", "products": [], "price": 1.0}]},
+        {
+            "offers": [
+                {"type": "multi_buy", "product": "a", "quantity": 2, "price": 1e999}
+            ]
+        },
+    ],
+)
+def test_offer_definition_error(document: Any) -> None:
+    """
+    Test that invalid definitions raise an OfferDefinitionError.
+
+    Args:
+        document (Any): Invalid offer definitions.
+    """
+    with pytest.raises(OfferDefinitionError):
+        parse_offers(document)
+
+
+def test_format_error() -> None:
+    """
+    Test that offers without a known type or corrupt packed offers are rejected.
+    """
+    with pytest.raises(OfferDefinitionError):
+        format_offers([Offer("Unknown", lambda stubs: stubs)])  # type: ignore
+
+    with pytest.raises(OfferFormatError):
+        unpack_offers(b"not packed offers")
+
+    with pytest.raises(OfferFormatError):
+        unpack_offers(pack_offers(OFFERS)[:-3])
+
+    with pytest.raises(OfferFormatError):
+        pack_offers([MultiBuy("pear", 2**63, 250)])
+
+    # The bundle's product count is moved past the end of the string table.
+    packed = bytearray(pack_offers([BundlePrice(["lime", "lemon"], 1.5)]))
+    struct.pack_into("<I", packed, len(packed) - 12, 3)
+
+    with pytest.raises(OfferFormatError):
+        unpack_offers(bytes(packed))
+
+
+def test_read_offers(tmp_path: Path) -> None:
+    """
+    Test that offers are read from json, toml and packed files.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+    """
+    (tmp_path / "offers.json").write_text(json.dumps(format_offers(OFFERS)))
+    (tmp_path / "offers.toml").write_text(TOML)
+    (tmp_path / "offers.bin").write_bytes(pack_offers(OFFERS))
+
+    assert read_offers(str(tmp_path / "offers.json")) == OFFERS
+    assert read_offers(str(tmp_path / "offers.toml")) == [OFFERS[1], OFFERS[4]]
+    assert read_offers(str(tmp_path / "offers.bin")) == OFFERS
+
+    with pytest.raises(ValueError):
+        read_offers(str(tmp_path / "offers.yaml"))
+
+
+def test_cache(tmp_path: Path) -> None:
+    """
+    Test that the cache is used until the definitions change.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+    """
+    path = tmp_path / "offers.json"
+    cache = str(tmp_path / "offers.bin")
+    path.write_text(json.dumps(format_offers(OFFERS)))
+
+    assert read_offers(str(path), cache) == OFFERS
+    assert unpack_offers((tmp_path / "offers.bin").read_bytes()) == OFFERS
+
+    # A cache compiled from the same definitions is used without parsing them.
+    (tmp_path / "offers.bin").write_bytes(
+        pack_offers(OFFERS[:1], (tmp_path / "offers.bin").read_bytes()[8:24])
+    )
+    assert read_offers(str(path), cache) == OFFERS[:1]
+
+    path.write_text(json.dumps(format_offers(OFFERS[1:])))
+    assert read_offers(str(path), cache) == OFFERS[1:]
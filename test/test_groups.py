@@ -0,0 +1,80 @@
+from .fixtures import (PricingCase, buy_one_apple_get_one_free,
+                       half_price_oranges)
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.groups import (GroupOffer, GroupPricer, PriceGroup, compress,
+                               expand)
+from src.pricer.offer import Offer
+from src.pricer.stubs import PriceStub
+
+
+def test_groups_list() -> None:
+    """
+    Test that the groups list has one price group per distinct product.
+    """
+    assert GroupPricer(
+        Basket({"a": 50000, "b": 1}), Catalogue({"a": 1.0, "b": 2.0})
+    ).groups_list == [PriceGroup("a", 1.0, 50000), PriceGroup("b", 2.0, 1)]
+
+
+def test_expand_compress() -> None:
+    """
+    Test that compressing expanded price groups recovers the price groups.
+    """
+    groups_list = [PriceGroup("a", 1.0, 2), PriceGroup("a", 0.0, 1)]
+
+    assert expand(groups_list) == [
+        PriceStub("a", 1.0),
+        PriceStub("a", 1.0),
+        PriceStub("a", 0.0),
+    ]
+
+    assert compress(expand(groups_list)) == groups_list
+
+
+def test_offers(
+    pricing_case: PricingCase,
+    buy_one_apple_get_one_free: Offer,
+    half_price_oranges: Offer,
+    half_price_oranges_groups: GroupOffer,
+) -> None:
+    """
+    Tests that group pricing matches stub pricing for both adapted price
+    stub offers and native price group offers.
+
+    Args:
+        pricing_case (PricingCase): A basket, its catalogue and the expected
+        sub_total, discount and total.
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+        half_price_oranges_groups (GroupOffer): Half price oranges group offer.
+    """
+    basket, catalogue, *expected = pricing_case
+
+    for offers in [
+        [buy_one_apple_get_one_free, half_price_oranges],
+        [buy_one_apple_get_one_free, half_price_oranges_groups],
+    ]:
+        pricer = GroupPricer(basket, catalogue, offers)  # type: ignore
+        assert [pricer.sub_total, pricer.discount, pricer.total] == expected
+
+
+def test_stub_pricing(
+    buy_one_apple_get_one_free: Offer, half_price_oranges_groups: GroupOffer
+) -> None:
+    """
+    Tests that price group offers can be indexed, staged and resolved.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges_groups (GroupOffer): Half price oranges group offer.
+    """
+    offers = [buy_one_apple_get_one_free, half_price_oranges_groups]
+    pricer = GroupPricer(
+        Basket({"orange": 2}), Catalogue({"apple": 1.0, "orange": 2.0}), offers
+    )
+
+    assert pricer.relevant_offers == [half_price_oranges_groups]
+    assert pricer.final_stubs_list == [PriceStub("orange", 1.0)] * 2
+    assert pricer.resolve().offers == [half_price_oranges_groups]
+    assert pricer.resolve().total == 2.0
@@ -0,0 +1,51 @@
+import pytest
+import src
+import subprocess
+import sys
+from typing import List
+
+
+def loaded_modules(statement: str) -> List[str]:
+    """
+    Run an import statement in a new interpreter and list the loaded modules.
+
+    Args:
+        statement (str): Import statement to run.
+
+    Returns:
+        List[str]: Names of the modules in sys.modules after the import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize("name", ["Basket", "Catalogue"])
+def test_lazy(name: str) -> None:
+    """
+    Test that importing the basket or catalogue doesn't load the pricer.
+
+    Args:
+        name (str): Exported name.
+    """
+    modules = loaded_modules(f"from src import {name}")
+
+    assert "src" in modules
+    assert not [module for module in modules if module.startswith("src.pricer")]
+
+
+def test_exports() -> None:
+    """
+    Test that every export can be accessed and listed.
+    """
+    for name in src.__all__:
+        assert getattr(src, name) is not None
+
+    assert set(src.__all__) <= set(dir(src))
+
+    with pytest.raises(AttributeError):
+        src.Missing  # type: ignore  # pylint: disable=W0104
@@ -0,0 +1,130 @@
+import pytest
+from .fixtures import (buy_one_apple_get_one_free, half_price_oranges,
+                       half_price_oranges_transform)
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import UnknownPrice
+from src.pricer.incremental import IncrementalPricer
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+
+
+def test_incremental(
+    buy_one_apple_get_one_free: Offer, half_price_oranges: Offer
+) -> None:
+    """
+    Test that incrementally repricing a basket as items are scanned
+    matches repricing the whole basket from scratch.
+    """
+    basket = Basket()
+    catalogue = Catalogue({"apple": 1.0, "orange": 2.0, "pear": 3.0})
+    offers = [buy_one_apple_get_one_free, half_price_oranges]
+    pricer = IncrementalPricer(basket, catalogue, offers)
+
+    for name in ["apple", "orange", "apple", "pear", "apple", "orange"]:
+        basket.add(name)
+        expected = Pricer(Basket(dict(basket.contents)), catalogue, offers)
+        assert pricer.sub_total == expected.sub_total
+        assert pricer.total == expected.total
+
+    basket.remove("apple")
+    assert pricer.total == 6.0
+
+    pricer.close()
+    assert not basket.listeners
+
+
+def test_fallback() -> None:
+    """
+    Test that offers which do not declare their products fall back to full repricing.
+    """
+    basket = Basket({"orange": 1})
+    pricer = IncrementalPricer(
+        basket,
+        Catalogue({"orange": 2.0}),
+        [Offer("Half price oranges", half_price_oranges_transform)],
+    )
+
+    basket.add("orange")
+    assert pricer.total == 2.0
+
+
+def test_product_not_in_catalogue(half_price_oranges: Offer) -> None:
+    """
+    Test that products declared by an offer but missing from the basket
+    don't need to be in the catalogue.
+    """
+    offer = Offer(
+        "Oranges and lemons",
+        half_price_oranges.transform,
+        frozenset({"orange", "lemon"}),
+    )
+    basket = Basket({"orange": 2})
+    catalogue = Catalogue({"orange": 2.0})
+
+    assert IncrementalPricer(basket, catalogue, [offer]).total == 2.0
+    assert Pricer(basket, catalogue, [offer]).total == 2.0
+
+
+def test_no_drift() -> None:
+    """
+    Test that repeatedly adding and removing products doesn't drift the totals.
+    """
+    basket = Basket({"b": 1})
+    catalogue = Catalogue({"a": 1.3, "b": 0.7})
+    offers = [
+        Offer("No discount on a", lambda stubs_list: stubs_list, frozenset({"a"})),
+        Offer("No discount on b", lambda stubs_list: stubs_list, frozenset({"b"})),
+    ]
+    pricer = IncrementalPricer(basket, catalogue, offers)
+    assert pricer.total == 0.7
+
+    for _ in range(2000):
+        basket.add("a")
+
+    for _ in range(1990):
+        basket.remove("a")
+
+    expected = IncrementalPricer(Basket(dict(basket.contents)), catalogue, offers)
+    assert pricer.sub_total == expected.sub_total
+    assert pricer.total == expected.total
+
+
+def test_raising_listener() -> None:
+    """
+    Test that a raising listener doesn't stop the pricer from seeing the change.
+    """
+
+    def listener(_: str) -> None:
+        raise RuntimeError
+
+    basket = Basket({"a": 1})
+    basket.subscribe(listener)
+    pricer = IncrementalPricer(basket, Catalogue({"a": 1.0}))
+    assert pricer.total == 1.0
+
+    with pytest.raises(RuntimeError):
+        basket.add("a")
+
+    assert pricer.total == 2.0
+
+
+def test_unknown_product() -> None:
+    """
+    Test that a product missing from the catalogue stays in the basket and
+    the totals raise until it is removed.
+    """
+    basket = Basket({"a": 1})
+    pricer = IncrementalPricer(basket, Catalogue({"a": 1.0}))
+    assert pricer.total == 1.0
+
+    with pytest.raises(UnknownPrice):
+        basket.add("b")
+
+    assert "b" in basket
+
+    with pytest.raises(UnknownPrice):
+        pricer.total  # pylint: disable=W0104
+
+    basket.remove("b")
+    assert pricer.total == 1.0
@@ -0,0 +1,50 @@
+from .fixtures import (buy_one_apple_get_one_free, half_price_oranges,
+                       half_price_oranges_transform)
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.index import OfferIndex
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+
+
+def test_relevant(buy_one_apple_get_one_free: Offer, half_price_oranges: Offer) -> None:
+    """
+    Test that only offers declaring a basket product or no products are relevant.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    undeclared = Offer("Half price oranges", half_price_oranges_transform)
+    index = OfferIndex([half_price_oranges, undeclared, buy_one_apple_get_one_free])
+
+    assert index.relevant([]) == [undeclared]
+    assert index.relevant(["apple"]) == [undeclared, buy_one_apple_get_one_free]
+    assert index.relevant(["apple", "orange"]) == index.offers
+
+
+def test_pricer(buy_one_apple_get_one_free: Offer, half_price_oranges: Offer) -> None:
+    """
+    Test that a pricer only applies the offers relevant to its basket.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    basket = Basket({"apple": 2})
+    pricer = Pricer(
+        basket,
+        Catalogue({"apple": 1.0, "orange": 2.0}),
+        [half_price_oranges, buy_one_apple_get_one_free],
+    )
+
+    assert pricer.relevant_offers == [buy_one_apple_get_one_free]
+    assert len(pricer.stages) == 1
+    assert pricer.total == 1.0
+
+    index = pricer.index
+    basket.add("orange")
+
+    assert pricer.index is index
+    assert pricer.relevant_offers == pricer.offers
+    assert pricer.total == 2.0
@@ -0,0 +1,98 @@
+import pytest
+from io import StringIO
+from pathlib import Path
+from src.basket.exceptions import BasketQuantityError, BasketTypeError
+from src.basket.loaders import load_basket, read_basket_csv, read_basket_jsonl
+from src.catalogue.exceptions import (CatalogueDuplicateError,
+                                      CataloguePriceError, CatalogueTypeError)
+from src.catalogue.loaders import (load_catalogue, read_catalogue_csv,
+                                   read_catalogue_jsonl)
+from typing import Type
+
+
+def test_read_catalogue() -> None:
+    """
+    Tests that catalogues can be read from csv and json lines streams.
+    """
+    csv = "name,price\napple,1.0\n\norange,2\n"
+    jsonl = '{"name": "apple", "price": 1.0}\n\n{"name": "orange", "price": 2}\n'
+
+    for catalogue in [
+        read_catalogue_csv(StringIO(csv)),
+        read_catalogue_jsonl(StringIO(jsonl)),
+    ]:
+        assert catalogue.products == {"apple": 1.0, "orange": 2.0}
+
+
+def test_read_basket() -> None:
+    """
+    Tests that baskets can be read from csv and json lines streams.
+    """
+    csv = "name,quantity\napple,1\norange,2\napple,2\n"
+    jsonl = '{"name": "apple", "quantity": 3}\n{"name": "orange", "quantity": 2}\n'
+
+    for basket in [read_basket_csv(StringIO(csv)), read_basket_jsonl(StringIO(jsonl))]:
+        assert basket.contents == {"apple": 3, "orange": 2}
+
+
+@pytest.mark.parametrize(
+    "csv, error",
+    [
+        ["apple,1.0\norange,a\n", CatalogueTypeError],
+        ["apple,1.0\norange\n", CatalogueTypeError],
+        ["apple,1.0\norange,0.0\n", CataloguePriceError],
+        ["apple,1.0\norange,nan\n", CataloguePriceError],
+        ["apple,1.0\norange,inf\n", CataloguePriceError],
+        ["apple,1.0\napple,2.0\n", CatalogueDuplicateError],
+    ],
+)
+def test_catalogue_errors(csv: str, error: Type[Exception]) -> None:
+    """
+    Tests that invalid catalogue rows raise errors with their line numbers.
+
+    Args:
+        csv (str): Csv catalogue.
+        error (Type[Exception]): Expected error.
+    """
+    with pytest.raises(error, match="Line: 2"):
+        read_catalogue_csv(StringIO(csv))
+
+
+@pytest.mark.parametrize(
+    "line, error",
+    [
+        ['{"name": "b"}', BasketTypeError],
+        ["[]", BasketTypeError],
+        ["not json", BasketTypeError],
+        ['{"name": 1, "quantity": 1}', BasketTypeError],
+        ['{"name": "b", "quantity": 1.0}', BasketTypeError],
+        ['{"name": "b", "quantity": 0}', BasketQuantityError],
+    ],
+)
+def test_basket_errors(line: str, error: Type[Exception]) -> None:
+    """
+    Tests that invalid basket rows raise errors with their line numbers.
+
+    Args:
+        line (str): Invalid json line.
+        error (Type[Exception]): Expected error.
+    """
+    with pytest.raises(error, match="Line: 2"):
+        read_basket_jsonl(StringIO(f'{{"name": "a", "quantity": 1}}\n{line}\n'))
+
+
+def test_load(tmp_path: Path) -> None:
+    """
+    Tests that catalogues and baskets can be loaded from files.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+    """
+    (tmp_path / "catalogue.csv").write_text("apple,1.0\n")
+    (tmp_path / "basket.jsonl").write_text('{"name": "apple", "quantity": 1}\n')
+
+    assert load_catalogue(str(tmp_path / "catalogue.csv")).products == {"apple": 1.0}
+    assert load_basket(str(tmp_path / "basket.jsonl")).contents == {"apple": 1}
+
+    with pytest.raises(ValueError):
+        load_basket(str(tmp_path / "basket.txt"))
@@ -0,0 +1,99 @@
+import pytest
+from decimal import Decimal
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import CataloguePriceError, CatalogueTypeError
+from src.catalogue.minor import MinorCatalogue, from_minor, to_minor
+from src.pricer.declarative import (BundlePrice, BuyOneGetOneFree, MultiBuy,
+                                    PercentageOff)
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from typing import Any, List
+
+
+def test_create() -> None:
+    """
+    Test that MinorCatalogue instances can be initialized.
+    """
+    MinorCatalogue()
+    MinorCatalogue({"a": 100})
+    assert MinorCatalogue.from_catalogue(Catalogue({"a": 1.005})).products == {
+        "a": 100
+    }
+
+
+@pytest.mark.parametrize("products", [{"a": 1.0}, {"a": True}, {1: 100}, ["a"]])
+def test_catalogue_type_error(products: Any) -> None:
+    """
+    Test that initializing a MinorCatalogue with prices that
+    are not integers raises a CatalogueTypeError.
+
+    Args:
+        products (Any): Products that have an invalid type.
+    """
+    with pytest.raises(CatalogueTypeError):
+        MinorCatalogue(products)
+
+
+def test_catalogue_price_error() -> None:
+    """
+    Test that initializing a MinorCatalogue with a price that
+    is not positive raises a CataloguePriceError.
+    """
+    with pytest.raises(CataloguePriceError):
+        MinorCatalogue({"a": 0})
+
+
+def test_set_price() -> None:
+    """
+    Test that prices can only be set to integer minor units.
+    """
+    catalogue = MinorCatalogue({"a": 100})
+    catalogue.set_price("a", 120)
+
+    assert catalogue.price("a") == 120
+    assert catalogue.version == 1
+
+    with pytest.raises(CatalogueTypeError):
+        catalogue.set_price("a", 1.2)  # type: ignore
+
+
+def test_conversion() -> None:
+    """
+    Test that prices round trip through minor units.
+    """
+    assert to_minor(0.1 + 0.2) == 30
+    assert to_minor(1.5, 0) == 2
+    assert from_minor(to_minor(19.99)) == Decimal("19.99")
+
+
+@pytest.mark.parametrize(
+    "offers, total",
+    [
+        [[BuyOneGetOneFree("a")], 3 * 33 + 2 * 55],
+        [[PercentageOff("a", 15)], 5 * 28 + 2 * 55],
+        [[MultiBuy("a", 3, 100)], 100 + 2 * 33 + 2 * 55],
+        [[BundlePrice(["a", "b"], 50)], 2 * 50 + 3 * 33],
+    ],
+)
+def test_offers(offers: List[Offer], total: int) -> None:
+    """
+    Test that declarative offers keep integer prices exact.
+
+    Args:
+        offers (List[Offer]): Offers to apply.
+        total (int): Expected total in minor units.
+    """
+    pricer = Pricer(
+        Basket({"a": 5, "b": 2}), MinorCatalogue({"a": 33, "b": 55}), offers
+    )
+    staged = Pricer(
+        Basket({"a": 5, "b": 2}),
+        MinorCatalogue({"a": 33, "b": 55}),
+        [Offer("Unchanged", lambda stubs: stubs), *offers],
+    )
+
+    assert pricer.total == total
+    assert staged.total == total
+    assert isinstance(pricer.total, int)
+    assert all(isinstance(stub.price, int) for stub in staged.final_stubs_list)
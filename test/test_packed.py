@@ -0,0 +1,102 @@
+import pickle
+import pytest
+from pathlib import Path
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import CatalogueFormatError, UnknownPrice
+from src.catalogue.packed import (MappedCatalogue, PackedCatalogue,
+                                  pack_catalogue, write_catalogue)
+from src.pricer.pricer import Pricer
+
+catalogue = Catalogue({"orange": 2.0, "apple": 1.0, "pear": 3.0, "é": 4.0})
+
+
+def test_packed() -> None:
+    """
+    Tests that a packed catalogue has the same lookups as a catalogue.
+    """
+    packed = PackedCatalogue(pack_catalogue(catalogue))
+
+    assert len(packed) == 4
+    assert packed.version == 0
+    assert packed.product_names == ["apple", "orange", "pear", "é"]
+
+    for name in catalogue.product_names:
+        assert name in packed
+        assert packed.price(name) == catalogue.price(name)
+
+    assert "banana" not in packed
+
+    with pytest.raises(UnknownPrice):
+        packed.price("banana")
+
+
+def test_unknown_price_sample() -> None:
+    """
+    Tests that an unknown price error from a large packed catalogue only
+    lists a sample of the product names.
+    """
+    products = {f"product{i:03}": 1.0 for i in range(100)}
+    packed = PackedCatalogue(pack_catalogue(Catalogue(products)))
+
+    with pytest.raises(UnknownPrice) as error:
+        packed.price("banana")
+
+    assert "product000" in str(error.value)
+    assert "product099" not in str(error.value)
+    assert "Showing 20 of 100 products" in str(error.value)
+    assert pickle.loads(pickle.dumps(error.value)).args == error.value.args
+
+
+def test_empty() -> None:
+    """
+    Tests that an empty catalogue can be packed.
+    """
+    packed = PackedCatalogue(pack_catalogue(Catalogue()))
+    assert "a" not in packed
+    assert not packed.product_names
+
+
+def test_mapped(tmp_path: Path) -> None:
+    """
+    Tests that a pricer can price a basket with a memory mapped catalogue.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+    """
+    path = str(tmp_path / "catalogue.bin")
+    write_catalogue(catalogue, path)
+
+    with MappedCatalogue(path) as mapped:
+        basket = Basket({"apple": 2, "pear": 1})
+        assert Pricer(basket, mapped).total == 5.0
+
+
+@pytest.mark.parametrize("data", [b"", b"SHOPCAT", b"NOTACATALOGUE\x00\x00\x00"])
+def test_catalogue_format_error(tmp_path: Path, data: bytes) -> None:
+    """
+    Tests that opening a file that is not a packed catalogue raises CatalogueFormatError.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+        data (bytes): File contents.
+    """
+    path = tmp_path / "catalogue.bin"
+    path.write_bytes(data)
+
+    with pytest.raises(CatalogueFormatError):
+        MappedCatalogue(str(path))
+
+
+@pytest.mark.parametrize("size", [16, 24, 40, 64])
+def test_truncated(size: int) -> None:
+    """
+    Tests that a truncated packed catalogue raises CatalogueFormatError.
+
+    Args:
+        size (int): Number of bytes kept from the packed catalogue.
+    """
+    packed = pack_catalogue(Catalogue({"apple": 1.0, "pear": 3.0}))
+
+    with pytest.raises(CatalogueFormatError):
+        PackedCatalogue(packed[:size])
@@ -25,6 +25,14 @@ def test_unknown_price_error() -> None:
         Pricer(Basket({"a": 1}), Catalogue())
 
 
+def test_trusted() -> None:
+    """
+    Test that a trusted basket is not checked against the catalogue.
+    """
+    assert Pricer(Basket({"a": 1}), Catalogue({"a": 1.0}), trusted=True).total == 1.0
+    Pricer(Basket({"a": 1}), Catalogue(), trusted=True)
+
+
 def test_stubs_list() -> None:
     """
     Test that the stubs list is a list of price stubs.
@@ -100,3 +108,49 @@ def test_offers(
     assert pricer.sub_total == sub_total
     assert pricer.discount == discount
     assert pricer.total == total
+
+
+def test_cache(half_price_oranges: Offer) -> None:
+    """
+    Test that pricer results are cached until the basket, catalogue or offers change.
+    """
+    basket = Basket({"orange": 1})
+    catalogue = Catalogue({"orange": 2.0})
+    pricer = Pricer(basket, catalogue)
+
+    assert pricer.stubs_list is pricer.stubs_list
+    assert pricer.total == 2.0
+
+    basket.add("orange")
+    assert pricer.total == 4.0
+
+    catalogue.set_price("orange", 4.0)
+    assert pricer.total == 8.0
+
+    pricer.add_offer(half_price_oranges)
+    assert pricer.total == 4.0
+    assert pricer.stages == [[PriceStub("orange", 2.0), PriceStub("orange", 2.0)]]
+
+    pricer.remove_offer(half_price_oranges)
+    assert pricer.total == 8.0
+
+    basket.remove("orange")
+    assert pricer.sub_total == 4.0
+    assert pricer.discount == 0.0
+
+
+def test_stale() -> None:
+    """
+    Test that a pricer detects when the catalogue changed after pricing.
+    """
+    catalogue = Catalogue({"a": 1.0, "b": 2.0})
+    pricer = Pricer(Basket({"a": 1}), catalogue)
+
+    assert not pricer.stale
+    assert pricer.total == 1.0
+    assert not pricer.stale
+
+    catalogue.apply_updates({"a": 2.0, "b": None})
+    assert pricer.stale
+    assert pricer.total == 2.0
+    assert not pricer.stale
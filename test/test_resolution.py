@@ -0,0 +1,121 @@
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from itertools import combinations
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.declarative import BundlePrice, MultiBuy, PercentageOff
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.resolution import ConflictPolicy
+from typing import Dict
+
+catalogue = Catalogue({"sandwich": 2.5, "drink": 1.0, "apple": 1.0, "orange": 2.0})
+
+meal_deal = BundlePrice(["sandwich", "drink"], 3.0)
+two_drinks = MultiBuy("drink", 2, 1.2)
+drinks_off = PercentageOff("drink", 10.0)
+
+
+def test_exclusive() -> None:
+    """
+    Test that the best set of non overlapping offers is chosen.
+    """
+    offers = [meal_deal, two_drinks, drinks_off]
+    pricer = Pricer(Basket({"sandwich": 1, "drink": 2}), catalogue, offers)
+    resolution = pricer.resolve(ConflictPolicy.EXCLUSIVE)
+
+    assert resolution.offers == [two_drinks]
+    assert resolution.total == pytest.approx(3.7)
+    assert resolution.optimal
+
+
+def test_stackable() -> None:
+    """
+    Test that the best combination of stacked offers is never worse than applying all.
+    """
+    offers = [two_drinks, meal_deal]
+    pricer = Pricer(Basket({"sandwich": 1, "drink": 2}), catalogue, offers)
+    resolution = pricer.resolve(ConflictPolicy.STACKABLE)
+
+    assert resolution.total <= pricer.total
+    assert resolution.total == pytest.approx(
+        Pricer(pricer.basket, catalogue, resolution.offers).total
+    )
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [{"sandwich": 1, "drink": 2}, {"sandwich": 2, "drink": 5}, {"drink": 3}],
+)
+def test_stackable_exhaustive(contents: Dict[str, int]) -> None:
+    """
+    Test that stacked declarative offers, whose discounts never grow after
+    other offers, resolve to the best total of every combination.
+
+    Args:
+        contents (Dict[str, int]): Basket contents.
+    """
+    offers = [drinks_off, two_drinks, meal_deal, PercentageOff("sandwich", 20.0)]
+    basket = Basket(contents)
+    resolution = Pricer(basket, catalogue, offers).resolve(
+        ConflictPolicy.STACKABLE, None
+    )
+
+    best = min(
+        Pricer(basket, catalogue, list(chosen)).total
+        for size in range(len(offers) + 1)
+        for chosen in combinations(offers, size)
+    )
+
+    assert resolution.optimal
+    assert resolution.total == pytest.approx(best)
+
+
+def test_independent_components(
+    buy_one_apple_get_one_free: Offer, half_price_oranges: Offer
+) -> None:
+    """
+    Test that offers on unrelated products are all applied.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    offers = [buy_one_apple_get_one_free, half_price_oranges]
+    basket = Basket({"apple": 2, "orange": 2, "sandwich": 1})
+
+    for policy in ConflictPolicy:
+        resolution = Pricer(basket, catalogue, offers).resolve(policy)
+        assert resolution.offers == offers
+        assert resolution.total == 5.5
+
+
+def test_budget() -> None:
+    """
+    Test that an exhausted budget returns the incumbent and is not optimal.
+    """
+    offers = [meal_deal, two_drinks, drinks_off]
+    pricer = Pricer(Basket({"sandwich": 1, "drink": 2}), catalogue, offers)
+
+    for policy in ConflictPolicy:
+        resolution = pricer.resolve(policy, 0.0)
+        assert not resolution.optimal
+        assert resolution.total <= pricer.sub_total
+
+
+@pytest.mark.parametrize("policy", list(ConflictPolicy))
+def test_many_offers(policy: ConflictPolicy) -> None:
+    """
+    Test that components with thousands of offers are searched without recursing.
+
+    Args:
+        policy (ConflictPolicy): How overlapping offers can be combined.
+    """
+    offers = [PercentageOff("drink", 10.0 + i % 50) for i in range(2000)]
+    pricer = Pricer(Basket({"drink": 2}), catalogue, offers)  # type: ignore
+    resolution = pricer.resolve(policy, 1.0)
+
+    assert resolution.total <= 2.0
+    assert resolution.total == pytest.approx(
+        Pricer(pricer.basket, catalogue, resolution.offers).total
+    )
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import UnknownPrice
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.quote import Quote
+from src.pricer.service import PricingService, ServiceConfig
+from typing import List, Optional
+
+catalogue = Catalogue({"apple": 1.0, "orange": 2.0})
+
+
+@pytest.mark.parametrize("heavy_units, processes", [[10000, None], [0, None], [0, 2]])
+def test_price(
+    heavy_units: int,
+    processes: Optional[int],
+    buy_one_apple_get_one_free: Offer,
+    half_price_oranges: Offer,
+) -> None:
+    """
+    Test that concurrent pricing requests are batched and priced like a Pricer.
+
+    Args:
+        heavy_units (int): Number of items above which batches are offloaded.
+        processes (Optional[int]): Number of worker processes.
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    offers = [buy_one_apple_get_one_free, half_price_oranges]
+    baskets = [Basket({"apple": i % 4 + 1, "orange": i % 3 + 1}) for i in range(10)]
+
+    async def serve() -> List[Quote]:
+        config = ServiceConfig(4, 0.01, heavy_units, processes)
+
+        async with PricingService(catalogue, offers, config) as service:
+            quotes = await asyncio.gather(*[service.price(b) for b in baskets])
+            assert service.batches == 3
+            return quotes
+
+    for basket, quote in zip(baskets, asyncio.run(serve())):
+        pricer = Pricer(basket, catalogue, offers)
+        assert quote == Quote(pricer.sub_total, pricer.discount, pricer.total)
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_unknown_price_error(processes: Optional[int]) -> None:
+    """
+    Test that an unknown price only fails the request for that basket.
+
+    Args:
+        processes (Optional[int]): Number of worker processes.
+    """
+
+    async def serve() -> None:
+        config = ServiceConfig(heavy_units=0, processes=processes)
+        service = PricingService(catalogue, config=config)
+
+        async with service:
+            known, unknown = await asyncio.gather(
+                service.price(Basket({"apple": 1})),
+                service.price(Basket({"pear": 1})),
+                return_exceptions=True,
+            )
+
+            assert known == Quote(1.0, 0.0, 1.0)
+            assert isinstance(unknown, UnknownPrice)
+
+    asyncio.run(serve())
+
+
+def test_batch_error() -> None:
+    """
+    Test that a batch which can't be sent to a worker process fails its requests.
+    """
+    basket = Basket({"apple": 1})
+    basket.subscribe(lambda _: None)
+
+    async def serve() -> None:
+        config = ServiceConfig(heavy_units=0, processes=1)
+
+        async with PricingService(catalogue, config=config) as service:
+            with pytest.raises(Exception) as error:
+                await asyncio.wait_for(service.price(basket), 10)
+
+            assert not isinstance(error.value, asyncio.TimeoutError)
+
+            assert not service._tasks  # pylint: disable=W0212
+
+    asyncio.run(serve())
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_close_pending(processes: Optional[int]) -> None:
+    """
+    Test that requests waiting for their batch to fill are priced on close.
+
+    Args:
+        processes (Optional[int]): Number of worker processes.
+    """
+
+    async def serve() -> Quote:
+        config = ServiceConfig(max_delay=60.0, heavy_units=0, processes=processes)
+
+        async with PricingService(catalogue, config=config) as service:
+            request = asyncio.ensure_future(service.price(Basket({"apple": 2})))
+            await asyncio.sleep(0)
+
+        assert request.done()
+        return request.result()
+
+    assert asyncio.run(asyncio.wait_for(serve(), 10)) == Quote(2.0, 0.0, 2.0)
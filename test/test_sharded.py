@@ -0,0 +1,67 @@
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.declarative import BundlePrice, BuyOneGetOneFree, PercentageOff
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.sharded import ShardedPricer
+from src.pricer.stubs import PriceStub
+from typing import List
+
+
+def tenth_off(stubs_list: List[PriceStub]) -> List[PriceStub]:
+    return [PriceStub(stub.name, stub.price * 0.9) for stub in stubs_list]
+
+
+def test_partition(
+    buy_one_apple_get_one_free: Offer, half_price_oranges: Offer
+) -> None:
+    """
+    Test that single product offers only run in the shards when no earlier
+    offer spans their product.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    bundle = BundlePrice(["apple", "pear"], 1.0)
+    percentage = PercentageOff("apple", 10)
+    everything = Offer("Tenth off", tenth_off)
+    offers = [half_price_oranges, bundle, percentage, everything]
+    offers += [buy_one_apple_get_one_free, BuyOneGetOneFree("kiwi")]
+
+    pricer = ShardedPricer(
+        Basket({"apple": 1, "orange": 1, "pear": 1, "kiwi": 1}),
+        Catalogue({"apple": 1.0, "orange": 1.0, "pear": 1.0, "kiwi": 1.0}),
+        offers,
+    )
+
+    assert pricer.partition == (
+        [half_price_oranges],
+        [bundle, percentage, everything, buy_one_apple_get_one_free, offers[-1]],
+    )
+
+
+@pytest.mark.parametrize("shards", [1, 3, 7])
+def test_identical(shards: int) -> None:
+    """
+    Test that sharded pricing is bit-identical to serial pricing.
+
+    Args:
+        shards (int): Number of shards.
+    """
+    names = [f"product-{i}" for i in range(50)]
+    catalogue = Catalogue({name: 0.1 + i * 0.37 for i, name in enumerate(names)})
+    basket = Basket({name: 1 + i % 4 for i, name in enumerate(names)})
+    offers: List[Offer] = [PercentageOff(name, 15) for name in names[::2]]
+    offers += [BuyOneGetOneFree(name) for name in names[1::3]]
+    offers += [BundlePrice(names[:2], 0.3), PercentageOff(names[1], 5)]
+    offers += [Offer("Tenth off", tenth_off), PercentageOff(names[3], 20)]
+
+    serial = Pricer(basket, catalogue, offers)
+    sharded = ShardedPricer(basket, catalogue, offers, processes=2, shards=shards)
+
+    assert sharded.final_stubs_list == serial.final_stubs_list
+    assert sharded.total == serial.total
+    assert sharded.sub_total == serial.sub_total
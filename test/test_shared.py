@@ -0,0 +1,90 @@
+import pytest
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from src.basket.basket import Basket
+from src.catalogue import shared
+from src.catalogue.catalogue import Catalogue
+from src.catalogue.exceptions import UnknownPrice
+from src.catalogue.shared import SharedCatalogue
+from src.pricer.pricer import Pricer
+
+
+def price(name: str) -> float:
+    with SharedCatalogue(name) as catalogue:
+        return catalogue.price("apple")
+
+
+def test_create() -> None:
+    """
+    Test that a shared catalogue has the same lookups as a catalogue.
+    """
+    with SharedCatalogue.create(Catalogue({"apple": 1.0, "orange": 2.0})) as shared:
+        assert shared.owner
+        assert shared.version == 1
+        assert len(shared) == 2
+        assert "apple" in shared
+        assert shared.product_names == ["apple", "orange"]
+        assert shared.price("orange") == 2.0
+
+        with pytest.raises(UnknownPrice):
+            shared.price("banana")
+
+
+def test_attach() -> None:
+    """
+    Test that readers see every version the writer publishes.
+    """
+    with SharedCatalogue.create(Catalogue({"apple": 1.0})) as writer:
+        with SharedCatalogue(writer.name) as reader:
+            pricer = Pricer(Basket({"apple": 2}), reader)
+            assert pricer.total == 2.0
+
+            writer.publish(Catalogue({"apple": 3.0}))
+            assert reader.version == 2
+            assert pricer.total == 6.0
+
+            with pytest.raises(PermissionError):
+                reader.publish(Catalogue())
+
+            with pytest.raises(PermissionError):
+                reader.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        SharedCatalogue(writer.name)
+
+
+def test_swapped_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that readers retry when a version is unlinked before they attach.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Patches attaching to shared memory.
+    """
+    attach = shared._open
+    missing = [True]
+
+    def swapped(name: str, size: int = 0) -> SharedMemory:
+        if missing:
+            missing.pop()
+            raise FileNotFoundError(name)
+
+        return attach(name, size)
+
+    with SharedCatalogue.create(Catalogue({"apple": 1.0})) as writer:
+        with SharedCatalogue(writer.name) as reader:
+            writer.publish(Catalogue({"apple": 3.0}))
+            monkeypatch.setattr(shared, "_open", swapped)
+
+            assert reader.price("apple") == 3.0
+            assert not missing
+
+
+def test_processes() -> None:
+    """
+    Test that worker processes share the published catalogue.
+    """
+    with SharedCatalogue.create(Catalogue({"apple": 1.5})) as writer:
+        with Pool(2) as pool:
+            assert pool.map(price, [writer.name] * 4) == [1.5] * 4
+            writer.publish(Catalogue({"apple": 2.5}))
+            assert pool.map(price, [writer.name] * 4) == [2.5] * 4
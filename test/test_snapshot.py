@@ -0,0 +1,44 @@
+import pytest
+from dataclasses import FrozenInstanceError
+from src.basket.basket import Basket
+from src.basket.snapshot import BasketSnapshot
+
+
+def test_equality() -> None:
+    """
+    Test that baskets with the same contents have equal snapshots.
+    """
+    first = BasketSnapshot(Basket({"a": 1, "b": 2}))
+    second = BasketSnapshot(Basket({"b": 2, "a": 1}))
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != BasketSnapshot(Basket({"a": 2, "b": 2}))
+    assert len({first, second}) == 1
+
+
+def test_immutable() -> None:
+    """
+    Test that a snapshot is not affected by later changes to its basket.
+    """
+    basket = Basket({"a": 1})
+    snapshot = BasketSnapshot(basket)
+    basket.add("b")
+
+    assert list(snapshot) == ["a"]
+    assert "b" not in snapshot
+    assert snapshot.count == 1
+
+    with pytest.raises(FrozenInstanceError):
+        snapshot.contents = ()  # type: ignore
+
+
+def test_basket() -> None:
+    """
+    Test that a snapshot can be turned back into a basket.
+    """
+    basket = BasketSnapshot(Basket({"a": 1, "b": 2})).basket()
+
+    assert basket == Basket({"a": 1, "b": 2})
+    basket.add("a")
+    assert basket.quantity("a") == 2
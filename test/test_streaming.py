@@ -0,0 +1,60 @@
+from .fixtures import PricingCase, buy_one_apple_get_one_free
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.offer import Offer
+from src.pricer.streaming import StreamingOffer, StreamingPricer
+from src.pricer.stubs import PriceStub
+
+
+def test_stubs_stream() -> None:
+    """
+    Test that the stubs stream yields the same stubs as the stubs list.
+    """
+    pricer = StreamingPricer(Basket({"a": 2, "b": 1}), Catalogue({"a": 1.0, "b": 2.0}))
+    assert list(pricer.stubs_stream()) == pricer.stubs_list
+
+
+def test_offers(
+    pricing_case: PricingCase,
+    buy_one_apple_get_one_free: Offer,
+    buy_one_apple_get_one_free_stream: StreamingOffer,
+    half_price_oranges_stream: StreamingOffer,
+) -> None:
+    """
+    Tests that streaming pricing matches stub pricing for both streaming
+    offers and price stub offers.
+
+    Args:
+        pricing_case (PricingCase): A basket, its catalogue and the expected
+        sub_total, discount and total.
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        buy_one_apple_get_one_free_stream (StreamingOffer): Buy one apple get
+        one free streaming offer.
+        half_price_oranges_stream (StreamingOffer): Half price oranges
+        streaming offer.
+    """
+    basket, catalogue, *expected = pricing_case
+
+    for offers in [
+        [buy_one_apple_get_one_free_stream, half_price_oranges_stream],
+        [buy_one_apple_get_one_free, half_price_oranges_stream],
+    ]:
+        pricer = StreamingPricer(basket, catalogue, offers)  # type: ignore
+        assert [pricer.sub_total, pricer.discount, pricer.total] == expected
+
+
+def test_stages(buy_one_apple_get_one_free_stream: StreamingOffer) -> None:
+    """
+    Tests that streaming offers can be staged as price stub offers.
+
+    Args:
+        buy_one_apple_get_one_free_stream (StreamingOffer): Buy one apple get
+        one free streaming offer.
+    """
+    pricer = StreamingPricer(
+        Basket({"apple": 2}),
+        Catalogue({"apple": 1.0}),
+        [buy_one_apple_get_one_free_stream],
+    )
+
+    assert pricer.stages == [[PriceStub("apple", 1.0), PriceStub("apple", 0.0)]]
@@ -0,0 +1,52 @@
+import pytest
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.stubs import PriceStub, PriceStubArray
+
+
+def test_slots() -> None:
+    """
+    Test that price stubs do not have a per instance dictionary.
+    """
+    with pytest.raises(AttributeError):
+        PriceStub("a", 1.0).__dict__  # pylint: disable=W0104
+
+
+def test_price_stub_array() -> None:
+    """
+    Test that a price stub array iterates and indexes as price stubs.
+    """
+    stubs_list = [PriceStub("a", 1.0), PriceStub("b", 2.0), PriceStub("a", 0.5)]
+    stubs_array = PriceStubArray(stubs_list)
+
+    assert len(stubs_array) == 3
+    assert stubs_array.names == ["a", "b"]
+    assert list(stubs_array.name_ids) == [0, 1, 0]
+    assert list(stubs_array) == stubs_list
+    assert stubs_array[2] == PriceStub("a", 0.5)
+    assert stubs_array[1:] == stubs_list[1:]
+    assert stubs_array == stubs_list
+    assert stubs_array != stubs_list[1:]
+
+
+def test_offers(buy_one_apple_get_one_free: Offer, half_price_oranges: Offer) -> None:
+    """
+    Test that existing offers can transform a price stub array.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    pricer = Pricer(
+        Basket({"apple": 3, "orange": 2}), Catalogue({"apple": 1.0, "orange": 2.0})
+    )
+
+    assert pricer.stubs_array == pricer.stubs_list
+
+    for offer in [buy_one_apple_get_one_free, half_price_oranges]:
+        assert offer.transform(pricer.stubs_array) == offer.transform(  # type: ignore
+            pricer.stubs_list
+        )
@@ -0,0 +1,110 @@
+import tracemalloc
+from .fixtures import buy_one_apple_get_one_free, half_price_oranges
+from src.basket.basket import Basket
+from src.catalogue.catalogue import Catalogue
+from src.pricer.declarative import BuyOneGetOneFree
+from src.pricer.offer import Offer
+from src.pricer.pricer import Pricer
+from src.pricer.trace import MetricsCollector, OfferTrace, PricingTrace
+from typing import List
+
+
+def test_instrument(
+    buy_one_apple_get_one_free: Offer, half_price_oranges: Offer
+) -> None:
+    """
+    Test that an instrumented pricer records a trace of each offer.
+
+    Args:
+        buy_one_apple_get_one_free (Offer): Buy one apple get one free offer.
+        half_price_oranges (Offer): Half price oranges offer.
+    """
+    pricer = Pricer(
+        Basket({"apple": 2, "orange": 2}),
+        Catalogue({"apple": 1.0, "orange": 2.0}),
+        [buy_one_apple_get_one_free, half_price_oranges],
+    )
+
+    assert pricer.total == 3.0
+    assert pricer.trace is None
+
+    traces: List[OfferTrace] = []
+    pricer.instrument(metrics=traces.append)
+    tracemalloc.start()
+
+    try:
+        assert pricer.total == 3.0
+    finally:
+        tracemalloc.stop()
+
+    assert pricer.trace is not None
+    assert pricer.trace.offers == traces
+    assert pricer.trace.by_title == {
+        "Buy one apple get one free": [traces[0]],
+        "Half price oranges": [traces[1]],
+    }
+
+    for trace in traces:
+        assert trace.stubs_in == trace.stubs_out == 4
+        assert trace.allocated > 0
+
+    assert pricer.trace.seconds == sum(trace.seconds for trace in traces)
+
+    pricer.instrument(False)
+    pricer.trace = None
+    assert pricer.total == 3.0
+    assert pricer.trace is None
+
+
+def test_instrument_compiled() -> None:
+    """
+    Test that offers which would be compiled are traced one by one while
+    the pricer is instrumented.
+    """
+    offers = [BuyOneGetOneFree("apple"), BuyOneGetOneFree("orange")]
+    pricer = Pricer(
+        Basket({"apple": 2, "orange": 2}),
+        Catalogue({"apple": 1.0, "orange": 2.0}),
+        offers,
+    )
+
+    assert pricer.compiled is not None
+    assert pricer.total == 3.0
+
+    pricer.instrument()
+
+    assert pricer.compiled is None
+    assert pricer.total == 3.0
+    assert pricer.trace is not None
+    assert [trace.title for trace in pricer.trace.offers] == [
+        offer.title for offer in offers
+    ]
+
+
+def test_by_title() -> None:
+    """
+    Test that traces of offers sharing a title are all kept.
+    """
+    first = OfferTrace("a", 0.1, 2, 2, 0)
+    second = OfferTrace("a", 0.2, 2, 2, 0)
+    third = OfferTrace("b", 0.3, 2, 2, 0)
+
+    assert PricingTrace([first, second, third]).by_title == {
+        "a": [first, second],
+        "b": [third],
+    }
+
+
+def test_metrics_collector() -> None:
+    """
+    Test that the metrics collector aggregates counters and cumulative histograms.
+    """
+    collector = MetricsCollector([0.1, 1.0])
+    collector(OfferTrace("a", 0.05, 2, 2, 0))
+    collector(OfferTrace("a", 0.5, 2, 3, 0))
+    collector(OfferTrace("a", 5.0, 2, 3, 0))
+
+    assert collector.calls == {"a": 3}
+    assert collector.seconds == {"a": 5.55}
+    assert collector.stubs == {"a": 8}
+    assert collector.histograms == {"a": [1, 2, 3]}